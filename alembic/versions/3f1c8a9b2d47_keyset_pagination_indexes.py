@@ -0,0 +1,30 @@
+"""keyset pagination indexes
+
+Revision ID: 3f1c8a9b2d47
+Revises: d56952769e7a
+Create Date: 2026-10-18 09:12:41.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c8a9b2d47'
+down_revision: Union[str, Sequence[str], None] = 'd56952769e7a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_projects_created_at_id', 'projects', ['created_at', 'id'], unique=False)
+    op.create_index('ix_tasks_created_at_id', 'tasks', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_created_at_id', table_name='tasks')
+    op.drop_index('ix_projects_created_at_id', table_name='projects')
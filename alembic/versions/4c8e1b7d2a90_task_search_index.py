@@ -0,0 +1,41 @@
+"""task keyword search index
+
+Revision ID: 4c8e1b7d2a90
+Revises: 9a6c2e4f7b15
+Create Date: 2026-10-18 19:12:44.508213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c8e1b7d2a90'
+down_revision: Union[str, Sequence[str], None] = '9a6c2e4f7b15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Full-text search is PostgreSQL only; other databases fall back to LIKE
+SEARCH_DOCUMENT = "to_tsvector('simple', title || ' ' || coalesce(description, ''))"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.create_index(
+        'ix_tasks_search',
+        'tasks',
+        [sa.text(SEARCH_DOCUMENT)],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_tasks_search', table_name='tasks')
@@ -0,0 +1,48 @@
+"""denormalized task and project counts
+
+Revision ID: 5d3b7a1f9c64
+Revises: e2a94b7c0d18
+Create Date: 2026-10-18 14:05:11.402317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d3b7a1f9c64'
+down_revision: Union[str, Sequence[str], None] = 'e2a94b7c0d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'projects',
+        sa.Column('task_count', sa.Integer(), server_default='0', nullable=False),
+    )
+    op.execute(
+        "UPDATE projects SET task_count = "
+        "(SELECT count(*) FROM tasks WHERE tasks.project_id = projects.id)"
+    )
+
+    op.create_table(
+        'entity_counters',
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('value', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('name'),
+    )
+    op.execute(
+        "INSERT INTO entity_counters (name, value) "
+        "SELECT 'projects', count(*) FROM projects"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('entity_counters')
+    with op.batch_alter_table('projects') as batch_op:
+        batch_op.drop_column('task_count')
@@ -0,0 +1,36 @@
+"""change event sequence
+
+Revision ID: 6f2d9c4a8e13
+Revises: 4c8e1b7d2a90
+Create Date: 2026-10-18 21:40:17.334120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6f2d9c4a8e13'
+down_revision: Union[str, Sequence[str], None] = '4c8e1b7d2a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Numbers change events sent with NOTIFY; other databases keep events in
+# process and number them there
+CHANGE_EVENT_SEQ = sa.Sequence('change_event_seq')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(sa.schema.CreateSequence(CHANGE_EVENT_SEQ))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(sa.schema.DropSequence(CHANGE_EVENT_SEQ))
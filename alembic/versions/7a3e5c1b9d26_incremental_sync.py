@@ -0,0 +1,72 @@
+"""incremental sync
+
+Revision ID: 7a3e5c1b9d26
+Revises: 6f2d9c4a8e13
+Create Date: 2026-10-18 23:12:48.905611
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a3e5c1b9d26'
+down_revision: Union[str, Sequence[str], None] = '6f2d9c4a8e13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows are all part of the first sync (change_seq 0)
+    for table in ('projects', 'tasks'):
+        op.add_column(
+            table,
+            sa.Column('change_seq', sa.BigInteger(), server_default='0', nullable=False),
+        )
+        op.create_index(
+            f'ix_{table}_change_seq_id', table, ['change_seq', 'id'], unique=False
+        )
+
+    op.create_table(
+        'tombstones',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('entity', sa.String(length=16), nullable=False),
+        sa.Column('entity_id', sa.String(length=36), nullable=False),
+        sa.Column('project_id', sa.String(length=36), nullable=True),
+        sa.Column('deleted_at', sa.DateTime(), nullable=True),
+        sa.Column('change_seq', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_tombstones_change_seq_entity_id',
+        'tombstones',
+        ['change_seq', 'entity_id'],
+        unique=False,
+    )
+
+    # The change sequence counter outgrows a 32-bit value
+    with op.batch_alter_table('entity_counters') as batch_op:
+        batch_op.alter_column(
+            'value', existing_type=sa.Integer(), type_=sa.BigInteger()
+        )
+    op.execute("INSERT INTO entity_counters (name, value) VALUES ('changes', 0)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM entity_counters WHERE name = 'changes'")
+    with op.batch_alter_table('entity_counters') as batch_op:
+        batch_op.alter_column(
+            'value', existing_type=sa.BigInteger(), type_=sa.Integer()
+        )
+
+    op.drop_index('ix_tombstones_change_seq_entity_id', table_name='tombstones')
+    op.drop_table('tombstones')
+
+    for table in ('tasks', 'projects'):
+        op.drop_index(f'ix_{table}_change_seq_id', table_name=table)
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('change_seq')
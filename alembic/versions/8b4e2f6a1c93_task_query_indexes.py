@@ -0,0 +1,51 @@
+"""task query indexes
+
+Revision ID: 8b4e2f6a1c93
+Revises: 3f1c8a9b2d47
+Create Date: 2026-10-18 10:03:17.204561
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b4e2f6a1c93'
+down_revision: Union[str, Sequence[str], None] = '3f1c8a9b2d47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Primary keys are already indexed by their constraint
+    op.drop_index('ix_tasks_id', table_name='tasks')
+    op.drop_index('ix_projects_id', table_name='projects')
+
+    op.create_index(
+        'ix_tasks_project_id_created_at_id',
+        'tasks',
+        ['project_id', 'created_at', 'id'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_tasks_open_deadline',
+        'tasks',
+        ['deadline'],
+        unique=False,
+        postgresql_where=sa.text("status <> 'done'"),
+        sqlite_where=sa.text("status <> 'done'"),
+    )
+    op.create_index('ix_projects_name', 'projects', ['name'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_projects_name', table_name='projects')
+    op.drop_index('ix_tasks_open_deadline', table_name='tasks')
+    op.drop_index('ix_tasks_project_id_created_at_id', table_name='tasks')
+
+    op.create_index(op.f('ix_projects_id'), 'projects', ['id'], unique=False)
+    op.create_index(op.f('ix_tasks_id'), 'tasks', ['id'], unique=False)
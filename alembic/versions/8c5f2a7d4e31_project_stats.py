@@ -0,0 +1,58 @@
+"""project stats
+
+Revision ID: 8c5f2a7d4e31
+Revises: 7a3e5c1b9d26
+Create Date: 2026-10-19 10:26:54.118203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c5f2a7d4e31'
+down_revision: Union[str, Sequence[str], None] = '7a3e5c1b9d26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_tasks_project_id_open_deadline',
+        'tasks',
+        ['project_id', 'deadline'],
+        unique=False,
+        postgresql_where=sa.text("status <> 'done'"),
+        sqlite_where=sa.text("status <> 'done'"),
+    )
+
+    op.create_table(
+        'project_stats',
+        sa.Column('project_id', sa.String(length=36), nullable=False),
+        sa.Column('todo', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('in_progress', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('done', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('earliest_deadline', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('project_id'),
+    )
+    op.execute(
+        "INSERT INTO project_stats "
+        "(project_id, todo, in_progress, done, earliest_deadline) "
+        "SELECT projects.id, "
+        "count(CASE WHEN tasks.status = 'todo' THEN 1 END), "
+        "count(CASE WHEN tasks.status = 'in_progress' THEN 1 END), "
+        "count(CASE WHEN tasks.status = 'done' THEN 1 END), "
+        "min(CASE WHEN tasks.status <> 'done' THEN tasks.deadline END) "
+        "FROM projects LEFT JOIN tasks ON tasks.project_id = projects.id "
+        "GROUP BY projects.id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('project_stats')
+    op.drop_index('ix_tasks_project_id_open_deadline', table_name='tasks')
@@ -0,0 +1,28 @@
+"""index tasks.updated_at
+
+Revision ID: 9a6c2e4f7b15
+Revises: 5d3b7a1f9c64
+Create Date: 2026-10-18 16:42:07.118392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a6c2e4f7b15'
+down_revision: Union[str, Sequence[str], None] = '5d3b7a1f9c64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tasks_updated_at', 'tasks', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_updated_at', table_name='tasks')
@@ -0,0 +1,47 @@
+"""task project fk on delete cascade
+
+Revision ID: c7d15e3a9f20
+Revises: 8b4e2f6a1c93
+Create Date: 2026-10-18 11:41:05.337912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d15e3a9f20'
+down_revision: Union[str, Sequence[str], None] = '8b4e2f6a1c93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The initial schema left the constraint unnamed. PostgreSQL names it
+# tasks_project_id_fkey; on SQLite batch mode needs a naming convention
+# to address it.
+NAMING_CONVENTION = {"fk": "%(table_name)s_%(column_0_name)s_fkey"}
+
+
+def _replace_fk(ondelete: Union[str, None]) -> None:
+    with op.batch_alter_table(
+        'tasks', naming_convention=NAMING_CONVENTION
+    ) as batch_op:
+        batch_op.drop_constraint('tasks_project_id_fkey', type_='foreignkey')
+        batch_op.create_foreign_key(
+            'tasks_project_id_fkey',
+            'projects',
+            ['project_id'],
+            ['id'],
+            ondelete=ondelete,
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _replace_fk(ondelete='CASCADE')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _replace_fk(ondelete=None)
@@ -0,0 +1,44 @@
+"""add updated_at
+
+Revision ID: e2a94b7c0d18
+Revises: c7d15e3a9f20
+Create Date: 2026-10-18 13:20:52.610447
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a94b7c0d18'
+down_revision: Union[str, Sequence[str], None] = 'c7d15e3a9f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('projects', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.add_column('tasks', sa.Column('updated_at', sa.DateTime(), nullable=True))
+
+    # Existing rows have not changed since they were created
+    op.execute("UPDATE projects SET updated_at = created_at")
+    op.execute("UPDATE tasks SET updated_at = created_at")
+
+    op.create_index(
+        'ix_tasks_project_id_updated_at',
+        'tasks',
+        ['project_id', 'updated_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_project_id_updated_at', table_name='tasks')
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.drop_column('updated_at')
+    with op.batch_alter_table('projects') as batch_op:
+        batch_op.drop_column('updated_at')
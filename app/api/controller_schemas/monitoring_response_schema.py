@@ -0,0 +1,36 @@
+from typing import Dict, Optional
+
+from pydantic import BaseModel
+
+
+class HistogramResponse(BaseModel):
+    """Cumulative bucket counts keyed by upper bound (seconds)."""
+    buckets: Dict[str, int]
+    count: int
+    sum: float
+
+
+class PoolStatsResponse(BaseModel):
+    """Live state of one engine's connection pool."""
+    pool_class: str
+    size: Optional[int] = None
+    checked_in: Optional[int] = None
+    checked_out: Optional[int] = None
+    overflow: Optional[int] = None
+    wait_time: Optional[HistogramResponse] = None
+
+
+class PoolsResponse(BaseModel):
+    """Pool stats for the sync and async engines of this process."""
+    sync_engine: PoolStatsResponse
+    async_engine: PoolStatsResponse
+
+
+class CacheStatsResponse(BaseModel):
+    """Hit/miss counters of the project/task lookup cache in this worker."""
+    backend: str
+    hits: int = 0
+    misses: int = 0
+    hit_ratio: float = 0.0
+    invalidations: int = 0
+    entries: Optional[int] = None
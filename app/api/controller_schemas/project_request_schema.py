@@ -12,3 +12,7 @@ class ProjectUpdateRequest(BaseModel):
     description: Optional[str] = Field(
         None, example="Updated project description"
     )
+
+
+class ProjectUpsertRequest(BaseModel):
+    description: str = Field("", example="This is my project description")
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -9,16 +9,61 @@ class ProjectBaseResponse(BaseModel):
     name: str
     description: Optional[str] = None
     created_at: datetime
+    updated_at: Optional[datetime] = None
 
     # Pydantic v2 config – جایگزین orm_mode
     model_config = {"from_attributes": True}
 
 
+class TaskCountsResponse(BaseModel):
+    """Number of tasks in a project per status."""
+    todo: int = 0
+    in_progress: int = 0
+    done: int = 0
+
+
 class ProjectListItemResponse(ProjectBaseResponse):
     """Single project item for list endpoints."""
-    pass
+    task_counts: Optional[TaskCountsResponse] = None
 
 
 class ProjectDetailResponse(ProjectBaseResponse):
     """Detailed project response."""
     pass
+
+
+class ProjectListResponse(BaseModel):
+    """A page of projects plus the cursor for the next page."""
+    items: List[ProjectListItemResponse]
+    next_cursor: Optional[str] = None
+
+    model_config = {"from_attributes": True}
+
+
+class ProjectStatsResponse(BaseModel):
+    """Task statistics of one project."""
+    project_id: str
+    todo: int
+    in_progress: int
+    done: int
+    # Open tasks whose deadline has passed
+    overdue: int
+    # Earliest deadline of an open task that has not passed yet
+    next_deadline: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
+
+
+class StatsTotalsResponse(BaseModel):
+    """Task statistics summed over all projects."""
+    todo: int = 0
+    in_progress: int = 0
+    done: int = 0
+    overdue: int = 0
+    next_deadline: Optional[datetime] = None
+
+
+class StatsResponse(BaseModel):
+    """Task statistics of every project plus their totals."""
+    projects: List[ProjectStatsResponse]
+    totals: StatsTotalsResponse
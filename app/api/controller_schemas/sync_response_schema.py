@@ -0,0 +1,24 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from app.api.controller_schemas.project_response_schema import ProjectDetailResponse
+from app.api.controller_schemas.task_response_schema import TaskDetailResponse
+
+
+class SyncDeletedResponse(BaseModel):
+    """A task or project deleted since the token."""
+    entity: str
+    id: str
+    project_id: Optional[str] = None
+
+
+class SyncResponse(BaseModel):
+    """Changes since the token plus the token to sync from next."""
+    projects: List[ProjectDetailResponse]
+    tasks: List[TaskDetailResponse]
+    deleted: List[SyncDeletedResponse]
+    next_token: str
+    has_more: bool
+
+    model_config = {"from_attributes": True}
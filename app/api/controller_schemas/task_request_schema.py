@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -23,3 +23,18 @@ class TaskUpdateRequest(BaseModel):
     deadline: Optional[datetime] = Field(
         None, example="2025-12-31T23:59:00"
     )
+
+
+class TaskBulkCreateRequest(BaseModel):
+    tasks: List[TaskCreateRequest] = Field(..., min_length=1)
+    allow_partial: bool = Field(
+        False,
+        description="Insert the valid tasks even if some items fail validation",
+    )
+
+
+class TaskBulkUpdateRequest(BaseModel):
+    status: Optional[str] = Field(None, example="done")
+    deadline: Optional[datetime] = Field(
+        None, example="2025-12-31T23:59:00"
+    )
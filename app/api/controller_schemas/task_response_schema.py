@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -11,6 +11,7 @@ class TaskBaseResponse(BaseModel):
     description: Optional[str] = None
     status: str
     created_at: datetime
+    updated_at: Optional[datetime] = None
     deadline: Optional[datetime] = None
 
     # Pydantic v2 config – جایگزین orm_mode
@@ -25,3 +26,27 @@ class TaskListItemResponse(TaskBaseResponse):
 class TaskDetailResponse(TaskBaseResponse):
     """Detailed task response."""
     pass
+
+
+class TaskListResponse(BaseModel):
+    """A page of tasks plus the cursor for the next page."""
+    items: List[TaskListItemResponse]
+    next_cursor: Optional[str] = None
+
+    model_config = {"from_attributes": True}
+
+
+class TaskBulkErrorResponse(BaseModel):
+    """Why one item of a bulk request was rejected."""
+    index: int
+    message: str
+
+    model_config = {"from_attributes": True}
+
+
+class TaskBulkCreateResponse(BaseModel):
+    """Tasks created by a bulk request plus per-item errors."""
+    created: List[TaskListItemResponse]
+    errors: List[TaskBulkErrorResponse]
+
+    model_config = {"from_attributes": True}
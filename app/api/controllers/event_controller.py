@@ -0,0 +1,43 @@
+# app/api/controllers/event_controller.py
+
+from typing import Optional
+
+from fastapi import APIRouter, Header
+from fastapi.responses import StreamingResponse
+
+from app.api.sse import event_stream
+from core.config import settings
+from core.events import event_hub
+
+router = APIRouter(
+    prefix="/events",
+    tags=["Events"],
+)
+
+
+@router.get("/")
+async def stream_events(
+    project_id: Optional[str] = None,
+    last_event_id: Optional[str] = Header(None),
+):
+    """
+    Server-Sent Events stream of task and project changes.
+
+    Each event is named after what happened (task.created, task.updated,
+    task.deleted, project.created, ...) and carries the entity and project
+    IDs; fetch the entity for its new state. project_id limits the stream
+    to one project. Reconnecting with Last-Event-ID resumes after that
+    event; if it is too old to replay, a reset event comes first and the
+    client should reload its data.
+    """
+    return StreamingResponse(
+        event_stream(
+            event_hub,
+            last_event_id,
+            project_id,
+            settings.EVENTS_KEEPALIVE,
+        ),
+        media_type="text/event-stream",
+        # Proxies must pass events through as they are written
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,43 @@
+# app/api/controllers/monitoring_controller.py
+
+from fastapi import APIRouter
+
+from core.cache import entity_cache
+from core.database import async_engine, engine
+from core.pool import pool_status
+from app.api.controller_schemas.monitoring_response_schema import (
+    CacheStatsResponse,
+    PoolsResponse,
+)
+
+router = APIRouter(
+    prefix="/monitoring",
+    tags=["Monitoring"],
+)
+
+
+@router.get(
+    "/pool",
+    response_model=PoolsResponse,
+)
+async def get_pool_stats():
+    """
+    Live connection pool usage for this worker process.
+    wait_time is a histogram of how long checkouts waited for a connection.
+    overflow is negative while fewer than size connections have been opened.
+    """
+    return {
+        "sync_engine": pool_status(engine),
+        "async_engine": pool_status(async_engine.sync_engine),
+    }
+
+
+@router.get(
+    "/cache",
+    response_model=CacheStatsResponse,
+)
+async def get_cache_stats():
+    """Hit/miss counters of the project/task lookup cache for this worker."""
+    if entity_cache is None:
+        return {"backend": "none"}
+    return entity_cache.stats()
@@ -1,18 +1,22 @@
 # app/api/controllers/project_controller.py
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 
-from core.services.todo_manager import TodoManager
-from app.api.dependencies import get_todo_manager
+from core.services.async_todo_manager import AsyncTodoManager
+from app.api.dependencies import get_async_todo_manager, get_fields
+from app.api.etag import etag_matches, make_etag, not_modified
+from app.api.sparse import sparse_page
 from app.api.controller_schemas.project_request_schema import (
     ProjectCreateRequest,
     ProjectUpdateRequest,
+    ProjectUpsertRequest,
 )
 from app.api.controller_schemas.project_response_schema import (
     ProjectDetailResponse,
-    ProjectListItemResponse,
+    ProjectListResponse,
+    ProjectStatsResponse,
 )
 
 router = APIRouter(
@@ -26,13 +30,13 @@ router = APIRouter(
     response_model=ProjectDetailResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def create_project(
+async def create_project(
     request: ProjectCreateRequest,
-    manager: TodoManager = Depends(get_todo_manager),
+    manager: AsyncTodoManager = Depends(get_async_todo_manager),
 ):
     """Create a new project."""
     try:
-        project = manager.create_project(
+        project = await manager.create_project(
             name=request.name,
             description=request.description,
         )
@@ -47,30 +51,99 @@ def create_project(
 
 @router.get(
     "/",
-    response_model=List[ProjectListItemResponse],
+    response_model=ProjectListResponse,
 )
-def list_projects(
-    manager: TodoManager = Depends(get_todo_manager),
+async def list_projects(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = Depends(get_fields),
+    if_none_match: Optional[str] = Header(None),
+    manager: AsyncTodoManager = Depends(get_async_todo_manager),
 ):
-    """List all projects."""
-    return manager.list_projects()
+    """
+    List projects, newest first.
+    Pass the returned next_cursor back as cursor to fetch the next page.
+    fields (e.g. fields=id,name,task_counts) returns only those fields and
+    selects only those columns.
+    Responses carry an ETag; send it back as If-None-Match to get a 304
+    while neither the projects nor their task counts have changed.
+    """
+    marker = await manager.projects_change_marker()
+    etag = make_etag(*marker, limit, cursor, fields)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    try:
+        page = await manager.list_projects_page(
+            limit=limit,
+            cursor=cursor,
+            with_task_counts=True,
+            fields=fields,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    if fields is not None:
+        return sparse_page(page, etag)
+    response.headers["ETag"] = etag
+    return page
 
 
 @router.get(
     "/{project_id}",
     response_model=ProjectDetailResponse,
 )
-def get_project(
+async def get_project(
     project_id: str,
-    manager: TodoManager = Depends(get_todo_manager),
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    manager: AsyncTodoManager = Depends(get_async_todo_manager),
 ):
-    """Get a single project by ID."""
-    project = manager.get_project(project_id)
+    """Get a single project by ID (conditional on If-None-Match)."""
+    project = await manager.get_project(project_id)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found",
         )
+    etag = make_etag(project.id, project.updated_at)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return project
+
+
+@router.put(
+    "/by-name/{name}",
+    response_model=ProjectDetailResponse,
+    responses={201: {"model": ProjectDetailResponse}},
+)
+async def upsert_project(
+    name: str,
+    request: ProjectUpsertRequest,
+    response: Response,
+    manager: AsyncTodoManager = Depends(get_async_todo_manager),
+):
+    """
+    Create the project with this name, or update its description if it
+    exists (a single INSERT ... ON CONFLICT). Safe to retry.
+    Returns 201 when the project was created and 200 otherwise.
+    """
+    try:
+        project, created = await manager.upsert_project(
+            name=name,
+            description=request.description,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    if created:
+        response.status_code = status.HTTP_201_CREATED
     return project
 
 
@@ -78,14 +151,14 @@ def get_project(
     "/{project_id}",
     response_model=ProjectDetailResponse,
 )
-def update_project(
+async def update_project(
     project_id: str,
     request: ProjectUpdateRequest,
-    manager: TodoManager = Depends(get_todo_manager),
+    manager: AsyncTodoManager = Depends(get_async_todo_manager),
 ):
     """Update a project."""
     try:
-        project = manager.edit_project(
+        project = await manager.edit_project(
             project_id=project_id,
             name=request.name,
             description=request.description,
@@ -108,13 +181,13 @@ def update_project(
     "/{project_id}",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def delete_project(
+async def delete_project(
     project_id: str,
-    manager: TodoManager = Depends(get_todo_manager),
+    manager: AsyncTodoManager = Depends(get_async_todo_manager),
 ):
     """Delete a project."""
     try:
-        manager.delete_project(project_id)
+        await manager.delete_project(project_id)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -122,3 +195,21 @@ def delete_project(
         )
     # 204 means no body
     return None
+
+
+@router.get(
+    "/{project_id}/stats",
+    response_model=ProjectStatsResponse,
+)
+async def get_project_stats(
+    project_id: str,
+    manager: AsyncTodoManager = Depends(get_async_todo_manager),
+):
+    """Task counts per status, overdue tasks and the next deadline of a project."""
+    try:
+        return await manager.get_project_stats(project_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
@@ -0,0 +1,39 @@
+# app/api/controllers/stats_controller.py
+
+from fastapi import APIRouter, Depends
+
+from core.services.async_todo_manager import AsyncTodoManager
+from app.api.dependencies import get_async_todo_manager
+from app.api.controller_schemas.project_response_schema import (
+    ProjectStatsResponse,
+    StatsResponse,
+    StatsTotalsResponse,
+)
+
+router = APIRouter(
+    prefix="/stats",
+    tags=["Stats"],
+)
+
+
+@router.get("/", response_model=StatsResponse)
+async def get_stats(
+    manager: AsyncTodoManager = Depends(get_async_todo_manager),
+):
+    """
+    Task counts per status, overdue tasks and the next deadline of every
+    project, plus the totals. Read from one summary row per project.
+    """
+    projects = [
+        ProjectStatsResponse.model_validate(stats)
+        for stats in await manager.list_project_stats()
+    ]
+    deadlines = [p.next_deadline for p in projects if p.next_deadline is not None]
+    totals = StatsTotalsResponse(
+        todo=sum(p.todo for p in projects),
+        in_progress=sum(p.in_progress for p in projects),
+        done=sum(p.done for p in projects),
+        overdue=sum(p.overdue for p in projects),
+        next_deadline=min(deadlines, default=None),
+    )
+    return StatsResponse(projects=projects, totals=totals)
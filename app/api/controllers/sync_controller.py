@@ -0,0 +1,37 @@
+# app/api/controllers/sync_controller.py
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from core.services.async_todo_manager import AsyncTodoManager
+from app.api.dependencies import get_async_todo_manager
+from app.api.controller_schemas.sync_response_schema import SyncResponse
+
+router = APIRouter(
+    prefix="/sync",
+    tags=["Sync"],
+)
+
+
+@router.get("/", response_model=SyncResponse)
+async def sync(
+    since: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    manager: AsyncTodoManager = Depends(get_async_todo_manager),
+):
+    """
+    Tasks and projects created, updated or deleted since the since token.
+
+    Without since, every task and project is returned. Keep requesting
+    with since=next_token while has_more is true, then store next_token
+    for the next sync. Deleted entries list the IDs to drop; the tasks of
+    a deleted project are not listed separately.
+    """
+    try:
+        return await manager.sync_changes(token=since, limit=limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
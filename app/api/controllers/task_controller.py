@@ -2,17 +2,26 @@
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 
-from core.services.todo_manager import TodoManager
-from app.api.dependencies import get_todo_manager
+from core.services.async_todo_manager import AsyncTodoManager
+from app.api.dependencies import get_async_todo_manager, get_fields, get_task_filter
+from app.api.etag import etag_matches, make_etag, not_modified
+from app.api.sparse import sparse_page
+from core.repositories.task_filter import TaskFilter
+from core.services.task_export import EXPORT_FORMATS
 from app.api.controller_schemas.task_request_schema import (
+    TaskBulkCreateRequest,
+    TaskBulkUpdateRequest,
     TaskCreateRequest,
     TaskUpdateRequest,
 )
 from app.api.controller_schemas.task_response_schema import (
+    TaskBulkCreateResponse,
+    TaskBulkErrorResponse,
     TaskDetailResponse,
-    TaskListItemResponse,
+    TaskListResponse,
 )
 
 router = APIRouter(
@@ -26,13 +35,13 @@ router = APIRouter(
     response_model=TaskDetailResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def create_task(
+async def create_task(
     request: TaskCreateRequest,
-    manager: TodoManager = Depends(get_todo_manager),
+    manager: AsyncTodoManager = Depends(get_async_todo_manager),
 ):
     """Create a new task."""
     try:
-        task = manager.create_task(
+        task = await manager.create_task(
             project_id=request.project_id,
             title=request.title,
             description=request.description,
@@ -53,36 +62,192 @@ def create_task(
         )
 
 
+@router.post(
+    "/bulk",
+    response_model=TaskBulkCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_tasks_bulk(
+    request: TaskBulkCreateRequest,
+    manager: AsyncTodoManager = Depends(get_async_todo_manager),
+):
+    """
+    Create many tasks in a single transaction.
+    Without allow_partial, any invalid item rejects the whole batch (400)
+    and the per-item errors are returned as the error detail.
+    """
+    try:
+        result = await manager.create_tasks_bulk(
+            [task.model_dump() for task in request.tasks],
+            allow_partial=request.allow_partial,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    if result.errors and not request.allow_partial:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=[
+                TaskBulkErrorResponse.model_validate(error).model_dump()
+                for error in result.errors
+            ],
+        )
+    return result
+
+
 @router.get(
     "/",
-    response_model=List[TaskListItemResponse],
+    response_model=TaskListResponse,
 )
-def list_tasks(
+async def list_tasks(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = None,
+    sort: Optional[str] = None,
+    task_filter: TaskFilter = Depends(get_task_filter),
+    fields: Optional[List[str]] = Depends(get_fields),
+    if_none_match: Optional[str] = Header(None),
+    manager: AsyncTodoManager = Depends(get_async_todo_manager),
+):
+    """
+    List tasks, newest first.
+    Filter with project_id, status, deadline_before/deadline_after,
+    created_before/created_after (half-open bounds), q (every word must
+    appear in the title or description) and repeated ids.
+    sort is one of created_at, updated_at, deadline or title, prefixed
+    with - for descending order; tasks without a deadline come last.
+    fields (e.g. fields=id,title,status,deadline) returns only those fields
+    and selects only those columns.
+    Pass the returned next_cursor back as cursor to fetch the next page.
+    Responses carry an ETag; send it back as If-None-Match to get a 304
+    while nothing in the listing has changed.
+    """
+    marker = await manager.tasks_change_marker(project_id=task_filter.project_id)
+    etag = make_etag(*marker, repr(task_filter), sort, limit, cursor, fields)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    try:
+        page = await manager.list_tasks_page(
+            limit=limit,
+            cursor=cursor,
+            task_filter=task_filter,
+            sort=sort,
+            fields=fields,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    if fields is not None:
+        return sparse_page(page, etag)
+    response.headers["ETag"] = etag
+    return page
+
+
+@router.get(
+    "/export",
+    summary="Stream all tasks as NDJSON or CSV",
+    response_class=StreamingResponse,
+)
+async def export_tasks(
+    format: str = Query("ndjson", description="ndjson or csv"),
     project_id: Optional[str] = None,
-    manager: TodoManager = Depends(get_todo_manager),
+    manager: AsyncTodoManager = Depends(get_async_todo_manager),
 ):
     """
-    List tasks.
-    If project_id is provided, only tasks for that project are returned.
+    Export tasks (optionally only one project's) oldest first.
+    Rows are read from a server-side cursor and written as they arrive,
+    so memory use does not grow with the number of tasks.
     """
-    return manager.list_tasks(project_id=project_id)
+    try:
+        chunks = manager.export_tasks(format, project_id=project_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{format}"'},
+    )
+
+
+@router.patch(
+    "/",
+    summary="Update all tasks matching a filter",
+)
+async def update_tasks(
+    request: TaskBulkUpdateRequest,
+    task_filter: TaskFilter = Depends(get_task_filter),
+    manager: AsyncTodoManager = Depends(get_async_todo_manager),
+):
+    """
+    Set status and/or deadline on every task matching the query filter
+    (project_id, status, deadline and created_at bounds, q, repeated ids)
+    in a single UPDATE. Returns the number of tasks updated.
+    """
+    try:
+        count = await manager.update_tasks(
+            task_filter,
+            status=request.status,
+            deadline=request.deadline,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    return {"updated_tasks": count}
+
+
+@router.delete(
+    "/",
+    summary="Delete all tasks matching a filter",
+)
+async def delete_tasks(
+    task_filter: TaskFilter = Depends(get_task_filter),
+    manager: AsyncTodoManager = Depends(get_async_todo_manager),
+):
+    """
+    Delete every task matching the query filter in a single DELETE.
+    Returns the number of tasks deleted.
+    """
+    try:
+        count = await manager.delete_tasks(task_filter)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    return {"deleted_tasks": count}
 
 
 @router.get(
     "/{task_id}",
     response_model=TaskDetailResponse,
 )
-def get_task(
+async def get_task(
     task_id: str,
-    manager: TodoManager = Depends(get_todo_manager),
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    manager: AsyncTodoManager = Depends(get_async_todo_manager),
 ):
-    """Get a single task by ID."""
-    task = manager.get_task(task_id)
+    """Get a single task by ID (conditional on If-None-Match)."""
+    task = await manager.get_task(task_id)
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found",
         )
+    etag = make_etag(task.id, task.updated_at)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
     return task
 
 
@@ -90,14 +255,14 @@ def get_task(
     "/{task_id}",
     response_model=TaskDetailResponse,
 )
-def update_task(
+async def update_task(
     task_id: str,
     request: TaskUpdateRequest,
-    manager: TodoManager = Depends(get_todo_manager),
+    manager: AsyncTodoManager = Depends(get_async_todo_manager),
 ):
     """Update a task."""
     try:
-        task = manager.edit_task(
+        task = await manager.edit_task(
             task_id=task_id,
             title=request.title,
             description=request.description,
@@ -122,13 +287,13 @@ def update_task(
     "/{task_id}",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def delete_task(
+async def delete_task(
     task_id: str,
-    manager: TodoManager = Depends(get_todo_manager),
+    manager: AsyncTodoManager = Depends(get_async_todo_manager),
 ):
     """Delete a task."""
     try:
-        manager.delete_task(task_id)
+        await manager.delete_task(task_id)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -141,12 +306,15 @@ def delete_task(
     "/close-overdue",
     summary="Close all overdue tasks",
 )
-def close_overdue_tasks(
-    manager: TodoManager = Depends(get_todo_manager),
+async def close_overdue_tasks(
+    batch_size: Optional[int] = Query(None, ge=1),
+    dry_run: bool = False,
+    manager: AsyncTodoManager = Depends(get_async_todo_manager),
 ):
     """
     Close all tasks whose deadline has passed and are not done yet.
     Returns the number of tasks that were updated.
+    With dry_run, returns the number of tasks that would be closed.
     """
-    count = manager.close_overdue_tasks()
-    return {"closed_tasks": count}
+    count = await manager.close_overdue_tasks(batch_size=batch_size, dry_run=dry_run)
+    return {"closed_tasks": count, "dry_run": dry_run}
@@ -1,23 +1,60 @@
 # app/api/dependencies.py
 
-from typing import Generator
+from datetime import datetime
+from typing import AsyncGenerator, List, Optional
 
-from fastapi import Depends
-from sqlalchemy.orm import Session
+from fastapi import Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.database import SessionLocal
-from core.services.todo_manager import TodoManager
+from core.cache import entity_cache
+from core.database import AsyncSessionLocal
+from core.events import event_hub
+from core.repositories.task_filter import TaskFilter
+from core.services.async_todo_manager import AsyncTodoManager
 
 
-def get_db() -> Generator[Session, None, None]:
-    """Provide a DB session per request."""
-    db = SessionLocal()
-    try:
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Provide an async DB session per request."""
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def get_todo_manager(db: Session = Depends(get_db)) -> TodoManager:
-    """Provide a TodoManager instance per request."""
-    return TodoManager(db=db)
+def get_async_todo_manager(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncTodoManager:
+    """Provide an AsyncTodoManager instance per request."""
+    return AsyncTodoManager(db=db, cache=entity_cache, events=event_hub)
+
+
+def get_task_filter(
+    project_id: Optional[str] = None,
+    status: Optional[str] = None,
+    deadline_before: Optional[datetime] = None,
+    deadline_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    created_after: Optional[datetime] = None,
+    q: Optional[str] = Query(None, max_length=200),
+    ids: Optional[List[str]] = Query(None),
+) -> TaskFilter:
+    """Build a TaskFilter from query parameters (ids may be repeated)."""
+    return TaskFilter(
+        project_id=project_id,
+        status=status,
+        deadline_before=deadline_before,
+        deadline_after=deadline_after,
+        created_before=created_before,
+        created_after=created_after,
+        q=q,
+        ids=ids,
+    )
+
+
+def get_fields(
+    fields: Optional[str] = Query(
+        None, description="Comma-separated fields to return (id is always included)"
+    ),
+) -> Optional[List[str]]:
+    """Split a sparse fieldset parameter like fields=id,title,status."""
+    if fields is None:
+        return None
+    return [name.strip() for name in fields.split(",") if name.strip()]
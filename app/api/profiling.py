@@ -0,0 +1,146 @@
+# app/api/profiling.py
+
+import logging
+import threading
+import time
+from typing import Dict, List, Tuple
+
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.metrics import Histogram
+from core.profiling import current_profile, end_profile, start_profile
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+
+class RouteMetrics:
+    """Per-route request histograms, rendered in the Prometheus text format."""
+
+    def __init__(self) -> None:
+        self._routes: Dict[Tuple[str, str], Dict[str, Histogram]] = {}
+        self._over_limit: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def observe(
+        self, method: str, route: str, duration: float, db_time: float, queries: int
+    ) -> None:
+        key = (method, route)
+        with self._lock:
+            histograms = self._routes.get(key)
+            if histograms is None:
+                histograms = self._routes[key] = {
+                    "duration": Histogram(),
+                    "db": Histogram(),
+                    "queries": Histogram(QUERY_COUNT_BUCKETS),
+                }
+        histograms["duration"].observe(duration)
+        histograms["db"].observe(db_time)
+        histograms["queries"].observe(queries)
+
+    def count_over_limit(self, method: str, route: str) -> None:
+        with self._lock:
+            key = (method, route)
+            self._over_limit[key] = self._over_limit.get(key, 0) + 1
+
+    def render(self) -> str:
+        with self._lock:
+            routes = sorted(self._routes.items())
+            over_limit = sorted(self._over_limit.items())
+
+        lines: List[str] = []
+        for name, kind, help_text in (
+            ("http_request_duration_seconds", "duration", "Wall time of HTTP requests."),
+            ("http_request_db_seconds", "db", "Time spent in SQL per HTTP request."),
+            ("http_request_queries", "queries", "SQL statements issued per HTTP request."),
+        ):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for (method, route), histograms in routes:
+                labels = f'method="{method}",route="{_escape(route)}"'
+                snapshot = histograms[kind].snapshot()
+                for bound, count in snapshot["buckets"].items():
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f"{name}_sum{{{labels}}} {snapshot['sum']}")
+                lines.append(f"{name}_count{{{labels}}} {snapshot['count']}")
+
+        name = "http_requests_over_query_limit_total"
+        lines.append(f"# HELP {name} Requests that issued more SQL statements than allowed.")
+        lines.append(f"# TYPE {name} counter")
+        for (method, route), count in over_limit:
+            lines.append(f'{name}{{method="{method}",route="{_escape(route)}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class ProfilingMiddleware:
+    """
+    Record wall time, SQL time and statement count of every HTTP request.
+
+    The figures are sent back in a Server-Timing header and aggregated per
+    route template into metrics. A request issuing more than query_limit
+    statements (a likely N+1) is logged and counted; 0 disables the check.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: RouteMetrics, query_limit: int = 0) -> None:
+        self.app = app
+        self.metrics = metrics
+        self.query_limit = query_limit
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = start_profile()
+        profile = current_profile()
+        started = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                elapsed = time.perf_counter() - started
+                timing = (
+                    f"app;dur={elapsed * 1000:.1f}, "
+                    f'db;dur={profile.db_time * 1000:.1f};desc="{profile.query_count} queries"'
+                )
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", timing.encode("latin-1"))
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            duration = time.perf_counter() - started
+            end_profile(token)
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            self.metrics.observe(
+                method, route_path, duration, profile.db_time, profile.query_count
+            )
+            if self.query_limit and profile.query_count > self.query_limit:
+                self.metrics.count_over_limit(method, route_path)
+                logger.warning(
+                    "%s %s issued %d SQL statements (limit %d)",
+                    method,
+                    scope["path"],
+                    profile.query_count,
+                    self.query_limit,
+                )
+
+
+def metrics_endpoint(metrics: RouteMetrics):
+    """Build the handler serving metrics in the Prometheus text format."""
+
+    def get_metrics() -> Response:
+        return Response(
+            metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+        )
+
+    return get_metrics
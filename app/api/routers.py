@@ -1,8 +1,19 @@
 from fastapi import APIRouter
 
-from app.api.controllers import project_controller, task_controller
+from app.api.controllers import (
+    event_controller,
+    monitoring_controller,
+    project_controller,
+    stats_controller,
+    sync_controller,
+    task_controller,
+)
 
 router = APIRouter()
 
 router.include_router(project_controller.router)
 router.include_router(task_controller.router)
+router.include_router(monitoring_controller.router)
+router.include_router(event_controller.router)
+router.include_router(sync_controller.router)
+router.include_router(stats_controller.router)
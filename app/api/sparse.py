@@ -0,0 +1,18 @@
+# app/api/sparse.py
+
+from fastapi import Response
+from pydantic_core import to_json
+
+from core.repositories.pagination import Page
+
+
+def sparse_page(page: Page, etag: str) -> Response:
+    """
+    Serialize a page of plain dicts (a fields= listing) directly, skipping
+    response_model validation, which would require every field.
+    """
+    return Response(
+        to_json({"items": page.items, "next_cursor": page.next_cursor}),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
@@ -0,0 +1,72 @@
+# app/api/sse.py
+
+import asyncio
+import signal
+import threading
+from typing import AsyncIterator, Optional
+
+from core.events import ChangeEvent, EventHub
+
+# Client reconnect delay, in milliseconds
+RETRY_MS = 3000
+
+
+async def event_stream(
+    hub: EventHub,
+    last_event_id: Optional[str],
+    project_id: Optional[str],
+    keepalive: float,
+) -> AsyncIterator[str]:
+    """
+    Server-Sent Events for the hub's change events. A client resuming
+    from an event that is no longer buffered first gets a reset event:
+    it has to reload what it holds before applying the ones that follow.
+    """
+    subscription = hub.subscribe(last_event_id, project_id)
+    try:
+        yield f"retry: {RETRY_MS}\n\n"
+        if subscription.missed:
+            yield "event: reset\ndata: {}\n\n"
+        for event in subscription.backlog:
+            yield format_event(event)
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), keepalive)
+            except asyncio.TimeoutError:
+                # Comment line: keeps proxies from closing an idle stream
+                yield ": keep-alive\n\n"
+                continue
+            if event is None:
+                # Dropped (too slow) or reset: the client reconnects
+                return
+            yield format_event(event)
+    finally:
+        hub.unsubscribe(subscription)
+
+
+def format_event(event: ChangeEvent) -> str:
+    return f"id: {event.seq}\nevent: {event.type}\ndata: {event.to_json()}\n\n"
+
+
+def end_streams_on_exit_signal(hub: EventHub) -> None:
+    """
+    End the event streams as soon as the server is told to stop. The
+    server waits for open responses before running the lifespan shutdown,
+    and an event stream never finishes on its own.
+
+    Chains the handlers the server installed for SIGINT/SIGTERM; call it
+    during lifespan startup. Only possible on the main thread.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        previous = signal.getsignal(signum)
+        if not callable(previous):
+            continue
+
+        def handler(signum, frame, previous=previous):
+            loop.call_soon_threadsafe(hub.stop)
+            previous(signum, frame)
+
+        signal.signal(signum, handler)
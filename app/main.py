@@ -1,19 +1,76 @@
 # app/main.py
 
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 
+from app.api.profiling import ProfilingMiddleware, RouteMetrics, metrics_endpoint
 from app.api.routers import router as api_router
+from app.api.sse import end_streams_on_exit_signal
+from core.cache import entity_cache
+from core.config import settings
+from core.database import AsyncSessionLocal, async_engine, engine
+from core.events import PostgresEventListener, event_hub
+from core.profiling import instrument_engine
+from core.services.overdue_scheduler import OverdueScheduler
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    background = []
+    event_hub.start(asyncio.get_running_loop())
+    end_streams_on_exit_signal(event_hub)
+    if async_engine.dialect.name == "postgresql":
+        # Change events of all replicas arrive through LISTEN
+        listener = PostgresEventListener(
+            async_engine, event_hub, check_interval=settings.EVENTS_KEEPALIVE
+        )
+        background.append(asyncio.create_task(listener.run()))
+    if settings.OVERDUE_SCHEDULER_ENABLED:
+        scheduler = OverdueScheduler(
+            async_engine, AsyncSessionLocal, settings, entity_cache, event_hub
+        )
+        background.append(asyncio.create_task(scheduler.run()))
+    yield
+    for task in background:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    # End open event streams
+    event_hub.stop()
+    # Close pooled connections on shutdown
+    await async_engine.dispose()
+    engine.dispose()
 
 
 def create_app() -> FastAPI:
     app = FastAPI(
         title="ToDoList API",
         version="0.1.0",
+        lifespan=lifespan,
     )
 
     # ثبت تمام routerها
     app.include_router(api_router, prefix="/api/v1")
 
+    if settings.PROFILING_ENABLED:
+        instrument_engine(engine)
+        instrument_engine(async_engine.sync_engine)
+        metrics = RouteMetrics()
+        app.add_middleware(
+            ProfilingMiddleware,
+            metrics=metrics,
+            query_limit=settings.PROFILING_QUERY_LIMIT,
+        )
+        app.add_api_route(
+            "/metrics",
+            metrics_endpoint(metrics),
+            methods=["GET"],
+            tags=["Monitoring"],
+            include_in_schema=False,
+        )
+
     @app.get("/", tags=["Health"])
     def health_check():
         return {"status": "ok"}
@@ -0,0 +1,195 @@
+# app/serve.py
+"""
+Production entry point for the Web API:
+
+    python -m app.serve [--host HOST] [--port PORT] [--workers N]
+
+Runs app.main:app in several worker processes. With gunicorn installed it
+manages them: the app is imported once in the master (preload) and the
+workers are forked from it, sharing its memory copy-on-write. Without it,
+uvicorn's supervisor starts the workers and each imports the app itself.
+Workers use uvloop and httptools when those are installed.
+
+On SIGTERM/SIGINT the workers stop accepting connections, give in-flight
+requests WEB_GRACEFUL_TIMEOUT seconds to finish and then run the lifespan
+shutdown, which ends event streams and disposes the database engines.
+"""
+import argparse
+import importlib.util
+import os
+from typing import Any, Dict, Tuple
+
+from sqlalchemy.engine import make_url
+
+from core.config import Config, settings
+
+APP = "app.main:app"
+
+# Extra seconds gunicorn waits for a worker after its graceful timeout, so
+# the lifespan shutdown can still dispose the engines
+SHUTDOWN_MARGIN = 5
+
+
+def worker_count(config: Config) -> int:
+    """WEB_CONCURRENCY, or one worker per CPU when it is 0."""
+    if config.WEB_CONCURRENCY > 0:
+        return config.WEB_CONCURRENCY
+    return os.cpu_count() or 1
+
+
+def reserved_connections(config: Config) -> int:
+    """
+    Connections each worker holds for as long as it runs, out of the
+    async engine's pool: on PostgreSQL, the LISTEN connection of the
+    change feed and, when the overdue scheduler is enabled, the one
+    holding (or waiting to take) its advisory lock.
+    """
+    if make_url(config.ASYNC_DATABASE_URL).get_backend_name() != "postgresql":
+        return 0
+    return 1 + int(config.OVERDUE_SCHEDULER_ENABLED)
+
+
+def pool_limits(config: Config, workers: int) -> Tuple[int, int]:
+    """
+    (DB_POOL_SIZE, DB_MAX_OVERFLOW) for each worker, so that all workers
+    together stay within DB_MAX_CONNECTIONS. Only the async engine serves
+    requests; its pool also hands out the reserved_connections(), so each
+    worker's share must leave at least one connection beyond them.
+    """
+    if config.DB_MAX_CONNECTIONS <= 0:
+        return config.DB_POOL_SIZE, config.DB_MAX_OVERFLOW
+    share = config.DB_MAX_CONNECTIONS // workers
+    reserved = reserved_connections(config)
+    if share <= reserved:
+        raise ValueError(
+            f"DB_MAX_CONNECTIONS={config.DB_MAX_CONNECTIONS} leaves no "
+            f"connection for requests in each of {workers} workers "
+            f"({reserved} per worker are held by background tasks)"
+        )
+    pool_size = min(max(config.DB_POOL_SIZE, reserved + 1), share)
+    return pool_size, min(config.DB_MAX_OVERFLOW, share - pool_size)
+
+
+def event_loop() -> str:
+    return "uvloop" if _installed("uvloop") else "asyncio"
+
+
+def http_parser() -> str:
+    return "httptools" if _installed("httptools") else "h11"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Run the ToDoList API with several worker processes."
+    )
+    parser.add_argument("--host", default=settings.WEB_HOST)
+    parser.add_argument("--port", type=int, default=settings.WEB_PORT)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=worker_count(settings),
+        help="Worker processes (default: WEB_CONCURRENCY, or one per CPU)",
+    )
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    try:
+        pool_size, max_overflow = pool_limits(settings, args.workers)
+    except ValueError as e:
+        parser.error(str(e))
+    # Before the app (and with it core.database) is imported: settings for
+    # a preloaded app, the environment for workers that import it anew
+    settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW = pool_size, max_overflow
+    os.environ["DB_POOL_SIZE"] = str(pool_size)
+    os.environ["DB_MAX_OVERFLOW"] = str(max_overflow)
+
+    server = "gunicorn" if _installed("gunicorn") else "uvicorn"
+    print(
+        f"🚀 Serving on {args.host}:{args.port} with {args.workers} workers "
+        f"({server}, {event_loop()}, {http_parser()}; "
+        f"DB pool {pool_size}+{max_overflow} per worker)"
+    )
+    if server == "gunicorn":
+        _run_gunicorn(args.host, args.port, args.workers)
+    else:
+        _run_uvicorn(args.host, args.port, args.workers)
+
+
+# ==================== Servers ====================
+
+
+def _run_gunicorn(host: str, port: int, workers: int) -> None:
+    from gunicorn.app.base import BaseApplication
+
+    options: Dict[str, Any] = {
+        "bind": f"{host}:{port}",
+        "workers": workers,
+        "worker_class": _gunicorn_worker_class(),
+        "preload_app": True,
+        "keepalive": settings.WEB_KEEPALIVE,
+        "graceful_timeout": settings.WEB_GRACEFUL_TIMEOUT + SHUTDOWN_MARGIN,
+        "post_fork": _post_fork,
+    }
+
+    class Application(BaseApplication):
+        def load_config(self) -> None:
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self) -> Any:
+            from app.main import app
+
+            return app
+
+    Application().run()
+
+
+def _gunicorn_worker_class() -> type:
+    if _installed("uvicorn_worker"):
+        from uvicorn_worker import UvicornWorker
+    else:
+        from uvicorn.workers import UvicornWorker
+
+    class Worker(UvicornWorker):
+        CONFIG_KWARGS = {
+            "loop": event_loop(),
+            "http": http_parser(),
+            # Unset, open connections (event streams) would hold the
+            # worker until gunicorn kills it, skipping the lifespan shutdown
+            "timeout_graceful_shutdown": settings.WEB_GRACEFUL_TIMEOUT,
+        }
+
+    return Worker
+
+
+def _post_fork(server: Any, worker: Any) -> None:
+    # Pools copied from the master must not be shared with it; start
+    # empty ones without closing connections the master may still use
+    from core.database import async_engine, engine
+
+    engine.dispose(close=False)
+    async_engine.sync_engine.dispose(close=False)
+
+
+def _run_uvicorn(host: str, port: int, workers: int) -> None:
+    import uvicorn
+
+    uvicorn.run(
+        APP,
+        host=host,
+        port=port,
+        workers=workers,
+        loop=event_loop(),
+        http=http_parser(),
+        timeout_keep_alive=settings.WEB_KEEPALIVE,
+        timeout_graceful_shutdown=settings.WEB_GRACEFUL_TIMEOUT,
+    )
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# benchmarks/domain_objects.py
+"""
+Compare memory use and throughput of the in-memory domain objects
+(core.Task / core.Project) with the previous dict-based layout.
+
+For each layout: bytes per task (tracemalloc), tasks created per second,
+and task removals per second from a project holding --tasks tasks. The
+previous layout is reproduced below: per-instance __dict__ and a list of
+tasks rebuilt on every removal.
+
+    python -m benchmarks.domain_objects --tasks 1000000 --removals 200
+"""
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from core.project import Project
+from core.task import Task
+
+
+class DictTask:
+    """core.Task before __slots__."""
+
+    VALID_STATUSES = ["todo", "in_progress", "done"]
+
+    def __init__(self, title: str, description: str = "", status: str = "todo") -> None:
+        if len(title) > 50:
+            raise ValueError("Task title cannot exceed 50 characters.")
+        if len(description) > 200:
+            raise ValueError("Task description cannot exceed 200 characters.")
+        if status not in self.VALID_STATUSES:
+            raise ValueError(f"Status must be one of {self.VALID_STATUSES}")
+        self.id = str(uuid.uuid4())
+        self.title = title
+        self.description = description
+        self.status = status
+        self.created_at = datetime.now()
+        self.deadline = None
+        self.project_id = None
+
+
+class ListProject:
+    """core.Project before the id-keyed task dict."""
+
+    def __init__(self, name: str, description: str) -> None:
+        self.id = str(uuid.uuid4())
+        self.name = name
+        self.description = description
+        self.tasks: List[Any] = []
+
+    def add_task(self, task: Any) -> None:
+        self.tasks.append(task)
+
+    def remove_task(self, task_id: str) -> None:
+        self.tasks = [t for t in self.tasks if t.id != task_id]
+
+
+def bytes_per_task(make: Callable[[int], Any], count: int) -> float:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tasks = [make(i) for i in range(count)]
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del tasks
+    return used / count
+
+
+def per_second(fn: Callable[[], Any], count: int) -> float:
+    # Keep collector pauses triggered by earlier allocations out of the timing
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        fn()
+        return count / (time.perf_counter() - start)
+    finally:
+        gc.enable()
+
+
+def run(
+    name: str, make: Callable[[int], Any], project_class: Any, tasks: int, removals: int
+) -> Dict[str, float]:
+    memory = bytes_per_task(make, min(tasks, 200_000))
+    create_rate = per_second(lambda: [make(i) for i in range(tasks)], tasks)
+
+    project = project_class("planning", "benchmark project")
+    ids = []
+    for i in range(tasks):
+        task = make(i)
+        project.add_task(task)
+        ids.append(task.id)
+    doomed = random.sample(ids, removals)
+    remove_rate = per_second(lambda: [project.remove_task(task_id) for task_id in doomed], removals)
+
+    print(
+        f"{name:<10} {memory:>8.0f} B/task | create {create_rate:>10,.0f} tasks/s | "
+        f"remove {remove_rate:>12,.0f} tasks/s"
+    )
+    return {"bytes_per_task": memory, "create_per_sec": create_rate, "remove_per_sec": remove_rate}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--tasks", type=int, default=200_000, help="tasks per project")
+    parser.add_argument("--removals", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42, help="random seed")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    before = run(
+        "before", lambda i: DictTask(f"task-{i}", "benchmark task"),
+        ListProject, args.tasks, args.removals,
+    )
+    after = run(
+        "after", lambda i: Task(f"task-{i}", "benchmark task"),
+        Project, args.tasks, args.removals,
+    )
+    # Loading existing tasks: ids and timestamps come from the source
+    ids = [str(uuid.uuid4()) for _ in range(args.tasks)]
+    loaded_at = datetime.now()
+    run(
+        "after+ids",
+        lambda i: Task(f"task-{i}", "benchmark task", id=ids[i], created_at=loaded_at),
+        Project, args.tasks, args.removals,
+    )
+    print(
+        f"memory {after['bytes_per_task'] / before['bytes_per_task']:.0%} of before | "
+        f"create x{after['create_per_sec'] / before['create_per_sec']:.2f} | "
+        f"remove x{after['remove_per_sec'] / before['remove_per_sec']:,.0f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# benchmarks/load_test.py
+"""
+Minimal HTTP load generator for comparing API builds.
+
+Keeps --concurrency requests in flight against a running server for
+--duration seconds and reports requests/sec and latency percentiles.
+
+    uvicorn app.main:app --port 8000
+    python -m benchmarks.load_test --url http://127.0.0.1:8000 \\
+        --path /api/v1/tasks/?limit=50 --concurrency 200 --duration 20
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List
+
+import httpx
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def worker(
+    client: httpx.AsyncClient,
+    paths: List[str],
+    deadline: float,
+    latencies: List[float],
+    errors: Dict[str, int],
+) -> None:
+    i = 0
+    while time.perf_counter() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            response = await client.get(path)
+            if response.status_code >= 400:
+                errors[str(response.status_code)] = errors.get(str(response.status_code), 0) + 1
+                continue
+        except httpx.HTTPError as e:
+            errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+            continue
+        latencies.append(time.perf_counter() - start)
+
+
+async def run(url: str, paths: List[str], concurrency: int, duration: float) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client:
+        # Warm up connections and server-side pools
+        await asyncio.gather(*(client.get(paths[0]) for _ in range(min(concurrency, 20))))
+
+        start = time.perf_counter()
+        deadline = start + duration
+        await asyncio.gather(
+            *(worker(client, paths, deadline, latencies, errors) for _ in range(concurrency))
+        )
+        elapsed = time.perf_counter() - start
+
+    if not latencies:
+        raise SystemExit(f"No successful requests (errors: {errors})")
+    return {
+        "requests": len(latencies),
+        "errors": sum(errors.values()),
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--path", action="append", dest="paths", help="may be repeated")
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=15.0)
+    args = parser.parse_args()
+
+    paths = args.paths or ["/api/v1/projects/"]
+    result = asyncio.run(run(args.url, paths, args.concurrency, args.duration))
+    print(
+        f"{result['requests']} requests, {result['errors']} errors | "
+        f"{result['rps']:.1f} req/s | p50 {result['p50_ms']:.1f} ms | "
+        f"p99 {result['p99_ms']:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -37,7 +37,7 @@ def list_projects(manager: TodoManager) -> None:
     try:
         print("\n=== Project List ===")
 
-        projects = manager.list_projects()
+        projects = manager.list_projects(with_task_counts=True)
 
         if not projects:
             print("📝 No projects found!")
@@ -50,7 +50,11 @@ def list_projects(manager: TodoManager) -> None:
             print(f"{i}. Name: {project.name}")
             print(f"   🆔 ID: {project.id}")
             print(f"   📝 Description: {project.description}")
-            print(f"   📋 Number of tasks: {len(project.tasks)}")
+            counts = project.task_counts
+            print(
+                f"   📋 Number of tasks: {sum(counts.values())} "
+                f"(📝 {counts['todo']} | 🔄 {counts['in_progress']} | ✅ {counts['done']})"
+            )
             print("-" * 40)
 
     except Exception as e:
@@ -115,14 +119,14 @@ def delete_project(manager: TodoManager) -> None:
         print("\n=== Delete Project ===")
 
         # Display list of projects
-        projects = manager.list_projects()
+        projects = manager.list_projects(with_task_counts=True)
         if not projects:
             print("📝 No projects available to delete!")
             return
 
         print("Available projects:")
         for i, project in enumerate(projects, 1):
-            print(f"{i}. {project.name} (ID: {project.id[:8]}...) - {len(project.tasks)} tasks")
+            print(f"{i}. {project.name} (ID: {project.id[:8]}...) - {sum(project.task_counts.values())} tasks")
 
         # Select project
         try:
@@ -139,7 +143,7 @@ def delete_project(manager: TodoManager) -> None:
 
         # Confirm deletion
         confirm = input(
-            f"⚠️ Are you sure you want to delete project '{selected_project.name}' and all its {len(selected_project.tasks)} tasks? (y/N): "
+            f"⚠️ Are you sure you want to delete project '{selected_project.name}' and all its {sum(selected_project.task_counts.values())} tasks? (y/N): "
         ).strip().lower()
 
         if confirm in ["y", "yes"]:
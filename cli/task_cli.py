@@ -1,10 +1,50 @@
 # ...existing code...
 # cli/task_cli.py
-from typing import Optional
+from typing import Callable, List, Optional
+from core.models.task import Task
 from core.services.todo_manager import TodoManager
 from datetime import datetime
 
 
+def _select_task(
+    manager: TodoManager,
+    empty_message: str,
+    prompt: str,
+    describe: Callable[[Task], str],
+) -> Optional[Task]:
+    """
+    Let the user pick a task, fetching one page at a time so large task
+    lists are never loaded in full. Returns None if nothing was chosen.
+    """
+    page = manager.list_tasks_page()
+    if not page.items:
+        print(empty_message)
+        return None
+
+    shown: List[Task] = []
+    print("Available tasks:")
+    while True:
+        for task in page.items:
+            shown.append(task)
+            print(f"{len(shown)}. {describe(task)}")
+
+        hint = " (n = more tasks)" if page.next_cursor else ""
+        answer = input(f"\n{prompt}{hint}: ").strip().lower()
+        if answer == "n" and page.next_cursor:
+            page = manager.list_tasks_page(cursor=page.next_cursor)
+            continue
+
+        try:
+            choice = int(answer) - 1
+        except ValueError:
+            print("❌ Please enter a valid number!")
+            return None
+        if choice < 0 or choice >= len(shown):
+            print("❌ Invalid number!")
+            return None
+        return shown[choice]
+
+
 def create_task(manager: TodoManager) -> None:
     """Create a new task"""
     try:
@@ -101,27 +141,40 @@ def list_tasks(manager: TodoManager) -> None:
                 print("❌ Invalid number!")
                 return
 
-        # Get tasks
-        tasks = manager.list_tasks(project_id)
+        # Get tasks page by page
+        page = manager.list_tasks_page(project_id=project_id)
 
-        if not tasks:
+        if not page.items:
             print("📝 No tasks found!")
             return
 
-        print(f"\n📊 Total tasks: {len(tasks)}")
         print("-" * 80)
 
-        for i, task in enumerate(tasks, 1):
-            status_emoji = {"todo": "📝", "in_progress": "🔄", "done": "✅"}
-            print(f"{i}. {status_emoji.get(task.status, '📝')} {task.title}")
-            print(f"   🆔 ID: {task.id}")
-            print(f"   📝 Description: {task.description}")
-            print(f"   📊 Status: {task.status}")
-            if task.deadline:
-                # type: ignore[attr-defined] - deadline is Optional[datetime]
-                print(f"   📅 Deadline: {task.deadline.strftime('%Y-%m-%d')}")
-            print(f"   📁 Project ID: {task.project_id[:8]}...")
-            print("-" * 40)
+        i = 0
+        while True:
+            for task in page.items:
+                i += 1
+                status_emoji = {"todo": "📝", "in_progress": "🔄", "done": "✅"}
+                print(f"{i}. {status_emoji.get(task.status, '📝')} {task.title}")
+                print(f"   🆔 ID: {task.id}")
+                print(f"   📝 Description: {task.description}")
+                print(f"   📊 Status: {task.status}")
+                if task.deadline:
+                    # type: ignore[attr-defined] - deadline is Optional[datetime]
+                    print(f"   📅 Deadline: {task.deadline.strftime('%Y-%m-%d')}")
+                print(f"   📁 Project ID: {task.project_id[:8]}...")
+                print("-" * 40)
+
+            if not page.next_cursor:
+                break
+            more = input("Show more tasks? (y/N): ").strip().lower()
+            if more not in ["y", "yes"]:
+                break
+            page = manager.list_tasks_page(
+                project_id=project_id, cursor=page.next_cursor
+            )
+
+        print(f"\n📊 Tasks shown: {i}")
 
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
@@ -132,29 +185,16 @@ def edit_task(manager: TodoManager) -> None:
     try:
         print("\n=== Edit Task ===")
 
-        # Display tasks
-        tasks = manager.list_tasks()
-        if not tasks:
-            print("📝 No tasks available to edit!")
-            return
-
-        print("Available tasks:")
-        for i, task in enumerate(tasks, 1):
-            print(f"{i}. {task.title} (ID: {task.id[:8]}...) - {task.status}")
-
         # Select task
-        try:
-            choice = int(input("\nTask number: ")) - 1
-            if choice < 0 or choice >= len(tasks):
-                print("❌ Invalid number!")
-                return
-
-            selected_task = tasks[choice]
-            task_id = selected_task.id
-
-        except ValueError:
-            print("❌ Please enter a valid number!")
+        selected_task = _select_task(
+            manager,
+            "📝 No tasks available to edit!",
+            "Task number",
+            lambda task: f"{task.title} (ID: {task.id[:8]}...) - {task.status}",
+        )
+        if selected_task is None:
             return
+        task_id = selected_task.id
 
         # Get new information
         print(f"\nEditing task: {selected_task.title}")
@@ -208,27 +248,14 @@ def change_task_status(manager: TodoManager) -> None:
     try:
         print("\n=== Change Task Status ===")
 
-        # Display tasks
-        tasks = manager.list_tasks()
-        if not tasks:
-            print("📝 No tasks available!")
-            return
-
-        print("Available tasks:")
-        for i, task in enumerate(tasks, 1):
-            print(f"{i}. {task.title} - Current status: {task.status}")
-
         # Select task
-        try:
-            choice = int(input("\nTask number: ")) - 1
-            if choice < 0 or choice >= len(tasks):
-                print("❌ Invalid number!")
-                return
-
-            selected_task = tasks[choice]
-
-        except ValueError:
-            print("❌ Please enter a valid number!")
+        selected_task = _select_task(
+            manager,
+            "📝 No tasks available!",
+            "Task number",
+            lambda task: f"{task.title} - Current status: {task.status}",
+        )
+        if selected_task is None:
             return
 
         # Select new status
@@ -260,27 +287,14 @@ def delete_task(manager: TodoManager) -> None:
     try:
         print("\n=== Delete Task ===")
 
-        # Display tasks
-        tasks = manager.list_tasks()
-        if not tasks:
-            print("📝 No tasks available to delete!")
-            return
-
-        print("Available tasks:")
-        for i, task in enumerate(tasks, 1):
-            print(f"{i}. {task.title} (ID: {task.id[:8]}...) - {task.status}")
-
         # Select task
-        try:
-            choice = int(input("\nTask number to delete: ")) - 1
-            if choice < 0 or choice >= len(tasks):
-                print("❌ Invalid number!")
-                return
-
-            selected_task = tasks[choice]
-
-        except ValueError:
-            print("❌ Please enter a valid number!")
+        selected_task = _select_task(
+            manager,
+            "📝 No tasks available to delete!",
+            "Task number to delete",
+            lambda task: f"{task.title} (ID: {task.id[:8]}...) - {task.status}",
+        )
+        if selected_task is None:
             return
 
         # Confirm deletion
@@ -1,15 +1,39 @@
 # commands/close_overdue_tasks.py
 
+import argparse
+
 from core.database import SessionLocal
+from core.events import event_hub
 from core.services.todo_manager import TodoManager
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Close all overdue tasks.")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="close tasks in batches of this size, committing after each "
+        "(default: OVERDUE_BATCH_SIZE)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="only report how many tasks would be closed",
+    )
+    args = parser.parse_args()
+
     db = SessionLocal()
     try:
-        manager = TodoManager(db=db)
-        closed_count = manager.close_overdue_tasks()
-        print(f"✅ Closed {closed_count} overdue tasks.")
+        # Replicas serving GET /events pick the changes up through NOTIFY
+        manager = TodoManager(db=db, events=event_hub)
+        closed_count = manager.close_overdue_tasks(
+            batch_size=args.batch_size, dry_run=args.dry_run
+        )
+        if args.dry_run:
+            print(f"🔎 {closed_count} overdue tasks would be closed.")
+        else:
+            print(f"✅ Closed {closed_count} overdue tasks.")
     finally:
         db.close()
 
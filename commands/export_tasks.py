@@ -0,0 +1,52 @@
+# commands/export_tasks.py
+
+import argparse
+import sys
+
+from core.database import SessionLocal
+from core.services.task_export import EXPORT_FORMATS
+from core.services.todo_manager import TodoManager
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export tasks as NDJSON or CSV.")
+    parser.add_argument(
+        "--format",
+        choices=list(EXPORT_FORMATS),
+        default="ndjson",
+        help="output format (default: ndjson)",
+    )
+    parser.add_argument(
+        "--project-id",
+        default=None,
+        help="only export the tasks of this project",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="file to write to; '-' (the default) writes to stdout",
+    )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    out = (
+        sys.stdout
+        if args.output == "-"
+        else open(args.output, "w", encoding="utf-8", newline="")
+    )
+    try:
+        manager = TodoManager(db=db)
+        for chunk in manager.export_tasks(args.format, project_id=args.project_id):
+            out.write(chunk)
+        out.flush()
+        if out is not sys.stdout:
+            print(f"✅ Exported tasks to {args.output}.", file=sys.stderr)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
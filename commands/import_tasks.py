@@ -0,0 +1,93 @@
+# commands/import_tasks.py
+"""
+Bulk-import tasks from CSV or NDJSON.
+
+Records are read lazily and loaded in batches: each batch is validated
+with the same rules as the API, staged with COPY FROM STDIN (PostgreSQL)
+or a batched INSERT (SQLite) and merged into tasks in one statement.
+Recognized fields: id, project_id, title, description, status, deadline,
+created_at. MAX_TASKS_PER_PROJECT still applies; raise it in the
+environment for large migrations.
+"""
+
+import argparse
+import sys
+import time
+
+from core.database import SessionLocal
+from core.services.task_import import IMPORT_FORMATS, batched, read_task_records
+from core.services.todo_manager import TodoManager
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "path",
+        help="file to read; '-' reads from stdin",
+    )
+    parser.add_argument(
+        "--format",
+        choices=IMPORT_FORMATS,
+        default=None,
+        help="input format (default: from the file extension, ndjson for stdin)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=10000,
+        help="records loaded and committed per batch (default: 10000)",
+    )
+    parser.add_argument(
+        "--max-errors",
+        type=int,
+        default=20,
+        help="number of invalid records to print (default: 20)",
+    )
+    args = parser.parse_args()
+
+    fmt = args.format
+    if fmt is None:
+        fmt = "csv" if args.path.lower().endswith(".csv") else "ndjson"
+
+    db = SessionLocal()
+    fp = (
+        sys.stdin
+        if args.path == "-"
+        else open(args.path, encoding="utf-8", newline="")
+    )
+    read = imported = invalid = 0
+    started = time.perf_counter()
+    try:
+        manager = TodoManager(db=db)
+        for batch in batched(read_task_records(fp, fmt), args.batch_size):
+            result = manager.import_tasks(batch, start=read + 1)
+            read += len(batch)
+            imported += len(result.created)
+            for error in result.errors:
+                if invalid < args.max_errors:
+                    print(f"❌ Record {error.index}: {error.message}", file=sys.stderr)
+                invalid += 1
+            elapsed = time.perf_counter() - started
+            print(
+                f"… {read} read, {imported} imported, {invalid} invalid "
+                f"({read / elapsed:,.0f} records/s)",
+                file=sys.stderr,
+            )
+    finally:
+        if fp is not sys.stdin:
+            fp.close()
+        db.close()
+
+    elapsed = time.perf_counter() - started
+    skipped = read - imported - invalid
+    print(
+        f"✅ Imported {imported} of {read} tasks in {elapsed:.1f}s "
+        f"({imported / elapsed if elapsed else 0:,.0f} tasks/s); "
+        f"{invalid} invalid, {skipped} skipped as duplicates."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+# commands/rebuild_project_stats.py
+
+import argparse
+
+from core.database import SessionLocal
+from core.services.todo_manager import TodoManager
+
+
+def main() -> None:
+    argparse.ArgumentParser(
+        description="Recompute the project_stats summary rows from the tasks."
+    ).parse_args()
+
+    db = SessionLocal()
+    try:
+        manager = TodoManager(db=db)
+        rebuilt = manager.rebuild_project_stats()
+        print(f"✅ Rebuilt statistics of {rebuilt} projects.")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+# commands/reconcile_counters.py
+
+import argparse
+
+from core.database import SessionLocal
+from core.services.todo_manager import TodoManager
+
+
+def main() -> None:
+    argparse.ArgumentParser(
+        description="Repair drift in projects.task_count and the project counter."
+    ).parse_args()
+
+    db = SessionLocal()
+    try:
+        manager = TodoManager(db=db)
+        result = manager.reconcile_counters()
+        print(f"✅ Fixed task_count on {result['task_counts_fixed']} projects.")
+        if result["project_count_drift"]:
+            print(
+                f"✅ Project counter was off by {result['project_count_drift']}; reset."
+            )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+# core/cache/__init__.py
+from typing import Optional
+
+from core.config import Config, settings
+from .backends import CacheBackend, InMemoryCache, RedisCache
+from .entity_cache import EntityCache
+
+
+def build_entity_cache(config: Config) -> Optional[EntityCache]:
+    """Create the cache selected by CACHE_BACKEND, or None when disabled."""
+    if config.CACHE_BACKEND == "none":
+        return None
+    if config.CACHE_BACKEND == "memory":
+        backend: CacheBackend = InMemoryCache(max_entries=config.CACHE_MAX_ENTRIES)
+    elif config.CACHE_BACKEND == "redis":
+        backend = RedisCache.from_url(config.CACHE_REDIS_URL)
+    else:
+        raise ValueError(f"Unknown CACHE_BACKEND '{config.CACHE_BACKEND}'")
+    return EntityCache(backend, ttl=config.CACHE_TTL)
+
+
+# Process-wide cache shared by all requests of this worker
+entity_cache = build_entity_cache(settings)
+
+__all__ = [
+    'CacheBackend',
+    'InMemoryCache',
+    'RedisCache',
+    'EntityCache',
+    'build_entity_cache',
+    'entity_cache',
+]
@@ -0,0 +1,214 @@
+# core/cache/backends.py
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# Key marking a cached value as an invalidation tombstone
+TOMBSTONE = "__invalidated_at__"
+
+
+def _is_tombstone(value: Any) -> bool:
+    return isinstance(value, dict) and TOMBSTONE in value
+
+
+def _invalidated_since(current: Any, loaded_at: float) -> bool:
+    return _is_tombstone(current) and current[TOMBSTONE] >= loaded_at
+
+
+class CacheBackend(ABC):
+    """
+    Key/value store for JSON-serializable values, with hit/miss counters.
+
+    Invalidating a key leaves a short-lived tombstone holding the time of
+    the invalidation. A value loaded before that time is not written back,
+    so a reader racing a writer cannot re-cache the row the writer just
+    replaced. The check and the write are one atomic step of the backend.
+    """
+
+    name = "base"
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    # --- backend specific ---
+    @abstractmethod
+    def _get(self, key: str) -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    def _set(self, key: str, value: Any, ttl: float) -> None:
+        ...
+
+    @abstractmethod
+    def _set_many(self, items: Dict[str, Any], ttl: float) -> None:
+        ...
+
+    @abstractmethod
+    def _set_unless_invalidated(
+        self, key: str, value: Any, ttl: float, loaded_at: float
+    ) -> None:
+        """_set, unless the key was invalidated at or after loaded_at."""
+
+    # --- public API ---
+    def get(self, key: str) -> Optional[Any]:
+        value = self._get(key)
+        if value is None or _is_tombstone(value):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def set(
+        self, key: str, value: Any, ttl: float, loaded_at: Optional[float] = None
+    ) -> None:
+        """
+        Store value. loaded_at is the wall-clock time the value was read
+        from the database; the write is skipped if the key was invalidated
+        at or after that moment.
+        """
+        if loaded_at is None:
+            self._set(key, value, ttl)
+        else:
+            self._set_unless_invalidated(key, value, ttl, loaded_at)
+
+    def delete(self, keys: Iterable[str], ttl: float) -> None:
+        """Invalidate keys, keeping their tombstones for ttl seconds."""
+        keys = tuple(keys)
+        if keys:
+            tombstone = {TOMBSTONE: time.time()}
+            self._set_many(dict.fromkeys(keys, tombstone), ttl)
+            self.invalidations += len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations,
+        }
+
+
+class InMemoryCache(CacheBackend):
+    """Per-process cache with a TTL per entry and LRU eviction."""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            return self._lookup(key)
+
+    def _set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._store(key, value, ttl)
+
+    def _set_many(self, items: Dict[str, Any], ttl: float) -> None:
+        with self._lock:
+            for key, value in items.items():
+                self._store(key, value, ttl)
+
+    def _set_unless_invalidated(
+        self, key: str, value: Any, ttl: float, loaded_at: float
+    ) -> None:
+        with self._lock:
+            if not _invalidated_since(self._lookup(key), loaded_at):
+                self._store(key, value, ttl)
+
+    # Callers hold self._lock
+    def _lookup(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _store(self, key: str, value: Any, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats["entries"] = len(self._entries)
+        return stats
+
+
+class RedisCache(CacheBackend):
+    """
+    Cache shared by all workers, stored in anything speaking the Redis
+    protocol. `client` needs get/set(ex=)/pipeline with WATCH, e.g.
+    redis.Redis or a fakeredis.FakeRedis stand-in. Calls are blocking, so the server should
+    be close to the API workers.
+    """
+
+    name = "redis"
+
+    def __init__(self, client: Any, prefix: str = "todo:") -> None:
+        super().__init__()
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "todo:") -> "RedisCache":
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError(
+                "CACHE_BACKEND=redis requires the 'redis' package (pip install redis)"
+            )
+        return cls(redis.Redis.from_url(url), prefix=prefix)
+
+    def _get(self, key: str) -> Optional[Any]:
+        raw = self.client.get(self.prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    def _set(self, key: str, value: Any, ttl: float) -> None:
+        self.client.set(
+            self.prefix + key, json.dumps(value), ex=max(1, int(ttl))
+        )
+
+    def _set_many(self, items: Dict[str, Any], ttl: float) -> None:
+        pipe = self.client.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.set(self.prefix + key, json.dumps(value), ex=max(1, int(ttl)))
+        pipe.execute()
+
+    def _set_unless_invalidated(
+        self, key: str, value: Any, ttl: float, loaded_at: float
+    ) -> None:
+        from redis.exceptions import WatchError
+
+        name = self.prefix + key
+        with self.client.pipeline() as pipe:
+            while True:
+                try:
+                    # The SET fails if the key changes after the WATCH, so
+                    # an invalidation cannot land between check and write
+                    pipe.watch(name)
+                    raw = pipe.get(name)
+                    current = json.loads(raw) if raw is not None else None
+                    if _invalidated_since(current, loaded_at):
+                        return
+                    pipe.multi()
+                    pipe.set(name, json.dumps(value), ex=max(1, int(ttl)))
+                    pipe.execute()
+                    return
+                except WatchError:
+                    continue
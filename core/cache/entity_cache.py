@@ -0,0 +1,97 @@
+# core/cache/entity_cache.py
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional, Type, TypeVar
+
+from sqlalchemy import DateTime, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from core.cache.backends import CacheBackend
+from core.models.project import Project
+from core.models.task import Task
+
+E = TypeVar("E", Project, Task)
+
+
+class EntityCache:
+    """
+    Read-through cache of Project and Task rows by ID.
+
+    Rows are stored as plain column dicts. On a hit the entity is rebuilt
+    and merged into the caller's session without a SELECT, so it behaves
+    like a normally loaded object.
+
+    Writers invalidate after their commit. An entry may still be stale for
+    at most ttl seconds where that invalidation cannot reach it: with the
+    memory backend, in every other worker process.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float = 60.0) -> None:
+        self.backend = backend
+        self.ttl = ttl
+
+    # --- lookups ---
+    def get_project(
+        self, db: Session, project_id: str, loader: Callable[[str], Optional[Project]]
+    ) -> Optional[Project]:
+        return self._get(db, Project, f"project:{project_id}", project_id, loader)
+
+    def get_task(
+        self, db: Session, task_id: str, loader: Callable[[str], Optional[Task]]
+    ) -> Optional[Task]:
+        return self._get(db, Task, f"task:{task_id}", task_id, loader)
+
+    # --- invalidation ---
+    def invalidate_project(self, project_id: str) -> None:
+        self.backend.delete([f"project:{project_id}"], self.ttl)
+
+    def invalidate_tasks(self, task_ids: Iterable[str]) -> None:
+        self.backend.delete((f"task:{task_id}" for task_id in task_ids), self.ttl)
+
+    def stats(self) -> Dict[str, Any]:
+        return self.backend.stats()
+
+    # --- helpers ---
+    def _get(
+        self,
+        db: Session,
+        model: Type[E],
+        key: str,
+        entity_id: str,
+        loader: Callable[[str], Optional[E]],
+    ) -> Optional[E]:
+        data = self.backend.get(key)
+        if data is not None:
+            # Prefer an instance the session already holds
+            existing = db.identity_map.get(db.identity_key(model, entity_id))
+            if existing is not None:
+                return existing
+            return self._restore(db, model, data)
+
+        # Taken before the SELECT: if a writer invalidates the key after
+        # this point, the row read below may be the old one
+        loaded_at = time.time()
+        entity = loader(entity_id)
+        if entity is not None:
+            self.backend.set(key, self._dump(entity), self.ttl, loaded_at=loaded_at)
+        return entity
+
+    @staticmethod
+    def _dump(entity: Any) -> Dict[str, Any]:
+        data = {}
+        for attr in inspect(entity).mapper.column_attrs:
+            value = getattr(entity, attr.key)
+            data[attr.key] = value.isoformat() if isinstance(value, datetime) else value
+        return data
+
+    @staticmethod
+    def _restore(db: Session, model: Type[E], data: Dict[str, Any]) -> E:
+        values = {}
+        for attr in inspect(model).column_attrs:
+            value = data.get(attr.key)
+            if value is not None and isinstance(attr.columns[0].type, DateTime):
+                value = datetime.fromisoformat(value)
+            values[attr.key] = value
+        entity = model(**values)
+        make_transient_to_detached(entity)
+        return db.merge(entity, load=False)
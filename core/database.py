@@ -1,15 +1,72 @@
 # core/database.py
-from sqlalchemy import create_engine
+from typing import Any, Dict, Type
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
-from core.config import settings   # فرض: settings.DATABASE_URL هست
+from sqlalchemy.pool import Pool
+from core.config import Config, settings   # فرض: settings.DATABASE_URL هست
+from core.pool import TimedAsyncAdaptedQueuePool, TimedQueuePool
 
 DATABASE_URL = settings.DATABASE_URL  # مثل: postgresql://user:pass@db:5432/todolist
 
+
+def engine_options(url: str, poolclass: Type[Pool], config: Config = settings) -> Dict[str, Any]:
+    """Pool settings from Config; SQLite keeps SQLAlchemy's own pool choice."""
+    if url.startswith("sqlite"):
+        return {"pool_pre_ping": config.DB_POOL_PRE_PING}
+    return {
+        "poolclass": poolclass,
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_MAX_OVERFLOW,
+        "pool_timeout": config.DB_POOL_TIMEOUT,
+        "pool_recycle": config.DB_POOL_RECYCLE,
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+    }
+
+
+def enable_sqlite_foreign_keys(engine: Engine) -> None:
+    """SQLite ignores FOREIGN KEY / ON DELETE CASCADE unless enabled per connection."""
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_pragma(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
 # اگر می‌خوای لاگ SQL ببینی، echo=True بذار
-engine = create_engine(DATABASE_URL, echo=False, future=True)
+engine = create_engine(
+    DATABASE_URL,
+    echo=False,
+    future=True,
+    **engine_options(DATABASE_URL, TimedQueuePool),
+)
+enable_sqlite_foreign_keys(engine)
+
+# Session factory. Objects stay loaded after commit: all column defaults
+# are generated in Python, so nothing needs to be re-read from the row.
+SessionLocal = sessionmaker(
+    bind=engine,
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    future=True,
+)
 
-# Session factory
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+# Async engine + session factory for the Web API (asyncpg)
+ASYNC_DATABASE_URL = settings.ASYNC_DATABASE_URL
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=False,
+    **engine_options(ASYNC_DATABASE_URL, TimedAsyncAdaptedQueuePool),
+)
+enable_sqlite_foreign_keys(async_engine.sync_engine)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
 
 # Base class for ORM models
 Base = declarative_base()
@@ -0,0 +1,19 @@
+# core/events/__init__.py
+from core.config import settings
+from .hub import CHANNEL, ChangeEvent, EventHub, Subscription, notify
+from .listener import PostgresEventListener
+
+# Process-wide hub feeding the GET /events streams of this worker
+event_hub = EventHub(
+    buffer_size=settings.EVENTS_BUFFER_SIZE, queue_size=settings.EVENTS_QUEUE_SIZE
+)
+
+__all__ = [
+    'CHANNEL',
+    'ChangeEvent',
+    'EventHub',
+    'PostgresEventListener',
+    'Subscription',
+    'event_hub',
+    'notify',
+]
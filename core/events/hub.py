@@ -0,0 +1,219 @@
+# core/events/hub.py
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set
+
+from sqlalchemy import Text, bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+
+from core.repositories.unit_of_work import after_commit, before_commit
+
+# PostgreSQL NOTIFY channel shared by all replicas
+CHANNEL = "todo_events"
+
+# One notification per event, numbered from change_event_seq in the order
+# given; they are delivered to the listeners only if the transaction commits
+_NOTIFY = text(
+    "SELECT pg_notify(:channel, nextval('change_event_seq') || ' ' || payload) "
+    "FROM unnest(:payloads) AS payload"
+).bindparams(bindparam("payloads", type_=ARRAY(Text)))
+
+
+class ChangeEvent:
+    """A task or project that was created, updated or deleted."""
+
+    __slots__ = ("seq", "entity", "action", "id", "project_id")
+
+    def __init__(
+        self,
+        entity: str,
+        action: str,
+        id: str,
+        project_id: Optional[str] = None,
+        seq: int = 0,
+    ) -> None:
+        self.entity = entity
+        self.action = action
+        self.id = id
+        # For projects their own ID, so a project_id filter covers both
+        self.project_id = project_id
+        self.seq = seq
+
+    @property
+    def type(self) -> str:
+        return f"{self.entity}.{self.action}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "entity": self.entity,
+            "action": self.action,
+            "id": self.id,
+            "project_id": self.project_id,
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), separators=(",", ":"))
+
+    @classmethod
+    def from_notification(cls, payload: str) -> "ChangeEvent":
+        """Parse a "<seq> <json>" NOTIFY payload."""
+        seq, _, data = payload.partition(" ")
+        fields = json.loads(data)
+        return cls(
+            fields["entity"], fields["action"], fields["id"], fields["project_id"], int(seq)
+        )
+
+    def __repr__(self) -> str:
+        return f"ChangeEvent(seq={self.seq}, type='{self.type}', id='{self.id}')"
+
+
+class Subscription:
+    """
+    The events one client has yet to receive. backlog holds the events
+    replayed after its Last-Event-ID, queue the live ones. missed is set
+    when the events after Last-Event-ID are no longer buffered.
+    """
+
+    def __init__(self, queue_size: int, project_id: Optional[str] = None) -> None:
+        self.project_id = project_id
+        self.backlog: List[ChangeEvent] = []
+        self.missed = False
+        # None marks the end of the stream
+        self.queue: "asyncio.Queue[Optional[ChangeEvent]]" = asyncio.Queue(queue_size)
+
+    def wants(self, event: ChangeEvent) -> bool:
+        return self.project_id is None or event.project_id == self.project_id
+
+    def close(self) -> None:
+        """End the stream, dropping whatever is still queued."""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+
+class EventHub:
+    """
+    In-process broadcast of change events to the streams of GET /events.
+
+    TodoManager records events through record(); they are published once
+    the change commits. On PostgreSQL that is a NOTIFY in the same
+    transaction and every replica's PostgresEventListener feeds them back
+    here, numbered from one database sequence; elsewhere they go straight
+    to this hub, numbered locally (a single process is assumed).
+
+    The last buffer_size events are kept so a client can resume after its
+    Last-Event-ID. A client whose queue_size events are still unsent is
+    disconnected rather than slowing the others; it resumes from the
+    buffer. The hub lives on the event loop passed to start(); nothing is
+    delivered before that, e.g. in CLI commands.
+    """
+
+    def __init__(self, buffer_size: int = 10000, queue_size: int = 1000) -> None:
+        self.queue_size = queue_size
+        self._buffer: Deque[ChangeEvent] = deque(maxlen=buffer_size)
+        self._subscriptions: Set[Subscription] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Local numbering starts from the clock, so IDs handed out before a
+        # restart are not taken for new ones
+        self._seq = time.time_ns() // 1000
+
+    # --- producers ---
+    def record(self, db: Session, events: List[ChangeEvent]) -> None:
+        """Publish events about changes made through db once they commit."""
+        if not events:
+            return
+        if db.get_bind().dialect.name == "postgresql":
+            before_commit(db, lambda: notify(db, events))
+        else:
+            after_commit(db, lambda: self._publish_threadsafe(events))
+
+    def publish(self, event: ChangeEvent) -> None:
+        """Buffer a numbered event and queue it for every matching stream."""
+        self._buffer.append(event)
+        for subscription in list(self._subscriptions):
+            if not subscription.wants(event):
+                continue
+            try:
+                subscription.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self.unsubscribe(subscription)
+                subscription.close()
+
+    def receive(self, payload: str) -> None:
+        """Publish an event received through LISTEN."""
+        self.publish(ChangeEvent.from_notification(payload))
+
+    def reset(self) -> None:
+        """
+        Forget the buffered events and end every stream, e.g. after events
+        may have been lost. Clients reconnect and are told to resync.
+        """
+        self._buffer.clear()
+        for subscription in list(self._subscriptions):
+            self.unsubscribe(subscription)
+            subscription.close()
+
+    # --- consumers ---
+    def subscribe(
+        self, last_event_id: Optional[str] = None, project_id: Optional[str] = None
+    ) -> Subscription:
+        """Start receiving events, after last_event_id if given."""
+        subscription = Subscription(self.queue_size, project_id)
+        if last_event_id is not None:
+            replay = self._events_after(last_event_id)
+            if replay is None:
+                subscription.missed = True
+            else:
+                subscription.backlog = [e for e in replay if subscription.wants(e)]
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions.discard(subscription)
+
+    # --- lifecycle ---
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+
+    def stop(self) -> None:
+        """End all streams, e.g. on shutdown."""
+        self._loop = None
+        self.reset()
+
+    # --- helpers ---
+    def _publish_threadsafe(self, events: List[ChangeEvent]) -> None:
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        # Writers may run outside the loop's thread (sync code, threadpool)
+        loop.call_soon_threadsafe(self._publish_local, events)
+
+    def _publish_local(self, events: List[ChangeEvent]) -> None:
+        for event in events:
+            self._seq += 1
+            event.seq = self._seq
+            self.publish(event)
+
+    def _events_after(self, last_event_id: str) -> Optional[List[ChangeEvent]]:
+        """
+        Buffered events following last_event_id, in delivery order; None if
+        it is not buffered (too old, unknown, or from before a reset).
+        """
+        try:
+            seq = int(last_event_id)
+        except ValueError:
+            return None
+        # Delivery order, not seq order: sequence numbers are drawn before
+        # commit, so concurrent transactions may deliver them out of order
+        for offset, event in enumerate(reversed(self._buffer)):
+            if event.seq == seq:
+                return list(self._buffer)[len(self._buffer) - offset :]
+        return None
+
+
+def notify(db: Session, events: List[ChangeEvent]) -> None:
+    """Send events with NOTIFY in db's current transaction."""
+    db.execute(_NOTIFY, {"channel": CHANNEL, "payloads": [e.to_json() for e in events]})
@@ -0,0 +1,61 @@
+# core/events/listener.py
+import asyncio
+import logging
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from core.events.hub import CHANNEL, EventHub
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresEventListener:
+    """
+    LISTEN for the change events every replica sends with NOTIFY and
+    publish them to the local hub.
+
+    Holds one asyncpg connection outside the pool. Whenever it has to
+    reconnect, events may have been missed, so the hub is reset and its
+    clients are told to resync.
+    """
+
+    def __init__(
+        self, engine: AsyncEngine, hub: EventHub, check_interval: float = 15.0
+    ) -> None:
+        self.engine = engine
+        self.hub = hub
+        self.check_interval = check_interval
+
+    async def run(self) -> None:
+        """Listen until cancelled, reconnecting after failures."""
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Change event listener failed; reconnecting")
+            await asyncio.sleep(self.check_interval)
+
+    async def _listen(self) -> None:
+        conn = await self.engine.connect()
+        try:
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.add_listener(CHANNEL, self._on_notify)
+            self.hub.reset()
+            while True:
+                await asyncio.sleep(self.check_interval)
+                # Fails once the connection, and with it LISTEN, is gone
+                await conn.execute(text("SELECT 1"))
+        finally:
+            # A pooled connection would keep listening for its next user
+            await conn.invalidate()
+            await conn.close()
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        try:
+            self.hub.receive(payload)
+        except (KeyError, ValueError):
+            logger.warning("Ignoring malformed change event: %r", payload)
@@ -1,2 +1,6 @@
 from .task import Task
 from .project import Project
+from .entity_counter import EntityCounter
+from .change_event import change_event_seq
+from .tombstone import PENDING_CHANGE, Tombstone
+from .project_stats import ProjectStats
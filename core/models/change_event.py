@@ -0,0 +1,8 @@
+# core/models/change_event.py
+from sqlalchemy import Sequence
+from core.database import Base
+
+# Numbers the change events sent with PostgreSQL NOTIFY (core.events). Every
+# replica draws from it, so an event keeps its ID whichever replica a client
+# reconnects to. Not created on SQLite, where events never leave the process.
+change_event_seq = Sequence("change_event_seq", metadata=Base.metadata)
@@ -0,0 +1,18 @@
+# core/models/entity_counter.py
+from sqlalchemy import BigInteger, Column, String
+from core.database import Base
+
+
+class EntityCounter(Base):
+    """
+    Row counts kept in step with inserts and deletes, so limits such as
+    MAX_PROJECTS are checked with one conditional UPDATE instead of COUNT(*).
+    """
+    __tablename__ = "entity_counters"
+
+    PROJECTS = "projects"
+    # Last change sequence number handed out (tasks/projects change_seq)
+    CHANGES = "changes"
+
+    name = Column(String(50), primary_key=True)
+    value = Column(BigInteger, nullable=False, default=0)
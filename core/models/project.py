@@ -1,16 +1,46 @@
 # core/models/project.py
-from sqlalchemy import Column, String, Text, DateTime
+from sqlalchemy import BigInteger, Column, String, Text, DateTime, Index, Integer
 from sqlalchemy.orm import relationship
 from core.database import Base
+from core.models.tombstone import PENDING_CHANGE
 import datetime
 import uuid
 
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        # Keyset pagination: ORDER BY created_at DESC, id DESC
+        Index("ix_projects_created_at_id", "created_at", "id"),
+        # Name lookups and duplicate detection
+        Index("ix_projects_name", "name", unique=True),
+        # Incremental sync: change_seq > watermark, in (change_seq, id) order
+        Index("ix_projects_change_seq_id", "change_seq", "id"),
+    )
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), index=True)
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    updated_at = Column(
+        DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow
+    )
+    # Denormalized number of tasks, maintained by TodoManager on every task
+    # insert/delete; enforces MAX_TASKS_PER_PROJECT without COUNT(*)
+    task_count = Column(Integer, nullable=False, default=0, server_default="0")
+    # Position in the change sequence, set on every insert and update
+    # except task_count bookkeeping
+    change_seq = Column(
+        BigInteger,
+        nullable=False,
+        default=PENDING_CHANGE,
+        onupdate=PENDING_CHANGE,
+        server_default="0",
+    )
 
-    tasks = relationship("Task", back_populates="project", cascade="all, delete-orphan")
+    # passive_deletes: rely on ON DELETE CASCADE instead of loading tasks
+    tasks = relationship(
+        "Task",
+        back_populates="project",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
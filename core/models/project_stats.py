@@ -0,0 +1,23 @@
+# core/models/project_stats.py
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from core.database import Base
+
+
+class ProjectStats(Base):
+    """
+    Per-project task statistics, kept in step with every task write by
+    TodoManager so dashboards read one row per project instead of
+    aggregating the tasks. Rebuilt from the tasks by
+    commands/rebuild_project_stats.py.
+    """
+    __tablename__ = "project_stats"
+
+    project_id = Column(
+        String(36), ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    # Number of tasks per status (Task.VALID_STATUSES)
+    todo = Column(Integer, nullable=False, default=0, server_default="0")
+    in_progress = Column(Integer, nullable=False, default=0, server_default="0")
+    done = Column(Integer, nullable=False, default=0, server_default="0")
+    # Earliest deadline of a task not done yet, passed or not
+    earliest_deadline = Column(DateTime, nullable=True)
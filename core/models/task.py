@@ -1,22 +1,71 @@
 # core/models/task.py
-from sqlalchemy import Column, String, Text, ForeignKey, DateTime
+from sqlalchemy import (
+    BigInteger, Column, String, Text, ForeignKey, DateTime, Index, text
+)
 from sqlalchemy.orm import relationship
 from core.database import Base
+from core.models.tombstone import PENDING_CHANGE
 import datetime
 import uuid
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Keyset pagination: ORDER BY created_at DESC, id DESC
+        Index("ix_tasks_created_at_id", "created_at", "id"),
+        # list(project_id), ids_by_project and per-project keyset pagination
+        Index("ix_tasks_project_id_created_at_id", "project_id", "created_at", "id"),
+        # List ETags: max(updated_at) per project and across all tasks
+        Index("ix_tasks_project_id_updated_at", "project_id", "updated_at"),
+        Index("ix_tasks_updated_at", "updated_at"),
+        # Incremental sync: change_seq > watermark, in (change_seq, id) order
+        Index("ix_tasks_change_seq_id", "change_seq", "id"),
+        # close_overdue_tasks: deadline < now AND status != 'done'
+        Index(
+            "ix_tasks_open_deadline",
+            "deadline",
+            postgresql_where=text("status <> 'done'"),
+            sqlite_where=text("status <> 'done'"),
+        ),
+        # Project stats: earliest, next and overdue deadlines of open tasks
+        Index(
+            "ix_tasks_project_id_open_deadline",
+            "project_id",
+            "deadline",
+            postgresql_where=text("status <> 'done'"),
+            sqlite_where=text("status <> 'done'"),
+        ),
+        # Keyword search (TaskFilter.q) on PostgreSQL; must stay the same
+        # expression as TaskFilter.search_document for the planner to use it
+        Index(
+            "ix_tasks_search",
+            text("to_tsvector('simple', title || ' ' || coalesce(description, ''))"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
 
     VALID_STATUSES = ["todo", "in_progress", "done"]
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), index=True)
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     status = Column(String(50), default="todo", nullable=False)
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    updated_at = Column(
+        DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow
+    )
     deadline = Column(DateTime, nullable=True)
+    # Position in the change sequence, set on every insert and update
+    change_seq = Column(
+        BigInteger,
+        nullable=False,
+        default=PENDING_CHANGE,
+        onupdate=PENDING_CHANGE,
+        server_default="0",
+    )
 
     # Foreign key to project
-    project_id = Column(String(36), ForeignKey("projects.id"), nullable=True)
+    project_id = Column(
+        String(36), ForeignKey("projects.id", ondelete="CASCADE"), nullable=True
+    )
     project = relationship("Project", back_populates="tasks")
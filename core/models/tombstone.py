@@ -0,0 +1,30 @@
+# core/models/tombstone.py
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, String
+from core.database import Base
+import datetime
+
+# change_seq of rows written by a transaction that has not committed yet.
+# Inserts and updates of tasks, projects and tombstones set it through the
+# column defaults; the unit of work numbers them right before committing
+# (ChangeRepository.stamp_pending).
+PENDING_CHANGE = -1
+
+
+class Tombstone(Base):
+    """
+    A deleted task or project, kept so GET /sync can report the deletion
+    to clients that synced before it.
+    """
+    __tablename__ = "tombstones"
+    __table_args__ = (
+        # Incremental sync: change_seq > watermark, in (change_seq, id) order
+        Index("ix_tombstones_change_seq_entity_id", "change_seq", "entity_id"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    entity = Column(String(16), nullable=False)
+    entity_id = Column(String(36), nullable=False)
+    # For projects their own ID, as in change events
+    project_id = Column(String(36), nullable=True)
+    deleted_at = Column(DateTime, default=datetime.datetime.utcnow)
+    change_seq = Column(BigInteger, nullable=False, default=PENDING_CHANGE)
@@ -0,0 +1,68 @@
+# core/pool.py
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from core.metrics import Histogram
+
+
+class _TimedQueue:
+    """Pool queue proxy recording how long each get() waits."""
+
+    def __init__(self, queue: Any, wait_time: Histogram) -> None:
+        self._queue = queue
+        self._wait_time = wait_time
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        start = time.perf_counter()
+        try:
+            return self._queue.get(block, timeout)
+        finally:
+            self._wait_time.observe(time.perf_counter() - start)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._queue, name)
+
+
+class TimedPoolMixin:
+    """
+    Records how long each checkout waits in the pool's queue for a
+    connection. Opening a new (overflow) connection is not part of the
+    wait; such checkouts count as not waiting at all.
+    """
+
+    wait_time: Histogram
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.wait_time = Histogram()
+        self._pool = _TimedQueue(self._pool, self.wait_time)
+
+
+class TimedQueuePool(TimedPoolMixin, QueuePool):
+    """QueuePool that records how long checkouts wait for a connection."""
+
+
+class TimedAsyncAdaptedQueuePool(TimedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records how long checkouts wait."""
+
+
+def pool_status(engine: Engine) -> Dict[str, Optional[Any]]:
+    """Live usage of an engine's pool; fields the pool does not track are None."""
+    pool = engine.pool
+
+    def stat(name: str) -> Optional[int]:
+        method = getattr(pool, name, None)
+        return method() if callable(method) else None
+
+    wait_time = getattr(pool, "wait_time", None)
+    return {
+        "pool_class": type(pool).__name__,
+        "size": stat("size"),
+        "checked_in": stat("checkedin"),
+        "checked_out": stat("checkedout"),
+        "overflow": stat("overflow"),
+        "wait_time": wait_time.snapshot() if wait_time else None,
+    }
@@ -0,0 +1,66 @@
+# core/profiling.py
+import time
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryProfile:
+    """SQL statements issued while one profile was active, and their total time."""
+
+    __slots__ = ("query_count", "db_time")
+
+    def __init__(self) -> None:
+        self.query_count = 0
+        self.db_time = 0.0
+
+
+# Set per request by the profiling middleware. Context variables follow the
+# request into the threadpool and into run_sync greenlets, so the engine
+# hooks below see the profile of the request that issued the statement.
+_current_profile: ContextVar[Optional[QueryProfile]] = ContextVar(
+    "query_profile", default=None
+)
+
+_START = "profiling_start"
+
+
+def start_profile() -> Any:
+    """Begin collecting into a new QueryProfile; returns a token for end_profile."""
+    return _current_profile.set(QueryProfile())
+
+
+def current_profile() -> Optional[QueryProfile]:
+    return _current_profile.get()
+
+
+def end_profile(token: Any) -> None:
+    _current_profile.reset(token)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Count statements and their time for the active QueryProfile (idempotent)."""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    if _current_profile.get() is not None:
+        conn.info.setdefault(_START, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    profile = _current_profile.get()
+    starts = conn.info.get(_START)
+    if profile is None or not starts:
+        return
+    profile.query_count += 1
+    profile.db_time += time.perf_counter() - starts.pop()
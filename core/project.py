@@ -1,19 +1,26 @@
 # ...existing code...
 # core/project.py
 import uuid
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Optional
 
 if TYPE_CHECKING:
     from .task import Task  # for type checking only
 
 
 class Project:
-    """Represents a project in the ToDoList."""
+    """
+    Represents a project in the ToDoList.
+
+    tasks maps task id to Task (in insertion order), so tasks are found
+    and removed in O(1).
+    """
+
+    __slots__ = ("id", "name", "description", "tasks")
 
     id: str
     name: str
     description: str
-    tasks: List["Task"]
+    tasks: Dict[str, "Task"]
 
     def __init__(self, name: str, description: str, id: Optional[str] = None) -> None:
         """
@@ -25,15 +32,22 @@ class Project:
         self.id = id if id else str(uuid.uuid4())
         self.name = name
         self.description = description
-        self.tasks = []
+        self.tasks = {}
 
     def add_task(self, task: "Task") -> None:
         """Add a new task to the project"""
-        self.tasks.append(task)
+        self.tasks[task.id] = task
+
+    def add_tasks(self, tasks: Iterable["Task"]) -> None:
+        """Add many tasks at once"""
+        self.tasks.update((task.id, task) for task in tasks)
+
+    def get_task(self, task_id: str) -> Optional["Task"]:
+        return self.tasks.get(task_id)
 
     def remove_task(self, task_id: str) -> None:
         """Remove a task by its ID (Cascade Delete)"""
-        self.tasks = [t for t in self.tasks if t.id != task_id]
+        self.tasks.pop(task_id, None)
 
     def edit(self, name: Optional[str] = None, description: Optional[str] = None) -> None:
         """Edit the project's name and description"""
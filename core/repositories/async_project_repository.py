@@ -0,0 +1,28 @@
+# core/repositories/async_project_repository.py
+from typing import Any, Callable, List
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models.project import Project
+from core.repositories.project_repository import ProjectRepository
+
+
+class AsyncProjectRepository:
+    """
+    Async data access layer for Project model.
+
+    Runs the ProjectRepository queries on the AsyncSession's connection
+    (AsyncSession.run_sync), so the SQL is shared with the sync stack.
+    Only the reads AsyncTodoManager issues directly live here; everything
+    else goes through the wrapped TodoManager.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.sync = ProjectRepository(db.sync_session)
+
+    async def _run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return await self.db.run_sync(lambda _: fn(*args, **kwargs))
+
+    # --- READ ---
+    async def list(self, with_task_counts: bool = False) -> List[Project]:
+        return await self._run(self.sync.list, with_task_counts=with_task_counts)
@@ -0,0 +1,41 @@
+# core/repositories/async_task_repository.py
+from typing import Any, AsyncIterator, Callable, List, Optional, Sequence
+from sqlalchemy import RowMapping
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models.task import Task
+from core.repositories.task_repository import TaskRepository
+
+
+class AsyncTaskRepository:
+    """
+    Async data access layer for Task model.
+
+    Runs the TaskRepository queries on the AsyncSession's connection
+    (AsyncSession.run_sync), so the SQL is shared with the sync stack.
+    Only the reads AsyncTodoManager issues directly live here; everything
+    else goes through the wrapped TodoManager.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.sync = TaskRepository(db.sync_session)
+
+    async def _run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return await self.db.run_sync(lambda _: fn(*args, **kwargs))
+
+    # --- READ ---
+    async def list(self, project_id: Optional[str] = None) -> List[Task]:
+        return await self._run(self.sync.list, project_id=project_id)
+
+    async def stream(
+        self, batch_size: int, project_id: Optional[str] = None
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        """Async server-side cursor counterpart of TaskRepository.stream."""
+        result = await self.db.stream(
+            TaskRepository.export_query(project_id).execution_options(
+                yield_per=batch_size
+            )
+        )
+        async for partition in result.mappings().partitions():
+            yield partition
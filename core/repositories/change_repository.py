@@ -0,0 +1,204 @@
+# core/repositories/change_repository.py
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Column, Table, insert, select, tuple_, update
+from sqlalchemy.orm import Session
+
+from core.models.entity_counter import EntityCounter
+from core.models.project import Project
+from core.models.task import Task
+from core.models.tombstone import PENDING_CHANGE, Tombstone
+from core.repositories.dialect import dialect_insert
+from core.repositories.pagination import decode_sync_token, encode_sync_token
+
+
+class ChangeSet:
+    """
+    One page of incremental sync: tasks and projects created or updated,
+    and those deleted, after a token. next_token continues from here.
+    """
+
+    projects: List[Project]
+    tasks: List[Task]
+    deleted: List[Dict[str, Optional[str]]]
+    next_token: str
+    has_more: bool
+
+    def __init__(
+        self,
+        projects: List[Project],
+        tasks: List[Task],
+        deleted: List[Dict[str, Optional[str]]],
+        next_token: str,
+        has_more: bool,
+    ) -> None:
+        self.projects = projects
+        self.tasks = tasks
+        self.deleted = deleted
+        self.next_token = next_token
+        self.has_more = has_more
+
+    def __repr__(self) -> str:
+        return (
+            f"ChangeSet(projects={len(self.projects)}, tasks={len(self.tasks)}, "
+            f"deleted={len(self.deleted)}, has_more={self.has_more})"
+        )
+
+
+class ChangeRepository:
+    """
+    Change sequence numbers for incremental sync.
+
+    Rows written by a transaction carry change_seq PENDING_CHANGE until
+    stamp_pending() numbers them right before it commits. Numbers come from
+    the "changes" counter row, which then stays locked until that commit,
+    so they are handed out in commit order: once a number is visible, so
+    are all smaller ones, and a reader never skips a change by moving its
+    watermark past a transaction that commits later.
+    """
+
+    # Kinds of sync items, in the order they are listed within one number
+    KINDS = ("deleted", "project", "task")
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    # --- WRITE ---
+    def add_tombstones(
+        self, entity: str, deleted: Sequence[Tuple[str, Optional[str]]]
+    ) -> None:
+        """Record deleted (id, project_id) pairs. Does not commit."""
+        self.db.execute(
+            insert(Tombstone),
+            [
+                {"entity": entity, "entity_id": entity_id, "project_id": project_id}
+                for entity_id, project_id in deleted
+            ],
+        )
+
+    def stamp_pending(self, tables: Sequence[Table]) -> int:
+        """
+        Number the rows of tables written in this transaction with the next
+        change sequence number, which is returned. Call it last before
+        committing: the counter row is locked from here on.
+        """
+        seq = self._next_seq()
+        for table in tables:
+            values: Dict[str, Any] = {"change_seq": seq}
+            if "updated_at" in table.c:
+                # Numbering is not a change of its own
+                values["updated_at"] = table.c.updated_at
+            self.db.execute(
+                update(table).where(table.c.change_seq == PENDING_CHANGE).values(**values)
+            )
+        return seq
+
+    # --- READ ---
+    def watermark(self) -> int:
+        """The highest change sequence number committed so far."""
+        value = self.db.scalar(
+            select(EntityCounter.value).where(EntityCounter.name == EntityCounter.CHANGES)
+        )
+        return value or 0
+
+    def changes_since(self, token: Optional[str], limit: int) -> ChangeSet:
+        """
+        Up to limit items changed after token, oldest change first. Without
+        a token, every task and project (deleted ones are left out).
+
+        Items are ordered by (change_seq, kind, id) and each kind is read
+        with one range scan over its (change_seq, id) index. Only numbers up
+        to the watermark read first are listed: all of those have committed.
+        """
+        watermark = self.watermark()
+        if token is None:
+            # First sync: deletions before it concern nothing the client has
+            position: Optional[Tuple[int, Optional[str], Optional[str]]] = None
+            deleted_after = watermark
+        else:
+            seq, kind, id, deleted_after = decode_sync_token(token)
+            if kind not in (None,) + self.KINDS or seq > watermark:
+                raise ValueError("Invalid sync token")
+            position = (seq, kind, id)
+
+        items: List[Tuple[int, str, str, Any]] = []
+        for kind, model, id_column in (
+            ("deleted", Tombstone, Tombstone.entity_id),
+            ("project", Project, Project.id),
+            ("task", Task, Task.id),
+        ):
+            conditions = [model.change_seq <= watermark]
+            conditions += self._after(kind, model.change_seq, id_column, position)
+            if kind == "deleted":
+                conditions.append(model.change_seq > deleted_after)
+            rows = self.db.scalars(
+                select(model)
+                .where(*conditions)
+                .order_by(model.change_seq, id_column)
+                .limit(limit + 1),
+                # Rows in the identity map still hold their pending number
+                execution_options={"populate_existing": True},
+            )
+            for row in rows:
+                row_id = row.entity_id if kind == "deleted" else row.id
+                items.append((row.change_seq, kind, row_id, row))
+
+        items.sort(key=lambda item: item[:3])
+        page = items[:limit]
+        has_more = len(items) > limit
+        if has_more:
+            seq, kind, id, _ = page[-1]
+            next_token = encode_sync_token(seq, kind, id, deleted_after)
+        else:
+            next_token = encode_sync_token(watermark, None, None, watermark)
+
+        # An ID deleted and then re-created (imports keep legacy IDs) is
+        # listed as the row only
+        present = {item_id for _, kind, item_id, _ in page if kind != "deleted"}
+        return ChangeSet(
+            projects=[row for _, kind, _, row in page if kind == "project"],
+            tasks=[row for _, kind, _, row in page if kind == "task"],
+            deleted=[
+                {"entity": row.entity, "id": row.entity_id, "project_id": row.project_id}
+                for _, kind, item_id, row in page
+                if kind == "deleted" and item_id not in present
+            ],
+            next_token=next_token,
+            has_more=has_more,
+        )
+
+    # --- HELPERS ---
+    def _next_seq(self) -> int:
+        counter = EntityCounter.__table__
+        seq = self.db.scalar(
+            update(counter)
+            .where(counter.c.name == EntityCounter.CHANGES)
+            .values(value=counter.c.value + 1)
+            .returning(counter.c.value)
+        )
+        if seq is None:
+            # Counter missing (schema built without migrations)
+            self.db.execute(
+                dialect_insert(self.db)(counter)
+                .values(name=EntityCounter.CHANGES, value=0)
+                .on_conflict_do_nothing(index_elements=["name"])
+            )
+            return self._next_seq()
+        return seq
+
+    @staticmethod
+    def _after(
+        kind: str,
+        seq_column: Column,
+        id_column: Column,
+        position: Optional[Tuple[int, Optional[str], Optional[str]]],
+    ) -> list:
+        """Keyset condition: items of kind ordered after position."""
+        if position is None:
+            return []
+        seq, after_kind, after_id = position
+        if after_kind is None or kind < after_kind:
+            return [seq_column > seq]
+        if kind > after_kind:
+            return [seq_column >= seq]
+        return [tuple_(seq_column, id_column) > tuple_(seq, after_id)]
@@ -0,0 +1,15 @@
+# core/repositories/dialect.py
+from typing import Callable
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+def dialect_insert(db: Session) -> Callable:
+    """
+    insert() of the session's dialect, for INSERT ... ON CONFLICT
+    (supported by both PostgreSQL and SQLite).
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert
+    return sqlite.insert
@@ -0,0 +1,90 @@
+# core/repositories/pagination.py
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class Page(Generic[T]):
+    """One page of a keyset-paginated listing."""
+
+    items: List[T]
+    next_cursor: Optional[str]
+
+    def __init__(self, items: List[T], next_cursor: Optional[str] = None) -> None:
+        self.items = items
+        self.next_cursor = next_cursor
+
+    def __repr__(self) -> str:
+        return f"Page(items={len(self.items)}, next_cursor={self.next_cursor!r})"
+
+
+def encode_cursor(created_at: datetime, id: str) -> str:
+    """Encode the (created_at, id) keyset position as an opaque string."""
+    raw = json.dumps([created_at.isoformat(), id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a cursor produced by encode_cursor, raising ValueError if invalid."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), str(id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise ValueError("Invalid cursor")
+
+
+def encode_sort_cursor(sort: str, value: Any, id: str) -> str:
+    """Encode the (value, id) keyset position of a listing ordered by sort."""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([sort, value, id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_sort_cursor(
+    cursor: str, sort: str, is_datetime: bool = False
+) -> Tuple[Any, str]:
+    """
+    Decode a cursor produced by encode_sort_cursor for the same sort,
+    raising ValueError if it is invalid or was issued for another order.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, value, id = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise ValueError("Invalid cursor")
+    if cursor_sort != sort:
+        raise ValueError("Cursor was issued for a different sort order")
+    if is_datetime and value is not None:
+        try:
+            value = datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            raise ValueError("Invalid cursor")
+    return value, str(id)
+
+
+def encode_sync_token(
+    seq: int, kind: Optional[str], id: Optional[str], deleted_after: int
+) -> str:
+    """
+    Encode a position in the change sequence: after (seq, kind, id), or
+    after all of seq when kind is None. Deletions numbered deleted_after
+    or lower are not reported.
+    """
+    raw = json.dumps([seq, kind, id, deleted_after]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_sync_token(token: str) -> Tuple[int, Optional[str], Optional[str], int]:
+    """Decode a token produced by encode_sync_token, raising ValueError if invalid."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        seq, kind, id, deleted_after = json.loads(base64.urlsafe_b64decode(padded))
+        return int(seq), kind, id, int(deleted_after)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise ValueError("Invalid sync token")
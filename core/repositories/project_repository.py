@@ -1,8 +1,22 @@
 # core/repositories/project_repository.py
-from typing import List, Optional
-from sqlalchemy.orm import Session
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import Case, Row, Select, bindparam, case, func, select, tuple_, update
+from sqlalchemy.orm import Query, Session, aliased
 
+from core.models.entity_counter import EntityCounter
 from core.models.project import Project
+from core.models.tombstone import PENDING_CHANGE
+from core.models.task import Task
+from core.repositories.dialect import dialect_insert
+from core.repositories.pagination import Page, decode_cursor, encode_cursor
+from core.repositories.projection import as_dicts, field_names
+from core.repositories.unit_of_work import commit
+
+
+# Fields a sparse listing (list_page(fields=...)) may select
+PROJECT_FIELDS = ("id", "name", "description", "created_at", "updated_at", "task_counts")
 
 
 class ProjectRepository:
@@ -15,8 +29,7 @@ class ProjectRepository:
     def create(self, name: str, description: Optional[str] = None) -> Project:
         project = Project(name=name, description=description)
         self.db.add(project)
-        self.db.commit()
-        self.db.refresh(project)
+        commit(self.db)
         return project
 
     # --- READ ---
@@ -34,17 +47,336 @@ class ProjectRepository:
             .first()
         )
 
-    def list(self) -> List[Project]:
-        return (
-            self.db.query(Project)
-            .order_by(Project.created_at.desc())
-            .all()
+    def task_counts(self, project_ids: Iterable[str]) -> Dict[str, int]:
+        """Denormalized task_count of each existing project, in one query."""
+        ids = list(project_ids)
+        if not ids:
+            return {}
+        rows = self.db.execute(
+            select(Project.id, Project.task_count).where(Project.id.in_(ids))
         )
+        return {project_id: count for project_id, count in rows}
+
+    def list(self, with_task_counts: bool = False) -> List[Project]:
+        """
+        All projects, newest first.
+        With with_task_counts, each project gets a task_counts dict
+        ({status: count}) loaded in the same query.
+        """
+        query = self.db.query(Project).order_by(Project.created_at.desc())
+        return self._fetch(query, with_task_counts)
+
+    def list_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        with_task_counts: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page[Any]:
+        """
+        Keyset-paginated listing ordered by (created_at, id) descending.
+
+        With fields, only those columns (and id) are selected and the items
+        are plain dicts; task_counts is then included only if it is one of
+        the fields.
+        """
+        after = []
+        if cursor:
+            created_at, project_id = decode_cursor(cursor)
+            after.append(
+                tuple_(Project.created_at, Project.id) < tuple_(created_at, project_id)
+            )
+        order = (Project.created_at.desc(), Project.id.desc())
+
+        if fields is None:
+            query = self.db.query(Project).filter(*after).order_by(*order)
+            rows: List[Any] = self._fetch(query.limit(limit + 1), with_task_counts)
+            items: List[Any] = rows
+        else:
+            names = field_names(fields, PROJECT_FIELDS)
+            columns = [n for n in names if n != "task_counts"]
+            # created_at is needed for the cursor even when not returned
+            selected = columns if "created_at" in columns else columns + ["created_at"]
+            stmt = (
+                select(*(getattr(Project, n) for n in selected))
+                .where(*after)
+                .order_by(*order)
+                .limit(limit + 1)
+            )
+            rows = self._fetch_columns(stmt, "task_counts" in names)
+            items = as_dicts(rows, columns)
+            if "task_counts" in names:
+                for item, row in zip(items, rows):
+                    item["task_counts"] = {
+                        status: getattr(row, status) for status in Task.VALID_STATUSES
+                    }
+
+        next_cursor = None
+        if len(rows) > limit:
+            items = items[:limit]
+            last = rows[limit - 1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        return Page(items=items, next_cursor=next_cursor)
+
+    def change_marker(self) -> Tuple[Optional[datetime], int, Optional[datetime], int]:
+        """
+        (max(updated_at), count) of projects and of tasks, for list ETags.
+        Tasks are included because project listings carry task counts; their
+        count is the sum of projects.task_count rather than a table scan.
+        """
+        row = self.db.execute(
+            select(
+                select(func.max(Project.updated_at)).scalar_subquery(),
+                select(func.count()).select_from(Project).scalar_subquery(),
+                select(func.max(Task.updated_at)).scalar_subquery(),
+                select(
+                    func.coalesce(func.sum(Project.task_count), 0)
+                ).scalar_subquery(),
+            )
+        ).one()
+        return tuple(row)
 
     def count(self) -> int:
         return self.db.query(Project).count()
 
+    def update_by_name(self, name: str, description: str) -> Optional[Project]:
+        """Set the description of the project called name. Does not commit."""
+        now = datetime.utcnow()
+        return self.db.scalars(
+            update(Project)
+            .where(Project.name == name)
+            .values(
+                description=description,
+                updated_at=self._touched(description, now, Project.updated_at),
+                change_seq=self._touched(description, PENDING_CHANGE, Project.change_seq),
+            )
+            .returning(Project),
+            execution_options={"populate_existing": True},
+        ).first()
+
+    def upsert(self, name: str, description: str) -> Tuple[Project, bool]:
+        """
+        INSERT ... ON CONFLICT (name) DO UPDATE SET description, in one
+        statement. Does not commit; returns the project and whether the
+        row was inserted (it keeps the generated id only when it was).
+        """
+        new_id = str(uuid.uuid4())
+        now = datetime.utcnow()
+        stmt = dialect_insert(self.db)(Project).values(
+            id=new_id,
+            name=name,
+            description=description,
+            created_at=now,
+            updated_at=now,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Project.name],
+            set_={
+                "description": stmt.excluded.description,
+                "updated_at": self._touched(
+                    stmt.excluded.description, now, Project.updated_at
+                ),
+                "change_seq": self._touched(
+                    stmt.excluded.description, PENDING_CHANGE, Project.change_seq
+                ),
+            },
+        ).returning(Project)
+        project = self.db.scalars(
+            stmt, execution_options={"populate_existing": True}
+        ).one()
+        return project, project.id == new_id
+
     # --- DELETE ---
     def delete(self, project: Project) -> None:
         self.db.delete(project)
-        self.db.commit()
+        commit(self.db)
+
+    # --- COUNTERS ---
+    # None of these commit: the caller commits them together with the
+    # insert/delete they account for, so a failed write leaves no drift.
+
+    def reserve_project_slot(self, limit: int) -> bool:
+        """
+        Count one more project unless limit is reached, as a single
+        conditional UPDATE (race-free under concurrent creates).
+        """
+        counter = EntityCounter.__table__
+        reserved = self.db.execute(
+            update(counter)
+            .where(counter.c.name == EntityCounter.PROJECTS, counter.c.value < limit)
+            .values(value=counter.c.value + 1)
+            .returning(counter.c.name)
+        ).first()
+        if reserved is None and self._seed_project_counter():
+            return self.reserve_project_slot(limit)
+        return reserved is not None
+
+    def release_project_slot(self) -> None:
+        counter = EntityCounter.__table__
+        self.db.execute(
+            update(counter)
+            .where(counter.c.name == EntityCounter.PROJECTS)
+            .values(value=counter.c.value - 1)
+        )
+
+    def reserve_task_slots(self, project_id: str, count: int, limit: int) -> bool:
+        """
+        Add count to the project's task_count unless that would exceed
+        limit. Returns False if the project is full or does not exist.
+        """
+        projects = Project.__table__
+        reserved = self.db.execute(
+            update(projects)
+            .where(
+                projects.c.id == project_id,
+                projects.c.task_count + count <= limit,
+            )
+            .values(
+                task_count=projects.c.task_count + count,
+                # Counter bookkeeping is not a change to the project itself
+                updated_at=projects.c.updated_at,
+                change_seq=projects.c.change_seq,
+            )
+            .returning(projects.c.id)
+        ).first()
+        return reserved is not None
+
+    def adjust_task_counts(self, deltas: Dict[str, int]) -> None:
+        """Add deltas ({project_id: +/-n}) to task_count with one executemany."""
+        params = [
+            {"project_key": project_id, "delta": delta}
+            for project_id, delta in deltas.items()
+            if project_id is not None and delta
+        ]
+        if not params:
+            return
+        projects = Project.__table__
+        self.db.execute(
+            update(projects)
+            .where(projects.c.id == bindparam("project_key"))
+            .values(
+                task_count=projects.c.task_count + bindparam("delta"),
+                updated_at=projects.c.updated_at,
+                change_seq=projects.c.change_seq,
+            ),
+            params,
+        )
+
+    def reconcile_task_counts(self) -> int:
+        """Recompute drifted task_count values; returns how many were fixed."""
+        projects = Project.__table__
+        actual = (
+            select(func.count())
+            .select_from(Task)
+            .where(Task.project_id == projects.c.id)
+            .scalar_subquery()
+        )
+        result = self.db.execute(
+            update(projects)
+            .where(projects.c.task_count != actual)
+            .values(
+                task_count=actual,
+                updated_at=projects.c.updated_at,
+                change_seq=projects.c.change_seq,
+            )
+        )
+        return result.rowcount
+
+    def reconcile_project_count(self) -> int:
+        """Reset the projects counter to COUNT(*); returns the drift fixed."""
+        actual = self.count()
+        counter = self.db.scalar(
+            select(EntityCounter.value).where(
+                EntityCounter.name == EntityCounter.PROJECTS
+            )
+        )
+        if counter is None:
+            self._seed_project_counter()
+            return 0
+        if counter != actual:
+            counter_table = EntityCounter.__table__
+            self.db.execute(
+                update(counter_table)
+                .where(counter_table.c.name == EntityCounter.PROJECTS)
+                .values(value=actual)
+            )
+        return counter - actual
+
+    def _seed_project_counter(self) -> bool:
+        """
+        Create the projects counter from COUNT(*) if it is missing (schema
+        built without migrations). Returns True if a row was inserted.
+        """
+        insert = dialect_insert(self.db)
+        result = self.db.execute(
+            insert(EntityCounter.__table__)
+            .values(name=EntityCounter.PROJECTS, value=self.count())
+            .on_conflict_do_nothing(index_elements=["name"])
+        )
+        return result.rowcount == 1
+
+    # --- HELPERS ---
+    @staticmethod
+    def _touched(description: Any, new: Any, current: Any) -> Case:
+        """
+        updated_at / change_seq for an upsert: new, or current when the
+        description is unchanged.
+        """
+        return case(
+            (Project.description.is_distinct_from(description), new),
+            else_=current,
+        )
+
+    def _fetch(self, query: Query, with_task_counts: bool) -> List[Project]:
+        """
+        Run a project query, optionally attaching per-status task counts.
+
+        The counts come from one GROUP BY over the (already limited) project
+        rows joined to their tasks, so there is no query per project and no
+        task rows are loaded.
+        """
+        if not with_task_counts:
+            return query.all()
+
+        selected = query.subquery()
+        project = aliased(Project, selected)
+        counts = [
+            func.count(case((Task.status == status, 1))).label(status)
+            for status in Task.VALID_STATUSES
+        ]
+        rows = (
+            self.db.query(project, *counts)
+            .outerjoin(Task, Task.project_id == project.id)
+            .group_by(*selected.c)
+            .order_by(project.created_at.desc(), project.id.desc())
+            .all()
+        )
+
+        projects = []
+        for row in rows:
+            project_row = row[0]
+            project_row.task_counts = dict(zip(Task.VALID_STATUSES, row[1:]))
+            projects.append(project_row)
+        return projects
+
+    def _fetch_columns(self, stmt: Select, with_task_counts: bool) -> List[Row]:
+        """
+        Column-only counterpart of _fetch returning Core rows. With
+        with_task_counts, each row also has one count column per status.
+        """
+        if not with_task_counts:
+            return list(self.db.execute(stmt))
+
+        selected = stmt.subquery()
+        counts = [
+            func.count(case((Task.status == status, 1))).label(status)
+            for status in Task.VALID_STATUSES
+        ]
+        return list(
+            self.db.execute(
+                select(selected, *counts)
+                .outerjoin(Task, Task.project_id == selected.c.id)
+                .group_by(*selected.c)
+                .order_by(selected.c.created_at.desc(), selected.c.id.desc())
+            )
+        )
@@ -0,0 +1,23 @@
+# core/repositories/projection.py
+from typing import Any, Dict, List, Sequence
+
+
+def field_names(fields: Sequence[str], allowed: Sequence[str]) -> List[str]:
+    """
+    Validate the fields requested for a sparse listing. id is always
+    included; unknown names raise ValueError.
+    """
+    names = ["id"]
+    for name in fields:
+        if name not in allowed:
+            raise ValueError(
+                f"Unknown field: {name}. Use any of {', '.join(allowed)}"
+            )
+        if name not in names:
+            names.append(name)
+    return names
+
+
+def as_dicts(rows: Sequence[Any], names: Sequence[str]) -> List[Dict[str, Any]]:
+    """Plain dicts holding only the named attributes of each row."""
+    return [{name: getattr(row, name) for name in names} for row in rows]
@@ -0,0 +1,218 @@
+# core/repositories/stats_repository.py
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import (
+    DateTime,
+    bindparam,
+    case,
+    delete,
+    func,
+    insert,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.orm import Session
+
+from core.models.project import Project
+from core.models.project_stats import ProjectStats
+from core.models.task import Task
+
+# (project_id, status, deadline) of one task, before or after a write
+TaskState = Tuple[Optional[str], str, Optional[datetime]]
+
+
+class ProjectStatsRepository:
+    """
+    Data access layer for ProjectStats.
+
+    Task writes report the state of the tasks before and after them to
+    apply(), which adds the differences to each project's row. Whether an
+    open task is overdue changes with time alone, so only the earliest open
+    deadline is stored; overdue counts and the next deadline are read from
+    the tasks of the projects whose earliest deadline has passed.
+    """
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    # --- CREATE ---
+    def create(self, project_id: str) -> None:
+        """Start the (empty) statistics of a new project. Does not commit."""
+        self.db.execute(insert(ProjectStats).values(project_id=project_id))
+
+    # --- READ ---
+    def get(self, project_id: str, now: datetime) -> Optional[ProjectStats]:
+        """A project's statistics, with overdue and next_deadline as of now."""
+        rows = self._read(
+            select(ProjectStats).where(ProjectStats.project_id == project_id), now
+        )
+        return rows[0] if rows else None
+
+    def list(self, now: datetime) -> List[ProjectStats]:
+        """Statistics of every project, with overdue and next_deadline as of now."""
+        return self._read(select(ProjectStats).order_by(ProjectStats.project_id), now)
+
+    # --- UPDATE ---
+    def apply(self, before: Iterable[TaskState], after: Iterable[TaskState]) -> None:
+        """
+        Update the statistics for tasks written from the before states to
+        the after states (a created task has no before state, a deleted one
+        no after state). One executemany for the counts and earliest
+        deadlines; projects that lost their earliest deadline get it
+        recomputed from the open-deadline index, so call it once the task
+        writes are flushed. Does not commit.
+        """
+        deltas: Dict[str, Counter] = defaultdict(Counter)
+        # Open deadlines per project, before and after
+        removed: Dict[str, Counter] = defaultdict(Counter)
+        added: Dict[str, Counter] = defaultdict(Counter)
+        for states, sign, deadlines in ((before, -1, removed), (after, 1, added)):
+            for project_id, status, deadline in states:
+                if project_id is None:
+                    continue
+                deltas[project_id][status] += sign
+                if status != "done" and deadline is not None:
+                    deadlines[project_id][deadline] += 1
+
+        params: List[Dict[str, Any]] = []
+        rescans: List[Dict[str, Any]] = []
+        # Sorted, so concurrent writers lock the rows in the same order
+        for project_id in sorted(deltas):
+            counts = {
+                f"delta_{status}": deltas[project_id][status]
+                for status in Task.VALID_STATUSES
+            }
+            came = added[project_id] - removed[project_id]
+            went = removed[project_id] - added[project_id]
+            if not any(counts.values()) and not came and not went:
+                continue
+            earliest_added = min(came, default=None)
+            params.append(
+                {"project_key": project_id, "deadline": earliest_added, **counts}
+            )
+            if went:
+                rescans.append({"project_key": project_id, "deadline": min(went)})
+        if not params:
+            return
+
+        stats = ProjectStats.__table__
+        earliest = stats.c.earliest_deadline
+        candidate = bindparam("deadline", type_=DateTime)
+        self.db.execute(
+            update(stats)
+            .where(stats.c.project_id == bindparam("project_key"))
+            .values(
+                **{
+                    status: stats.c[status] + bindparam(f"delta_{status}")
+                    for status in Task.VALID_STATUSES
+                },
+                earliest_deadline=case(
+                    (candidate.is_(None), earliest),
+                    (earliest.is_(None), candidate),
+                    (candidate < earliest, candidate),
+                    else_=earliest,
+                ),
+            ),
+            params,
+        )
+        if rescans:
+            # Runs after the row lock above is taken, so on PostgreSQL it
+            # sees the tasks of every writer that updated the row before
+            self.db.execute(
+                update(stats)
+                .where(
+                    stats.c.project_id == bindparam("project_key"),
+                    earliest >= bindparam("deadline", type_=DateTime),
+                )
+                .values(
+                    earliest_deadline=select(func.min(Task.deadline))
+                    .where(
+                        Task.project_id == bindparam("project_key"),
+                        Task.status != "done",
+                    )
+                    .scalar_subquery()
+                ),
+                rescans,
+            )
+
+    def rebuild(self) -> int:
+        """
+        Recompute every project's statistics from its tasks, e.g. after
+        manual SQL. Returns the number of projects. Does not commit.
+        """
+        if self.db.get_bind().dialect.name == "postgresql":
+            # Writers wait for the rebuild and then apply their changes to
+            # the new rows; a rebuild waits for writers that already did
+            self.db.execute(
+                text("LOCK TABLE project_stats IN SHARE ROW EXCLUSIVE MODE")
+            )
+        self.db.execute(delete(ProjectStats))
+        aggregate = (
+            select(
+                Project.id,
+                *[
+                    func.count(case((Task.status == status, 1)))
+                    for status in Task.VALID_STATUSES
+                ],
+                func.min(case((Task.status != "done", Task.deadline))),
+            )
+            .outerjoin(Task, Task.project_id == Project.id)
+            .group_by(Project.id)
+        )
+        result = self.db.execute(
+            insert(ProjectStats).from_select(
+                ["project_id", *Task.VALID_STATUSES, "earliest_deadline"], aggregate
+            )
+        )
+        return result.rowcount
+
+    # --- HELPERS ---
+    def _read(self, query: Any, now: datetime) -> List[ProjectStats]:
+        """
+        Run a ProjectStats query and set overdue and next_deadline on each
+        row. Only projects whose earliest open deadline has passed need
+        their tasks looked at, through the (project_id, deadline) index of
+        open tasks; for the others both follow from the row.
+        """
+        rows = list(
+            self.db.scalars(query, execution_options={"populate_existing": True})
+        )
+        passed = [
+            row.project_id
+            for row in rows
+            if row.earliest_deadline is not None and row.earliest_deadline < now
+        ]
+        overdue: Dict[str, int] = {}
+        upcoming: Dict[str, datetime] = {}
+        if passed:
+            # A subquery rather than a list of IDs, which may be long
+            scope = query.with_only_columns(ProjectStats.project_id).where(
+                ProjectStats.earliest_deadline < now
+            ).order_by(None)
+            open_tasks = [Task.project_id.in_(scope), Task.status != "done"]
+            overdue = dict(
+                self.db.execute(
+                    select(Task.project_id, func.count())
+                    .where(*open_tasks, Task.deadline < now)
+                    .group_by(Task.project_id)
+                ).all()
+            )
+            upcoming = dict(
+                self.db.execute(
+                    select(Task.project_id, func.min(Task.deadline))
+                    .where(*open_tasks, Task.deadline >= now)
+                    .group_by(Task.project_id)
+                ).all()
+            )
+        passed_ids = set(passed)
+        for row in rows:
+            if row.project_id in passed_ids:
+                row.overdue = overdue.get(row.project_id, 0)
+                row.next_deadline = upcoming.get(row.project_id)
+            else:
+                row.overdue = 0
+                row.next_deadline = row.earliest_deadline
+        return rows
@@ -0,0 +1,110 @@
+# core/repositories/task_filter.py
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy import and_, func, literal_column, or_
+
+from core.models.task import Task
+
+
+class TaskFilter:
+    """
+    Criteria selecting a set of tasks for set-based operations.
+
+    All given criteria must match. Deadline and creation bounds are
+    half-open: deadline_after <= deadline < deadline_before.
+
+    q matches tasks containing every word of it in their title or
+    description: full-text search on PostgreSQL, substring matching
+    elsewhere.
+    """
+
+    project_id: Optional[str]
+    status: Optional[str]
+    deadline_before: Optional[datetime]
+    deadline_after: Optional[datetime]
+    created_before: Optional[datetime]
+    created_after: Optional[datetime]
+    q: Optional[str]
+    ids: Optional[List[str]]
+
+    def __init__(
+        self,
+        project_id: Optional[str] = None,
+        status: Optional[str] = None,
+        deadline_before: Optional[datetime] = None,
+        deadline_after: Optional[datetime] = None,
+        ids: Optional[Sequence[str]] = None,
+        created_before: Optional[datetime] = None,
+        created_after: Optional[datetime] = None,
+        q: Optional[str] = None,
+    ) -> None:
+        self.project_id = project_id
+        self.status = status
+        self.deadline_before = deadline_before
+        self.deadline_after = deadline_after
+        self.created_before = created_before
+        self.created_after = created_after
+        self.q = q.strip() if q is not None and q.strip() else None
+        self.ids = list(ids) if ids is not None else None
+
+    def is_empty(self) -> bool:
+        return not self.conditions()
+
+    def conditions(self, dialect: Optional[str] = None) -> List[Any]:
+        """SQL WHERE criteria for the given fields, for the named dialect."""
+        conditions: List[Any] = []
+        if self.project_id is not None:
+            conditions.append(Task.project_id == self.project_id)
+        if self.status is not None:
+            conditions.append(Task.status == self.status)
+        if self.deadline_before is not None:
+            conditions.append(Task.deadline < self.deadline_before)
+        if self.deadline_after is not None:
+            conditions.append(Task.deadline >= self.deadline_after)
+        if self.created_before is not None:
+            conditions.append(Task.created_at < self.created_before)
+        if self.created_after is not None:
+            conditions.append(Task.created_at >= self.created_after)
+        if self.q is not None:
+            conditions.append(self._matches(self.q, dialect))
+        if self.ids is not None:
+            conditions.append(Task.id.in_(self.ids))
+        return conditions
+
+    @staticmethod
+    def search_document() -> Any:
+        """The tsvector searched on PostgreSQL (indexed by ix_tasks_search)."""
+        # Constants are inlined rather than bound so the expression matches
+        # the index definition
+        return func.to_tsvector(
+            literal_column("'simple'"),
+            Task.title.concat(literal_column("' '")).concat(
+                func.coalesce(Task.description, literal_column("''"))
+            ),
+        )
+
+    @classmethod
+    def _matches(cls, q: str, dialect: Optional[str]) -> Any:
+        if dialect == "postgresql":
+            return cls.search_document().op("@@")(
+                func.plainto_tsquery(literal_column("'simple'"), q)
+            )
+        return and_(
+            *(
+                or_(
+                    Task.title.icontains(word, autoescape=True),
+                    Task.description.icontains(word, autoescape=True),
+                )
+                for word in q.split()
+            )
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"TaskFilter(project_id={self.project_id!r}, status={self.status!r}, "
+            f"deadline_before={self.deadline_before!r}, "
+            f"deadline_after={self.deadline_after!r}, "
+            f"created_before={self.created_before!r}, "
+            f"created_after={self.created_after!r}, q={self.q!r}, ids={self.ids!r})"
+        )
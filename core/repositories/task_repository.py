@@ -1,9 +1,64 @@
 # core/repositories/task_repository.py
-from typing import List, Optional
+import io
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 from datetime import datetime
+from sqlalchemy import (
+    Column,
+    Connection,
+    DateTime,
+    MetaData,
+    Row,
+    RowMapping,
+    Select,
+    String,
+    Table,
+    Text,
+    and_,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.orm import Session
 
+from core.models.project import Project
 from core.models.task import Task
+from core.repositories.dialect import dialect_insert
+from core.repositories.pagination import Page, decode_sort_cursor, encode_sort_cursor
+from core.repositories.projection import as_dicts, field_names
+from core.repositories.task_filter import TaskFilter
+from core.repositories.unit_of_work import commit
+
+
+# Sort keys accepted by list_page; a leading "-" sorts descending. Tasks
+# without a deadline come last in either direction.
+SORT_FIELDS = ("created_at", "updated_at", "deadline", "title")
+DEFAULT_SORT = "-created_at"
+# IDs per UPDATE ... WHERE id IN (...), well below SQLite's bound parameter limit
+_ID_CHUNK_SIZE = 1000
+# Columns a sparse listing (list_page(fields=...)) may select
+TASK_FIELDS = (
+    "id", "project_id", "title", "description", "status",
+    "created_at", "updated_at", "deadline",
+)
+
+# Per-connection staging table for copy_many; not part of the schema
+_import_staging = Table(
+    "tasks_import_staging",
+    MetaData(),
+    Column("id", String(36)),
+    Column("project_id", String(36)),
+    Column("title", String(255)),
+    Column("description", Text),
+    Column("status", String(50)),
+    Column("deadline", DateTime),
+    Column("created_at", DateTime),
+    Column("updated_at", DateTime),
+    prefixes=["TEMPORARY"],
+)
 
 
 class TaskRepository:
@@ -29,17 +84,100 @@ class TaskRepository:
             project_id=project_id,
         )
         self.db.add(task)
-        self.db.commit()
-        self.db.refresh(task)
+        commit(self.db)
         return task
 
-    # --- READ ---
-    def get(self, task_id: str) -> Optional[Task]:
-        return (
-            self.db.query(Task)
-            .filter(Task.id == task_id)
-            .first()
+    def create_many(self, rows: List[Dict[str, Any]]) -> List[Task]:
+        """
+        Insert many tasks with one executemany INSERT ... RETURNING and a
+        single commit. Each row holds Task column values; id and created_at
+        come from the model defaults.
+        """
+        if not rows:
+            return []
+        tasks = list(self.db.scalars(insert(Task).returning(Task), rows))
+        # Detach the returned rows so commit does not expire them; otherwise
+        # reading them afterwards would issue one SELECT per task.
+        for task in tasks:
+            self.db.expunge(task)
+        commit(self.db)
+        return tasks
+
+    def copy_many(self, rows: List[Dict[str, Any]]) -> List[Row]:
+        """
+        Load rows (with all Task columns set, id included) into a temporary
+        staging table and merge them into tasks with one INSERT ... SELECT.
+        Rows whose id already exists or whose project is gone are skipped.
+
+        On PostgreSQL (psycopg2) the staging table is filled with
+        COPY FROM STDIN; other databases fall back to an executemany
+        INSERT. Does not commit; returns id, project_id, status and
+        deadline of each row inserted.
+        """
+        if not rows:
+            return []
+        conn = self.db.connection()
+        _import_staging.create(conn, checkfirst=True)
+        conn.execute(delete(_import_staging))
+        if conn.dialect.driver == "psycopg2":
+            self._copy_into_staging(conn, rows)
+        else:
+            conn.execute(insert(_import_staging), rows)
+
+        columns = [column.name for column in _import_staging.c]
+        staged = select(*_import_staging.c).join(
+            Project, Project.id == _import_staging.c.project_id
+        )
+        merge = (
+            dialect_insert(self.db)(Task)
+            .from_select(columns, staged)
+            .on_conflict_do_nothing(index_elements=["id"])
+            .returning(Task.id, Task.project_id, Task.status, Task.deadline)
         )
+        inserted = list(conn.execute(merge))
+        conn.execute(delete(_import_staging))
+        return inserted
+
+    @staticmethod
+    def _copy_into_staging(conn: Connection, rows: List[Dict[str, Any]]) -> None:
+        """Stream rows to the staging table as CSV through COPY FROM STDIN."""
+        columns = [column.name for column in _import_staging.c]
+
+        def field(value: Any) -> str:
+            # Unquoted empty field is NULL in COPY CSV; quote everything else
+            if value is None:
+                return ""
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            return '"' + str(value).replace('"', '""') + '"'
+
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write(",".join(field(row.get(name)) for name in columns))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {_import_staging.name} ({', '.join(columns)}) "
+                "FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+        finally:
+            cursor.close()
+
+    # --- READ ---
+    def get(self, task_id: str, for_update: bool = False) -> Optional[Task]:
+        """
+        The task with task_id. With for_update, its row is locked (on
+        PostgreSQL) and re-read, so what the caller changes is based on
+        its current state.
+        """
+        query = self.db.query(Task).filter(Task.id == task_id)
+        if for_update:
+            query = query.populate_existing().with_for_update()
+        return query.first()
 
     def list(self, project_id: Optional[str] = None) -> List[Task]:
         query = self.db.query(Task)
@@ -47,14 +185,238 @@ class TaskRepository:
             query = query.filter(Task.project_id == project_id)
         return query.order_by(Task.created_at.desc()).all()
 
-    def count_by_project(self, project_id: str) -> int:
-        return (
-            self.db.query(Task)
-            .filter(Task.project_id == project_id)
-            .count()
+    def list_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        project_id: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+        sort: str = DEFAULT_SORT,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page[Any]:
+        """
+        Keyset-paginated listing of the tasks matching task_filter, ordered
+        by the sort key with id as tie-breaker. A cursor is only valid for
+        the sort it was issued for.
+
+        With fields, only those columns (and id) are selected and the items
+        are plain dicts instead of Task objects.
+        """
+        name, column, descending = self._parse_sort(sort)
+        nullable = name == "deadline"  # the only optional sort key
+        if fields is None:
+            stmt = select(Task)
+        else:
+            names = field_names(fields, TASK_FIELDS)
+            selected = names + [name] if name not in names else names
+            stmt = select(*(getattr(Task, field) for field in selected))
+        if project_id:
+            stmt = stmt.where(Task.project_id == project_id)
+        if task_filter is not None:
+            stmt = stmt.where(*task_filter.conditions(self._dialect()))
+        if cursor:
+            value, task_id = decode_sort_cursor(
+                cursor, sort, is_datetime=isinstance(column.type, DateTime)
+            )
+            stmt = stmt.where(self._after(column, descending, nullable, value, task_id))
+        key = column.desc() if descending else column.asc()
+        stmt = stmt.order_by(
+            key.nulls_last() if nullable else key,
+            Task.id.desc() if descending else Task.id.asc(),
+        ).limit(limit + 1)
+        rows = list(self.db.scalars(stmt) if fields is None else self.db.execute(stmt))
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_sort_cursor(sort, getattr(last, name), last.id)
+        items = rows if fields is None else as_dicts(rows, names)
+        return Page(items=items, next_cursor=next_cursor)
+
+    def stream(
+        self, batch_size: int, project_id: Optional[str] = None
+    ) -> Iterator[Sequence[RowMapping]]:
+        """
+        Yield task rows in batches of batch_size through a server-side
+        cursor, so memory stays flat however many rows are read.
+        """
+        result = self.db.execute(
+            self.export_query(project_id).execution_options(yield_per=batch_size)
         )
+        yield from result.mappings().partitions()
+
+    @staticmethod
+    def export_query(project_id: Optional[str] = None) -> Select:
+        """Plain column SELECT (no ORM objects) in (created_at, id) order."""
+        query = select(*Task.__table__.c).order_by(Task.created_at, Task.id)
+        if project_id:
+            query = query.where(Task.project_id == project_id)
+        return query
+
+    def ids_by_project(self, project_id: str) -> List[str]:
+        return list(
+            self.db.scalars(select(Task.id).where(Task.project_id == project_id))
+        )
+
+    def change_marker(
+        self, project_id: Optional[str] = None
+    ) -> Tuple[Optional[datetime], int]:
+        """
+        (max(updated_at), count) of the listed tasks, for list ETags. The
+        max comes from an index and the count from projects.task_count,
+        so neither scans the tasks table.
+        """
+        last_update = select(func.max(Task.updated_at))
+        count = select(func.coalesce(func.sum(Project.task_count), 0))
+        if project_id:
+            last_update = last_update.where(Task.project_id == project_id)
+            count = count.where(Project.id == project_id)
+        row = self.db.execute(
+            select(last_update.scalar_subquery(), count.scalar_subquery())
+        ).one()
+        return row[0], row[1]
+
+    def upcoming_deadlines(self, after: datetime, limit: int) -> List[datetime]:
+        """
+        The next limit deadlines at or after after of tasks not yet done,
+        soonest first (a range scan of ix_tasks_open_deadline).
+        """
+        return list(
+            self.db.scalars(
+                select(Task.deadline)
+                .where(Task.deadline >= after, Task.status != "done")
+                .order_by(Task.deadline)
+                .limit(limit)
+            )
+        )
+
+    def count_overdue(self, now: datetime) -> int:
+        return self.db.scalar(
+            select(func.count()).select_from(Task).where(*self._overdue(now))
+        )
+
+    # --- UPDATE ---
+    def close_overdue(self, now: datetime, limit: Optional[int] = None) -> List[Row]:
+        """
+        Mark overdue tasks as done and return id, project_id, status and
+        deadline of each as they were before. With a limit, only that many
+        rows are claimed (locked rows are skipped). Does not commit.
+        """
+        return self._update_prior(
+            self._overdue(now),
+            {"status": "done"},
+            limit=limit,
+            skip_locked=limit is not None,
+        )
+
+    def update_many(self, task_filter: TaskFilter, values: Dict[str, Any]) -> List[Row]:
+        """
+        Apply values to every matching task; returns id, project_id, status
+        and deadline of each task updated as they were before.
+        """
+        updated = self._update_prior(task_filter.conditions(self._dialect()), values)
+        commit(self.db)
+        return updated
 
     # --- DELETE ---
     def delete(self, task: Task) -> None:
         self.db.delete(task)
-        self.db.commit()
+        commit(self.db)
+
+    def delete_many(self, task_filter: TaskFilter) -> List[Row]:
+        """
+        Delete every matching task in one DELETE. Does not commit; returns
+        id, project_id, status and deadline of each task deleted.
+        """
+        return list(
+            self.db.execute(
+                delete(Task)
+                .where(*task_filter.conditions(self._dialect()))
+                .returning(Task.id, Task.project_id, Task.status, Task.deadline)
+                .execution_options(synchronize_session=False)
+            )
+        )
+
+    # --- HELPERS ---
+    def _dialect(self) -> str:
+        return self.db.get_bind().dialect.name
+
+    def _update_prior(
+        self,
+        conditions: list,
+        values: Dict[str, Any],
+        limit: Optional[int] = None,
+        skip_locked: bool = False,
+    ) -> List[Row]:
+        """
+        Apply values to the tasks matching conditions (at most limit of
+        them) and return id, project_id, status and deadline of each as they
+        were before. Does not commit.
+
+        The rows are claimed with SELECT ... FOR UPDATE, which on PostgreSQL
+        is a subquery of the UPDATE itself. SQLite cannot return columns of
+        a joined table, so there they are read first and updated by ID; a
+        SQLite transaction cannot write rows another one changed since.
+        """
+        prior = select(Task.id, Task.project_id, Task.status, Task.deadline).where(
+            *conditions
+        )
+        if limit is not None:
+            prior = prior.limit(limit)
+        prior = prior.with_for_update(skip_locked=skip_locked)
+
+        if self._dialect() == "postgresql":
+            claimed = prior.subquery("prior")
+            return list(
+                self.db.execute(
+                    update(Task)
+                    .where(Task.id == claimed.c.id)
+                    .values(**values)
+                    .returning(*claimed.c)
+                    .execution_options(synchronize_session=False)
+                )
+            )
+
+        rows = list(self.db.execute(prior))
+        ids = [row.id for row in rows]
+        for start in range(0, len(ids), _ID_CHUNK_SIZE):
+            self.db.execute(
+                update(Task)
+                .where(Task.id.in_(ids[start : start + _ID_CHUNK_SIZE]))
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+        return rows
+
+    @staticmethod
+    def _parse_sort(sort: str) -> Tuple[str, Any, bool]:
+        """Split a sort key like "-deadline" into (name, column, descending)."""
+        name = sort[1:] if sort.startswith("-") else sort
+        if name not in SORT_FIELDS:
+            raise ValueError(
+                f"Invalid sort: {sort}. Use one of {', '.join(SORT_FIELDS)}, "
+                "prefixed with - for descending order"
+            )
+        return name, getattr(Task, name), sort.startswith("-")
+
+    @staticmethod
+    def _after(
+        column: Any, descending: bool, nullable: bool, value: Any, task_id: str
+    ) -> Any:
+        """Keyset condition for rows after (value, task_id); NULLs sort last."""
+        if nullable and value is None:
+            # Inside the trailing group of rows without a value
+            after_id = Task.id < task_id if descending else Task.id > task_id
+            return and_(column.is_(None), after_id)
+        key, position = tuple_(column, Task.id), tuple_(value, task_id)
+        after = key < position if descending else key > position
+        return or_(after, column.is_(None)) if nullable else after
+
+    @staticmethod
+    def _overdue(now: datetime) -> list:
+        return [
+            Task.deadline.isnot(None),
+            Task.deadline < now,
+            Task.status != "done",
+        ]
@@ -0,0 +1,177 @@
+# core/repositories/unit_of_work.py
+"""
+Commit control shared by the repositories and TodoManager.
+
+By default every write commits on its own. While a unit of work is open on
+a session (TodoManager.transaction), commit() only flushes, so generated
+keys and constraint errors still surface at once, and the unit is
+committed once when it ends or rolled back if an error escapes it.
+
+Each TodoManager write is a unit of its own, or runs in a SAVEPOINT inside
+the open one (@atomic). A call that fails undoes only its own changes, so
+the caller may catch the error and carry on with the rest of the unit; the
+before/after-commit callbacks it registered are dropped with them.
+"""
+import functools
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, TypeVar
+
+from sqlalchemy.orm import Session
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_DEPTH = "unit_of_work_depth"
+_BEFORE_COMMIT = "unit_of_work_before_commit"
+_AFTER_COMMIT = "unit_of_work_after_commit"
+
+
+def in_unit_of_work(db: Session) -> bool:
+    return db.info.get(_DEPTH, 0) > 0
+
+
+def commit(db: Session) -> None:
+    """Commit, or only flush while a unit of work is open."""
+    if in_unit_of_work(db):
+        db.flush()
+    else:
+        db.commit()
+
+
+def rollback(db: Session) -> None:
+    """
+    Roll back a failed write. Inside a unit of work this is left to the
+    savepoint of the failing call, which unwinds as the error propagates.
+    """
+    if not in_unit_of_work(db):
+        db.rollback()
+
+
+def before_commit(db: Session, callback: Callable[[], None]) -> None:
+    """
+    Run callback in the open unit of work right before it commits, so its
+    statements commit with the unit; outside one, run it now and commit.
+    """
+    if in_unit_of_work(db):
+        db.info.setdefault(_BEFORE_COMMIT, []).append(callback)
+    else:
+        callback()
+        db.commit()
+
+
+def after_commit(db: Session, callback: Callable[[], None]) -> None:
+    """Run callback now, or once the open unit of work has committed."""
+    if in_unit_of_work(db):
+        db.info.setdefault(_AFTER_COMMIT, []).append(callback)
+    else:
+        callback()
+
+
+@contextmanager
+def savepoint(db: Session) -> Iterator[None]:
+    """Run the block in a SAVEPOINT inside a unit of work; a no-op outside."""
+    if not in_unit_of_work(db):
+        yield
+        return
+    begin_sqlite_transaction(db)
+    marks = callback_marks(db)
+    try:
+        with db.begin_nested():
+            yield
+    except BaseException:
+        drop_callbacks(db, marks)
+        raise
+
+
+def callback_marks(db: Session) -> Dict[str, int]:
+    """How many callbacks the open unit has queued, for drop_callbacks()."""
+    return {key: len(db.info.get(key, [])) for key in (_BEFORE_COMMIT, _AFTER_COMMIT)}
+
+
+def drop_callbacks(db: Session, marks: Dict[str, int]) -> None:
+    """
+    Drop the callbacks queued since callback_marks(): the changes they were
+    registered for were rolled back with a savepoint.
+    """
+    for key, count in marks.items():
+        del db.info.get(key, [])[count:]
+
+
+def begin_sqlite_transaction(db: Session) -> None:
+    """
+    Call before a SAVEPOINT: the sqlite3 driver only opens a transaction
+    before DML, so the SAVEPOINT could start it and its RELEASE would then
+    commit the unit early. A no-op on other databases.
+    """
+    connection = db.connection()
+    if connection.dialect.name != "sqlite":
+        return
+    if not connection.connection.driver_connection.in_transaction:
+        connection.exec_driver_sql("BEGIN")
+
+
+def atomic(method: F) -> F:
+    """
+    Decorate a TodoManager write so it runs in unit_of_work(self.db): it
+    commits once at the end, with its before-commit callbacks, or joins
+    the open unit through a savepoint.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        with unit_of_work(self.db):
+            return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def begin_unit(db: Session) -> None:
+    db.info[_DEPTH] = db.info.get(_DEPTH, 0) + 1
+
+
+def end_unit(db: Session, success: bool) -> None:
+    """
+    Close a unit opened with begin_unit. Only the outermost unit commits
+    (or rolls back); nested units just join it.
+    """
+    depth = db.info.get(_DEPTH, 0) - 1
+    if depth > 0:
+        db.info[_DEPTH] = depth
+        return
+
+    before = db.info.pop(_BEFORE_COMMIT, [])
+    callbacks = db.info.pop(_AFTER_COMMIT, [])
+    db.info.pop(_DEPTH, None)
+    if not success:
+        db.rollback()
+        return
+
+    try:
+        for callback in before:
+            callback()
+    except BaseException:
+        db.rollback()
+        raise
+    db.commit()
+    for callback in callbacks:
+        callback()
+
+
+@contextmanager
+def unit_of_work(db: Session) -> Iterator[Session]:
+    """
+    Open a unit of work. Opened inside another one, the block joins it
+    through a savepoint: a failure escaping the inner block undoes only
+    that block.
+    """
+    if in_unit_of_work(db):
+        with savepoint(db):
+            yield db
+        return
+
+    begin_unit(db)
+    try:
+        yield db
+    except BaseException:
+        end_unit(db, success=False)
+        raise
+    end_unit(db, success=True)
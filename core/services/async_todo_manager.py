@@ -0,0 +1,284 @@
+# core/services/async_todo_manager.py
+
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.cache import EntityCache
+from core.events.hub import EventHub
+from core.models.project import Project
+from core.models.project_stats import ProjectStats
+from core.models.task import Task
+from core.config import Config
+from core.repositories.async_project_repository import AsyncProjectRepository
+from core.repositories.async_task_repository import AsyncTaskRepository
+from core.repositories.change_repository import ChangeSet
+from core.repositories.pagination import Page
+from core.repositories.task_filter import TaskFilter
+from core.repositories.unit_of_work import (
+    begin_sqlite_transaction,
+    begin_unit,
+    callback_marks,
+    drop_callbacks,
+    end_unit,
+    in_unit_of_work,
+)
+from core.services.bulk import BulkResult
+from core.services.task_export import (
+    encode_rows,
+    export_header,
+    validate_export_format,
+)
+from core.services.todo_manager import TodoManager
+
+
+class AsyncTodoManager:
+    """
+    Async counterpart of TodoManager for the Web API.
+
+    Business rules stay in TodoManager; each call runs it on the
+    AsyncSession's connection via run_sync, so database I/O goes through
+    the asyncio driver instead of blocking a worker thread.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        config: Optional[Config] = None,
+        cache: Optional[EntityCache] = None,
+        events: Optional[EventHub] = None,
+    ) -> None:
+        self.db = db
+        self.config = config if config else Config()
+
+        # Sync manager bound to the async session's underlying Session
+        self.sync = TodoManager(
+            db=db.sync_session, config=self.config, cache=cache, events=events
+        )
+
+        # Repositories
+        self.projects = AsyncProjectRepository(db)
+        self.tasks = AsyncTaskRepository(db)
+
+    async def _run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return await self.db.run_sync(lambda _: fn(*args, **kwargs))
+
+    # ==================== Unit of Work ====================
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator["AsyncTodoManager"]:
+        """Async form of TodoManager.transaction (one commit for the block)."""
+        session = self.db.sync_session
+        if in_unit_of_work(session):
+            # Nested: join the open unit through a savepoint, as
+            # unit_of_work.savepoint does for sync code
+            await self._run(begin_sqlite_transaction, session)
+            marks = callback_marks(session)
+            try:
+                async with self.db.begin_nested():
+                    yield self
+            except BaseException:
+                drop_callbacks(session, marks)
+                raise
+            return
+
+        begin_unit(session)
+        try:
+            yield self
+        except BaseException:
+            await self._run(end_unit, session, success=False)
+            raise
+        await self._run(end_unit, session, success=True)
+
+    # ==================== Project Management ====================
+
+    async def create_project(self, name: str, description: str) -> Project:
+        return await self._run(self.sync.create_project, name, description)
+
+    async def get_project(self, project_id: str) -> Optional[Project]:
+        return await self._run(self.sync.get_project, project_id)
+
+    async def list_projects(self, with_task_counts: bool = False) -> List[Project]:
+        return await self.projects.list(with_task_counts=with_task_counts)
+
+    async def list_projects_page(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        with_task_counts: bool = False,
+        fields: Optional[List[str]] = None,
+    ) -> Page[Any]:
+        return await self._run(
+            self.sync.list_projects_page,
+            limit=limit,
+            cursor=cursor,
+            with_task_counts=with_task_counts,
+            fields=fields,
+        )
+
+    async def projects_change_marker(self) -> Tuple[Any, ...]:
+        return await self._run(self.sync.projects_change_marker)
+
+    async def edit_project(
+        self,
+        project_id: str,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Project:
+        return await self._run(
+            self.sync.edit_project,
+            project_id,
+            name=name,
+            description=description,
+        )
+
+    async def upsert_project(
+        self, name: str, description: str
+    ) -> Tuple[Project, bool]:
+        return await self._run(self.sync.upsert_project, name, description)
+
+    async def delete_project(self, project_id: str) -> bool:
+        return await self._run(self.sync.delete_project, project_id)
+
+    # ==================== Task Management ====================
+
+    async def create_task(
+        self,
+        project_id: str,
+        title: str,
+        description: str,
+        status: str = "todo",
+        deadline: Optional[datetime] = None,
+    ) -> Task:
+        return await self._run(
+            self.sync.create_task,
+            project_id,
+            title,
+            description,
+            status=status,
+            deadline=deadline,
+        )
+
+    async def create_tasks_bulk(
+        self, tasks: List[Dict[str, Any]], allow_partial: bool = False
+    ) -> BulkResult[Task]:
+        return await self._run(
+            self.sync.create_tasks_bulk, tasks, allow_partial=allow_partial
+        )
+
+    async def get_task(self, task_id: str) -> Optional[Task]:
+        return await self._run(self.sync.get_task, task_id)
+
+    async def list_tasks(self, project_id: Optional[str] = None) -> List[Task]:
+        return await self.tasks.list(project_id=project_id)
+
+    async def list_tasks_page(
+        self,
+        project_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+        sort: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Page[Any]:
+        return await self._run(
+            self.sync.list_tasks_page,
+            project_id=project_id,
+            limit=limit,
+            cursor=cursor,
+            task_filter=task_filter,
+            sort=sort,
+            fields=fields,
+        )
+
+    async def tasks_change_marker(
+        self, project_id: Optional[str] = None
+    ) -> Tuple[Any, ...]:
+        return await self._run(self.sync.tasks_change_marker, project_id=project_id)
+
+    async def edit_task(
+        self,
+        task_id: str,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[str] = None,
+        deadline: Optional[datetime] = None,
+    ) -> Task:
+        return await self._run(
+            self.sync.edit_task,
+            task_id,
+            title=title,
+            description=description,
+            status=status,
+            deadline=deadline,
+        )
+
+    async def delete_task(self, task_id: str) -> bool:
+        return await self._run(self.sync.delete_task, task_id)
+
+    async def update_tasks(
+        self,
+        task_filter: TaskFilter,
+        status: Optional[str] = None,
+        deadline: Optional[datetime] = None,
+    ) -> int:
+        return await self._run(
+            self.sync.update_tasks, task_filter, status=status, deadline=deadline
+        )
+
+    async def delete_tasks(self, task_filter: TaskFilter) -> int:
+        return await self._run(self.sync.delete_tasks, task_filter)
+
+    async def close_overdue_tasks(
+        self, batch_size: Optional[int] = None, dry_run: bool = False
+    ) -> int:
+        return await self._run(
+            self.sync.close_overdue_tasks, batch_size=batch_size, dry_run=dry_run
+        )
+
+    async def upcoming_deadlines(self, limit: int) -> List[datetime]:
+        return await self._run(self.sync.upcoming_deadlines, limit)
+
+    # ==================== Counters ====================
+
+    async def reconcile_counters(self) -> Dict[str, int]:
+        return await self._run(self.sync.reconcile_counters)
+
+    # ==================== Statistics ====================
+
+    async def get_project_stats(self, project_id: str) -> ProjectStats:
+        return await self._run(self.sync.get_project_stats, project_id)
+
+    async def list_project_stats(self) -> List[ProjectStats]:
+        return await self._run(self.sync.list_project_stats)
+
+    # ==================== Export ====================
+
+    def export_tasks(
+        self, fmt: str = "ndjson", project_id: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream tasks as NDJSON or CSV text chunks. Unlike the other methods
+        this reads through AsyncSession.stream rather than run_sync, so each
+        batch is fetched from the server-side cursor without blocking.
+        """
+        validate_export_format(fmt)
+        return self._export_chunks(fmt, project_id)
+
+    async def _export_chunks(
+        self, fmt: str, project_id: Optional[str]
+    ) -> AsyncIterator[str]:
+        header = export_header(fmt)
+        if header:
+            yield header
+        async for rows in self.tasks.stream(self.config.EXPORT_BATCH_SIZE, project_id):
+            yield encode_rows(rows, fmt)
+
+    # ==================== Sync ====================
+
+    async def sync_changes(
+        self, token: Optional[str] = None, limit: Optional[int] = None
+    ) -> ChangeSet:
+        return await self._run(self.sync.sync_changes, token, limit)
@@ -0,0 +1,32 @@
+# core/services/bulk.py
+from typing import Generic, List, TypeVar
+
+T = TypeVar("T")
+
+
+class BulkItemError:
+    """Validation failure for one item of a bulk request."""
+
+    index: int
+    message: str
+
+    def __init__(self, index: int, message: str) -> None:
+        self.index = index
+        self.message = message
+
+    def __repr__(self) -> str:
+        return f"BulkItemError(index={self.index}, message='{self.message}')"
+
+
+class BulkResult(Generic[T]):
+    """Outcome of a bulk operation: the rows written and per-item errors."""
+
+    created: List[T]
+    errors: List[BulkItemError]
+
+    def __init__(self, created: List[T], errors: List[BulkItemError]) -> None:
+        self.created = created
+        self.errors = errors
+
+    def __repr__(self) -> str:
+        return f"BulkResult(created={len(self.created)}, errors={len(self.errors)})"
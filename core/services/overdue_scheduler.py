@@ -0,0 +1,158 @@
+# core/services/overdue_scheduler.py
+import asyncio
+import heapq
+import logging
+from datetime import datetime
+from typing import Callable, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from core.cache import EntityCache
+from core.config import Config
+from core.events.hub import EventHub
+from core.services.async_todo_manager import AsyncTodoManager
+
+logger = logging.getLogger(__name__)
+
+
+class OverdueScheduler:
+    """
+    Close overdue tasks as their deadlines pass, from inside the API process.
+
+    Keeps a min-heap of the next OVERDUE_WINDOW deadlines of open tasks and
+    sleeps until the earliest one (or the next reload of the window, every
+    OVERDUE_REFRESH_INTERVAL seconds, which picks up deadlines set since).
+    Each wake-up closes the tasks that just expired in batches of
+    OVERDUE_BATCH_SIZE; the partial index on open deadlines makes that work
+    proportional to the expired tasks, not to the table.
+
+    On PostgreSQL only the replica holding a session advisory lock runs it;
+    the others retry every refresh interval and take over when the lock
+    holder's connection goes away.
+    """
+
+    # Arbitrary application-wide key of the advisory lock
+    LOCK_KEY = 0x0D0_0E4D
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        session_factory: Callable[[], AsyncSession],
+        config: Config,
+        cache: Optional[EntityCache] = None,
+        events: Optional[EventHub] = None,
+    ) -> None:
+        self.engine = engine
+        self.session_factory = session_factory
+        self.config = config
+        self.cache = cache
+        self.events = events
+        self._deadlines: List[datetime] = []
+        self._refreshed_at: Optional[datetime] = None
+        self._window_full = False
+
+    async def run(self) -> None:
+        """Run until cancelled, leading whenever the lock can be taken."""
+        while True:
+            try:
+                if self.engine.dialect.name != "postgresql":
+                    # No advisory locks (SQLite): a single process is assumed
+                    await self._lead(None)
+                else:
+                    lock = await self._acquire_lock()
+                    if lock is not None:
+                        try:
+                            await self._lead(lock)
+                        finally:
+                            await self._release_lock(lock)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Overdue scheduler failed; retrying")
+            await asyncio.sleep(self.config.OVERDUE_REFRESH_INTERVAL)
+
+    async def tick(self) -> int:
+        """Drop expired deadlines from the heap and close the overdue tasks."""
+        now = datetime.utcnow()
+        while self._deadlines and self._deadlines[0] <= now:
+            heapq.heappop(self._deadlines)
+        async with self.session_factory() as db:
+            manager = AsyncTodoManager(
+                db=db, config=self.config, cache=self.cache, events=self.events
+            )
+            closed = await manager.close_overdue_tasks(
+                batch_size=self.config.OVERDUE_BATCH_SIZE
+            )
+        if closed:
+            logger.info("Closed %d overdue tasks", closed)
+        return closed
+
+    async def refresh(self) -> None:
+        """Reload the heap with the next OVERDUE_WINDOW upcoming deadlines."""
+        async with self.session_factory() as db:
+            manager = AsyncTodoManager(
+                db=db, config=self.config, cache=self.cache, events=self.events
+            )
+            deadlines = await manager.upcoming_deadlines(self.config.OVERDUE_WINDOW)
+        heapq.heapify(deadlines)
+        self._deadlines = deadlines
+        self._window_full = len(deadlines) >= self.config.OVERDUE_WINDOW
+        self._refreshed_at = datetime.utcnow()
+
+    def refresh_due(self) -> bool:
+        """
+        True once the refresh interval has passed, or when a full window
+        has run out (more deadlines may follow right after it).
+        """
+        if self._refreshed_at is None or (not self._deadlines and self._window_full):
+            return True
+        elapsed = (datetime.utcnow() - self._refreshed_at).total_seconds()
+        return elapsed >= self.config.OVERDUE_REFRESH_INTERVAL
+
+    def seconds_until_next(self) -> float:
+        """Time to sleep: until the earliest deadline or the next refresh."""
+        now = datetime.utcnow()
+        wake_at = self._refreshed_at or now
+        wake_in = self.config.OVERDUE_REFRESH_INTERVAL - (now - wake_at).total_seconds()
+        if self._deadlines:
+            wake_in = min(wake_in, (self._deadlines[0] - now).total_seconds())
+        return max(0.0, wake_in)
+
+    async def _lead(self, lock: Optional[AsyncConnection]) -> None:
+        # Catch up on everything that expired while nobody was leading
+        await self.tick()
+        await self.refresh()
+        while True:
+            await asyncio.sleep(self.seconds_until_next())
+            if lock is not None:
+                # Fails if the connection, and with it the lock, was lost
+                await lock.execute(text("SELECT 1"))
+            await self.tick()
+            if self.refresh_due():
+                await self.refresh()
+
+    async def _acquire_lock(self) -> Optional[AsyncConnection]:
+        """
+        Connection holding the PostgreSQL advisory lock, or None if another
+        replica holds it. The lock lasts as long as the connection.
+        """
+        conn = await self.engine.connect()
+        try:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            acquired = await conn.scalar(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": self.LOCK_KEY}
+            )
+        except BaseException:
+            await conn.close()
+            raise
+        if not acquired:
+            await conn.close()
+            return None
+        return conn
+
+    async def _release_lock(self, conn: AsyncConnection) -> None:
+        # Closing would only return the connection, and with it the session
+        # lock, to the pool; dropping the connection ends the session
+        await conn.invalidate()
+        await conn.close()
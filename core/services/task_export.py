@@ -0,0 +1,62 @@
+# core/services/task_export.py
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, Iterable, Mapping
+
+# Columns written by an export, in order
+EXPORT_FIELDS = [
+    "id",
+    "project_id",
+    "title",
+    "description",
+    "status",
+    "deadline",
+    "created_at",
+    "updated_at",
+]
+
+# Supported formats and their media types
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def validate_export_format(fmt: str) -> None:
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(
+            f"Invalid export format. Must be one of: {', '.join(EXPORT_FORMATS)}"
+        )
+
+
+def _value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def export_header(fmt: str) -> str:
+    """Text written before the first row (the CSV header line)."""
+    if fmt == "csv":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(EXPORT_FIELDS)
+        return buffer.getvalue()
+    return ""
+
+
+def encode_rows(rows: Iterable[Mapping[str, Any]], fmt: str) -> str:
+    """Serialize one batch of task rows as NDJSON lines or CSV records."""
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow(
+                ["" if row[field] is None else _value(row[field]) for field in EXPORT_FIELDS]
+            )
+        return buffer.getvalue()
+    return "".join(
+        json.dumps({field: _value(row[field]) for field in EXPORT_FIELDS}) + "\n"
+        for row in rows
+    )
@@ -0,0 +1,94 @@
+# core/services/task_import.py
+import csv
+import json
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Union
+
+# Supported input formats
+IMPORT_FORMATS = ["csv", "ndjson"]
+
+
+class UnreadableRecord:
+    """Placeholder for an input line that could not be decoded."""
+
+    def __init__(self, message: str) -> None:
+        self.message = message
+
+    def __repr__(self) -> str:
+        return f"UnreadableRecord({self.message!r})"
+
+
+def read_task_records(
+    fp: TextIO, fmt: str
+) -> Iterator[Union[Dict[str, Any], UnreadableRecord]]:
+    """
+    Lazily read raw task records from a CSV file (with a header line) or
+    from NDJSON (one JSON object per line), one record at a time. A line
+    that is not valid JSON yields an UnreadableRecord, so it is reported
+    like any other invalid record instead of aborting the import.
+    """
+    if fmt == "csv":
+        yield from csv.DictReader(fp)
+    elif fmt == "ndjson":
+        for line in fp:
+            if line.strip():
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield UnreadableRecord(f"Invalid JSON: {e.msg} (column {e.colno})")
+    else:
+        raise ValueError(
+            f"Invalid import format. Must be one of: {', '.join(IMPORT_FORMATS)}"
+        )
+
+
+def batched(records: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Group records into lists of at most size items."""
+    iterator = iter(records)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _optional(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    value = str(value)
+    return value if value != "" else None
+
+
+def _datetime(value: Any, field: str) -> Optional[datetime]:
+    value = _optional(value)
+    if value is None:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Invalid {field}: {value}")
+
+
+def parse_task_record(record: Any) -> Dict[str, Any]:
+    """
+    Normalize a raw record into create_task style values: empty strings
+    become defaults and deadline/created_at are parsed as ISO datetimes.
+    Raises ValueError for records that cannot be imported at all.
+    """
+    if isinstance(record, UnreadableRecord):
+        raise ValueError(record.message)
+    if not isinstance(record, dict):
+        raise ValueError("Record must be an object")
+    project_id = _optional(record.get("project_id"))
+    if project_id is None:
+        raise ValueError("project_id is required")
+    task_id = _optional(record.get("id"))
+    if task_id is not None and len(task_id) > 36:
+        raise ValueError("Task id cannot exceed 36 characters")
+    return {
+        "id": task_id,
+        "project_id": project_id,
+        "title": str(record.get("title") or ""),
+        "description": str(record.get("description") or ""),
+        "status": _optional(record.get("status")) or "todo",
+        "deadline": _datetime(record.get("deadline"), "deadline"),
+        "created_at": _datetime(record.get("created_at"), "created_at"),
+    }
@@ -1,15 +1,42 @@
 # core/services/todo_manager.py
 
+import uuid
+from collections import Counter
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from core.cache import EntityCache
+from core.events.hub import ChangeEvent, EventHub
 from core.models.project import Project
+from core.models.project_stats import ProjectStats
 from core.models.task import Task
+from core.models.tombstone import PENDING_CHANGE, Tombstone
 from core.config import Config
+from core.repositories.change_repository import ChangeRepository, ChangeSet
+from core.repositories.pagination import Page
 from core.repositories.project_repository import ProjectRepository
-from core.repositories.task_repository import TaskRepository
+from core.repositories.stats_repository import ProjectStatsRepository, TaskState
+from core.repositories.task_filter import TaskFilter
+from core.repositories.task_repository import DEFAULT_SORT, TaskRepository
+from core.repositories.unit_of_work import (
+    after_commit,
+    atomic,
+    before_commit,
+    commit,
+    rollback,
+    unit_of_work,
+)
+from core.services.bulk import BulkItemError, BulkResult
+from core.services.task_import import parse_task_record
+from core.services.task_export import (
+    encode_rows,
+    export_header,
+    validate_export_format,
+)
 from core.services.validators import (
     validate_project_name,
     validate_project_description,
@@ -22,87 +49,198 @@ from core.services.validators import (
 class TodoManager:
     """Manage projects and tasks using repositories and SQLAlchemy."""
 
-    def __init__(self, db: Session, config: Optional[Config] = None) -> None:
+    def __init__(
+        self,
+        db: Session,
+        config: Optional[Config] = None,
+        cache: Optional[EntityCache] = None,
+        events: Optional[EventHub] = None,
+    ) -> None:
         self.db = db
         self.config = config if config else Config()
 
+        # Optional read-through cache for get_project / get_task
+        self.cache = cache
+
+        # Optional change feed: every write records its events here
+        self.events = events
+
         # Repositories
         self.projects = ProjectRepository(db)
         self.tasks = TaskRepository(db)
+        self.changes = ChangeRepository(db)
+        self.stats = ProjectStatsRepository(db)
+
+    # ==================== Unit of Work ====================
+
+    @contextmanager
+    def transaction(self) -> Iterator["TodoManager"]:
+        """
+        Group several operations into one database transaction:
+
+            with manager.transaction():
+                project = manager.create_project("Launch", "")
+                manager.create_task(project.id, "Write notes", "")
+
+        Inside the block writes are flushed instead of committed; the
+        transaction commits once at the end and cache invalidations run
+        after that commit. An error escaping the block rolls all of it
+        back. Each operation runs in its own savepoint, so one that fails
+        undoes only its own changes and, if the error is caught inside
+        the block, the others still commit. Outside a transaction each
+        call commits on its own.
+        """
+        with unit_of_work(self.db):
+            yield self
 
     # ==================== Project Management ====================
 
+    @atomic
     def create_project(self, name: str, description: str) -> Project:
         """Create a new project with validation."""
 
-        # Check project count limit
-        project_count = self.projects.count()
-        if project_count >= self.config.MAX_PROJECTS:
-            raise ValueError(
-                f"Cannot create more than {self.config.MAX_PROJECTS} projects"
-            )
-
         # Field-level validation
         validate_project_name(name, self.config)
         validate_project_description(description, self.config)
 
-        # Duplicate name check
-        if self.projects.get_by_name(name):
-            raise ValueError(f"Project with name '{name}' already exists")
+        # Check project count limit: one slot of the projects counter is
+        # reserved atomically and committed together with the insert
+        if not self.projects.reserve_project_slot(self.config.MAX_PROJECTS):
+            raise ValueError(
+                f"Cannot create more than {self.config.MAX_PROJECTS} projects"
+            )
 
-        # Delegate creation to repository
-        return self.projects.create(name=name, description=description)
+        try:
+            # Delegate creation to repository; duplicate names are rejected
+            # by the unique index on projects.name
+            project = self.projects.create(name=name, description=description)
+        except IntegrityError:
+            rollback(self.db)
+            raise ValueError(f"Project with name '{name}' already exists")
+        self.stats.create(project.id)
+        self._record_changes("project", "created", [(project.id, project.id)])
+        return project
 
     def get_project(self, project_id: str) -> Optional[Project]:
+        if self.cache:
+            return self.cache.get_project(self.db, project_id, self.projects.get)
         return self.projects.get(project_id)
 
-    def list_projects(self) -> List[Project]:
-        return self.projects.list()
+    def list_projects(self, with_task_counts: bool = False) -> List[Project]:
+        return self.projects.list(with_task_counts=with_task_counts)
+
+    def list_projects_page(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        with_task_counts: bool = False,
+        fields: Optional[List[str]] = None,
+    ) -> Page[Any]:
+        """
+        List one page of projects, newest first. With fields, items are
+        dicts of only those fields (see ProjectRepository.list_page).
+        """
+        return self.projects.list_page(
+            limit=self._page_size(limit),
+            cursor=cursor,
+            with_task_counts=with_task_counts,
+            fields=fields,
+        )
+
+    def projects_change_marker(self) -> Tuple[Any, ...]:
+        """Cheap fingerprint of the project listing, used for ETags."""
+        return self.projects.change_marker()
 
+    @atomic
     def edit_project(
         self,
         project_id: str,
         name: Optional[str] = None,
         description: Optional[str] = None,
     ) -> Project:
-        project = self.get_project(project_id)
+        project = self.projects.get(project_id)
         if not project:
             raise ValueError(f"Project with ID '{project_id}' not found")
 
         if name is not None:
             # validate name
             validate_project_name(name, self.config)
-
-            # Check for duplicate name (excluding this project)
-            existing = (
-                self.db.query(Project)
-                .filter(Project.name == name, Project.id != project_id)
-                .first()
-            )
-            if existing:
-                raise ValueError(f"Project with name '{name}' already exists")
-
             project.name = name
 
         if description is not None:
             validate_project_description(description, self.config)
             project.description = description
 
-        self.db.commit()
-        self.db.refresh(project)
+        try:
+            commit(self.db)
+        except IntegrityError:
+            # Unique index on projects.name
+            rollback(self.db)
+            raise ValueError(f"Project with name '{name}' already exists")
+        self._invalidate_project(project_id)
+        self._record_changes("project", "updated", [(project_id, project_id)])
         return project
 
+    @atomic
+    def upsert_project(self, name: str, description: str) -> Tuple[Project, bool]:
+        """
+        Create the project called name, or set its description if it
+        already exists. Idempotent; returns the project and whether it was
+        created. A new project still counts against MAX_PROJECTS.
+        """
+        validate_project_name(name, self.config)
+        validate_project_description(description, self.config)
+
+        # Common case first: the project exists, one UPDATE ... RETURNING
+        project = self.projects.update_by_name(name, description)
+        created = False
+        if project is None:
+            if not self.projects.reserve_project_slot(self.config.MAX_PROJECTS):
+                raise ValueError(
+                    f"Cannot create more than {self.config.MAX_PROJECTS} projects"
+                )
+            # INSERT ... ON CONFLICT covers a concurrent create of the same name
+            project, created = self.projects.upsert(name, description)
+            if created:
+                self.stats.create(project.id)
+            else:
+                self.projects.release_project_slot()
+        # An unchanged description leaves the row (and its change_seq) alone
+        changed = created or project.change_seq == PENDING_CHANGE
+        commit(self.db)
+
+        if not changed:
+            return project, created
+        if not created:
+            self._invalidate_project(project.id)
+        self._record_changes(
+            "project", "created" if created else "updated", [(project.id, project.id)]
+        )
+        return project, created
+
+    @atomic
     def delete_project(self, project_id: str) -> bool:
-        project = self.get_project(project_id)
+        project = self.projects.get(project_id)
         if not project:
             raise ValueError("Project not found")
 
-        # Cascade deletes tasks automatically (as defined in model relationship)
+        # Cached tasks of this project must go too; only their IDs are read
+        task_ids = self.tasks.ids_by_project(project_id) if self.cache else []
+
+        # Tasks are removed by the database (ON DELETE CASCADE) without
+        # being loaded (passive_deletes on the relationship)
+        self.projects.release_project_slot()
         self.projects.delete(project)
+
+        self._invalidate_project(project_id)
+        self._invalidate_tasks(task_ids)
+        # The tasks go with it; clients drop them on project.deleted
+        self._record_changes("project", "deleted", [(project_id, project_id)])
         return True
 
     # ==================== Task Management ====================
 
+    @atomic
     def create_task(
         self,
         project_id: str,
@@ -113,37 +251,178 @@ class TodoManager:
     ) -> Task:
         """Create a new task under a project with validation."""
 
-        project = self.get_project(project_id)
-        if not project:
-            raise ValueError("Project not found")
-
-        # Task count constraint
-        task_count = self.tasks.count_by_project(project_id)
-        if task_count >= self.config.MAX_TASKS_PER_PROJECT:
-            raise ValueError(
-                f"Cannot create more than {self.config.MAX_TASKS_PER_PROJECT} tasks for this project"
-            )
-
         # Field-level validation
         validate_task_title(title, self.config)
         validate_task_description(description, self.config)
         validate_task_status(status)
 
+        # Task count constraint: a conditional UPDATE of the project's
+        # task_count, committed together with the insert
+        if not self.projects.reserve_task_slots(
+            project_id, 1, self.config.MAX_TASKS_PER_PROJECT
+        ):
+            if not self.projects.get(project_id):
+                raise ValueError("Project not found")
+            raise ValueError(
+                f"Cannot create more than {self.config.MAX_TASKS_PER_PROJECT} tasks for this project"
+            )
+
         # Delegate creation to repository
-        return self.tasks.create(
+        task = self.tasks.create(
             title=title,
             description=description,
             status=status,
             deadline=deadline,
             project_id=project_id,
         )
+        self.stats.apply([], [(project_id, task.status, task.deadline)])
+        self._record_changes("task", "created", [(task.id, project_id)])
+        return task
+
+    @atomic
+    def create_tasks_bulk(
+        self, tasks: List[Dict[str, Any]], allow_partial: bool = False
+    ) -> BulkResult[Task]:
+        """
+        Create many tasks in one transaction.
+
+        Each item takes the create_task arguments as a dict. The whole batch
+        is validated up front; project existence and MAX_TASKS_PER_PROJECT
+        are checked with one query each for all projects involved, and the
+        valid rows are inserted with a single executemany.
+
+        Without allow_partial, nothing is inserted if any item is invalid.
+        """
+        if len(tasks) > self.config.MAX_BULK_TASKS:
+            raise ValueError(
+                f"Cannot create more than {self.config.MAX_BULK_TASKS} tasks in one request"
+            )
+
+        accepted, errors = self._validate_bulk_items(enumerate(tasks))
+        if errors and not allow_partial:
+            return BulkResult(created=[], errors=errors)
+
+        accepted, lost = self._reserve_bulk_slots(accepted)
+        if lost:
+            errors = sorted(errors + lost, key=lambda error: error.index)
+            if not allow_partial:
+                # Give back the slots reserved for the other projects
+                self.projects.adjust_task_counts(
+                    {
+                        project_id: -count
+                        for project_id, count in Counter(
+                            item["project_id"] for _, item in accepted
+                        ).items()
+                    }
+                )
+                commit(self.db)
+                return BulkResult(created=[], errors=errors)
+
+        rows = [
+            {
+                "project_id": item["project_id"],
+                "title": item["title"],
+                "description": item.get("description", ""),
+                "status": item.get("status", "todo"),
+                "deadline": item.get("deadline"),
+            }
+            for _, item in accepted
+        ]
+        created = self.tasks.create_many(rows)
+        self.stats.apply([], self._states(created))
+        self._record_changes("task", "created", self._pairs(created))
+        return BulkResult(created=created, errors=errors)
+
+    @atomic
+    def import_tasks(self, records: List[Any], start: int = 0) -> BulkResult[str]:
+        """
+        Import one batch of raw task records (strings as read from CSV or
+        NDJSON, see core.services.task_import) for bulk migrations.
+
+        Records go through the same checks as create_tasks_bulk; the valid
+        ones are loaded with TaskRepository.copy_many and the invalid ones
+        are reported with their index, counted from start. A record may keep
+        its legacy id and created_at; ids that already exist are skipped.
+        Returns the IDs of the tasks inserted.
+        """
+        errors: List[BulkItemError] = []
+        parsed: List[Tuple[int, Dict[str, Any]]] = []
+        for index, record in enumerate(records, start):
+            try:
+                parsed.append((index, parse_task_record(record)))
+            except ValueError as e:
+                errors.append(BulkItemError(index, str(e)))
+
+        accepted, invalid = self._validate_bulk_items(parsed)
+        accepted, lost = self._reserve_bulk_slots(accepted)
+        errors.extend(invalid + lost)
+        errors.sort(key=lambda error: error.index)
+
+        now = datetime.utcnow()
+        rows = []
+        for _, item in accepted:
+            created_at = item.get("created_at") or now
+            rows.append(
+                {
+                    "id": item.get("id") or str(uuid.uuid4()),
+                    "project_id": item["project_id"],
+                    "title": item["title"],
+                    "description": item.get("description", ""),
+                    "status": item.get("status", "todo"),
+                    "deadline": item.get("deadline"),
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                }
+            )
+        inserted = self.tasks.copy_many(rows)
+
+        # Give back the slots of rows skipped as duplicates
+        unused = Counter(row["project_id"] for row in rows)
+        unused.subtract(row.project_id for row in inserted)
+        self.projects.adjust_task_counts(
+            {project_id: -count for project_id, count in unused.items()}
+        )
+        self.stats.apply([], self._states(inserted))
+        commit(self.db)
+        self._record_changes("task", "created", self._pairs(inserted))
+        return BulkResult(created=[row.id for row in inserted], errors=errors)
 
     def get_task(self, task_id: str) -> Optional[Task]:
+        if self.cache:
+            return self.cache.get_task(self.db, task_id, self.tasks.get)
         return self.tasks.get(task_id)
 
     def list_tasks(self, project_id: Optional[str] = None) -> List[Task]:
         return self.tasks.list(project_id=project_id)
 
+    def list_tasks_page(
+        self,
+        project_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+        sort: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Page[Any]:
+        """
+        List one page of the tasks matching task_filter, newest first
+        unless sort names another key. With fields, items are dicts of only
+        those fields (see TaskRepository.list_page).
+        """
+        return self.tasks.list_page(
+            limit=self._page_size(limit),
+            cursor=cursor,
+            project_id=project_id,
+            task_filter=task_filter,
+            sort=sort or DEFAULT_SORT,
+            fields=fields,
+        )
+
+    def tasks_change_marker(self, project_id: Optional[str] = None) -> Tuple[Any, ...]:
+        """Cheap fingerprint of the task listing, used for ETags."""
+        return self.tasks.change_marker(project_id=project_id)
+
+    @atomic
     def edit_task(
         self,
         task_id: str,
@@ -152,9 +431,10 @@ class TodoManager:
         status: Optional[str] = None,
         deadline: Optional[datetime] = None,
     ) -> Task:
-        task = self.get_task(task_id)
+        task = self.tasks.get(task_id, for_update=True)
         if not task:
             raise ValueError("Task not found")
+        before = (task.project_id, task.status, task.deadline)
 
         if title is not None:
             validate_task_title(title, self.config)
@@ -171,37 +451,336 @@ class TodoManager:
         if deadline is not None:
             task.deadline = deadline
 
-        self.db.commit()
-        self.db.refresh(task)
+        commit(self.db)
+        # After the flush: the earliest deadline may be re-read from the tasks
+        self.stats.apply([before], [(task.project_id, task.status, task.deadline)])
+        self._invalidate_tasks([task_id])
+        self._record_changes("task", "updated", [(task_id, task.project_id)])
         return task
 
+    @atomic
     def delete_task(self, task_id: str) -> bool:
-        task = self.get_task(task_id)
+        task = self.tasks.get(task_id, for_update=True)
         if not task:
             raise ValueError("Task not found")
 
+        project_id = task.project_id
+        self.projects.adjust_task_counts({project_id: -1})
         self.tasks.delete(task)
+        self.stats.apply([(project_id, task.status, task.deadline)], [])
+        self._invalidate_tasks([task_id])
+        self._record_changes("task", "deleted", [(task_id, project_id)])
         return True
 
-    def close_overdue_tasks(self) -> int:
+    @atomic
+    def update_tasks(
+        self,
+        task_filter: TaskFilter,
+        status: Optional[str] = None,
+        deadline: Optional[datetime] = None,
+    ) -> int:
+        """
+        Set status and/or deadline on every task matching the filter with a
+        single UPDATE. Returns the number of tasks updated.
+        """
+        if task_filter.is_empty():
+            raise ValueError("At least one filter is required for bulk updates")
+
+        values: Dict[str, Any] = {}
+        if status is not None:
+            validate_task_status(status)
+            values["status"] = status
+        if deadline is not None:
+            values["deadline"] = deadline
+        if not values:
+            raise ValueError("Nothing to update")
+
+        updated = self.tasks.update_many(task_filter, values)
+        self.stats.apply(
+            self._states(updated),
+            [
+                (
+                    row.project_id,
+                    values.get("status", row.status),
+                    values.get("deadline", row.deadline),
+                )
+                for row in updated
+            ],
+        )
+        self._invalidate_tasks([row.id for row in updated])
+        self._record_changes("task", "updated", self._pairs(updated))
+        return len(updated)
+
+    @atomic
+    def delete_tasks(self, task_filter: TaskFilter) -> int:
+        """
+        Delete every task matching the filter with a single DELETE.
+        Returns the number of tasks deleted.
+        """
+        if task_filter.is_empty():
+            raise ValueError("At least one filter is required for bulk deletes")
+
+        deleted = self.tasks.delete_many(task_filter)
+        self.projects.adjust_task_counts(
+            {
+                project_id: -count
+                for project_id, count in Counter(
+                    row.project_id for row in deleted
+                ).items()
+            }
+        )
+        self.stats.apply(self._states(deleted), [])
+        commit(self.db)
+
+        task_ids = [row.id for row in deleted]
+        self._invalidate_tasks(task_ids)
+        self._record_changes("task", "deleted", self._pairs(deleted))
+        return len(task_ids)
+
+    def close_overdue_tasks(
+        self, batch_size: Optional[int] = None, dry_run: bool = False
+    ) -> int:
         """
         Close all tasks whose deadline has passed and are not done yet.
         Returns the number of tasks that were updated.
+
+        Runs as set-based UPDATE statements without loading any Task objects,
+        batch_size tasks at a time (default: OVERDUE_BATCH_SIZE). Each batch
+        is committed separately, so row locks and the per-task bookkeeping
+        are held only for one batch. With dry_run, nothing is written and
+        the number of tasks that would be closed is returned.
         """
+        if batch_size is None:
+            batch_size = self.config.OVERDUE_BATCH_SIZE
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+
         now = datetime.utcnow()
 
-        overdue_tasks = (
-            self.db.query(Task)
-            .filter(
-                Task.deadline.isnot(None),
-                Task.deadline < now,
-                Task.status != "done",
+        if dry_run:
+            return self.tasks.count_overdue(now)
+
+        closed = 0
+        while True:
+            # One unit per batch: each commits on its own
+            with unit_of_work(self.db):
+                batch = self.tasks.close_overdue(now, limit=batch_size)
+                self.stats.apply(
+                    self._states(batch),
+                    [(row.project_id, "done", row.deadline) for row in batch],
+                )
+                self._invalidate_tasks([row.id for row in batch])
+                self._record_changes("task", "updated", self._pairs(batch))
+            closed += len(batch)
+            if len(batch) < batch_size:
+                return closed
+
+    def upcoming_deadlines(self, limit: int) -> List[datetime]:
+        """The next limit deadlines of open tasks that have not passed yet."""
+        return self.tasks.upcoming_deadlines(datetime.utcnow(), limit)
+
+    # ==================== Counters ====================
+
+    @atomic
+    def reconcile_counters(self) -> Dict[str, int]:
+        """
+        Repair drift in the denormalized counters (projects.task_count and
+        the projects counter), e.g. after manual SQL or an interrupted
+        migration. Returns how many task counts were fixed and by how much
+        the project counter was off.
+        """
+        fixed = self.projects.reconcile_task_counts()
+        drift = self.projects.reconcile_project_count()
+        commit(self.db)
+        return {"task_counts_fixed": fixed, "project_count_drift": drift}
+
+    # ==================== Statistics ====================
+
+    def get_project_stats(self, project_id: str) -> ProjectStats:
+        """
+        Task counts per status, overdue tasks and the next deadline of one
+        project, read from its project_stats row.
+        """
+        stats = self.stats.get(project_id, datetime.utcnow())
+        if stats is None:
+            raise ValueError("Project not found")
+        return stats
+
+    def list_project_stats(self) -> List[ProjectStats]:
+        """get_project_stats for every project, one row each."""
+        return self.stats.list(datetime.utcnow())
+
+    @atomic
+    def rebuild_project_stats(self) -> int:
+        """
+        Recompute project_stats from the tasks, e.g. after manual SQL.
+        Returns the number of projects.
+        """
+        rebuilt = self.stats.rebuild()
+        commit(self.db)
+        return rebuilt
+
+    # ==================== Export ====================
+
+    def export_tasks(
+        self, fmt: str = "ndjson", project_id: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Stream tasks as NDJSON or CSV text chunks, one chunk per batch of
+        EXPORT_BATCH_SIZE rows read from a server-side cursor.
+        """
+        validate_export_format(fmt)
+        return self._export_chunks(fmt, project_id)
+
+    def _export_chunks(self, fmt: str, project_id: Optional[str]) -> Iterator[str]:
+        header = export_header(fmt)
+        if header:
+            yield header
+        for rows in self.tasks.stream(self.config.EXPORT_BATCH_SIZE, project_id):
+            yield encode_rows(rows, fmt)
+
+    # ==================== Sync ====================
+
+    def sync_changes(
+        self, token: Optional[str] = None, limit: Optional[int] = None
+    ) -> ChangeSet:
+        """
+        Tasks and projects created, updated or deleted since token, as one
+        range scan per table over change_seq. Without a token, everything.
+        Follow next_token while has_more; keep the last one for next time.
+        """
+        return self.changes.changes_since(token, self._page_size(limit))
+
+    # ==================== Helpers ====================
+
+    def _invalidate_project(self, project_id: str) -> None:
+        if self.cache:
+            after_commit(
+                self.db, lambda: self.cache.invalidate_project(project_id)
             )
-            .all()
-        )
 
-        for task in overdue_tasks:
-            task.status = "done"
+    def _invalidate_tasks(self, task_ids: List[str]) -> None:
+        if self.cache and task_ids:
+            after_commit(self.db, lambda: self.cache.invalidate_tasks(task_ids))
+
+    def _record_changes(
+        self, entity: str, action: str, changes: Iterable[Tuple[str, Optional[str]]]
+    ) -> None:
+        """
+        Record (id, project_id) pairs of one kind as changed: number them in
+        the change sequence when the write commits, keep tombstones of the
+        deleted ones for GET /sync, and record change events.
+        """
+        changes = list(changes)
+        if not changes:
+            return
+        if action == "deleted":
+            self.changes.add_tombstones(entity, changes)
+            table = Tombstone.__table__
+        else:
+            table = (Task if entity == "task" else Project).__table__
+        before_commit(self.db, lambda: self.changes.stamp_pending([table]))
+        if self.events:
+            self.events.record(
+                self.db,
+                [
+                    ChangeEvent(entity, action, entity_id, project_id)
+                    for entity_id, project_id in changes
+                ],
+            )
+
+    @staticmethod
+    def _states(tasks: Iterable[Any]) -> List[TaskState]:
+        """(project_id, status, deadline) of Task objects or task rows."""
+        return [(task.project_id, task.status, task.deadline) for task in tasks]
+
+    @staticmethod
+    def _pairs(tasks: Iterable[Any]) -> List[Tuple[str, Optional[str]]]:
+        """(id, project_id) of Task objects or task rows."""
+        return [(task.id, task.project_id) for task in tasks]
+
+    def _validate_bulk_items(
+        self, items: Iterable[Tuple[int, Dict[str, Any]]]
+    ) -> Tuple[List[Tuple[int, Dict[str, Any]]], List[BulkItemError]]:
+        """
+        Validate (index, item) pairs of a bulk write: field rules first, then
+        project existence and MAX_TASKS_PER_PROJECT with one query each for
+        all projects involved. Returns the accepted pairs and the errors,
+        sorted by index.
+        """
+        errors: List[BulkItemError] = []
+        valid: List[Tuple[int, Dict[str, Any]]] = []
+
+        # Field-level validation
+        for index, item in items:
+            try:
+                validate_task_title(item["title"], self.config)
+                validate_task_description(item.get("description", ""), self.config)
+                validate_task_status(item.get("status", "todo"))
+            except ValueError as e:
+                errors.append(BulkItemError(index, str(e)))
+                continue
+            valid.append((index, item))
+
+        # Project existence and task count constraint, one query for all
+        # projects (their denormalized task_count)
+        project_ids = {item["project_id"] for _, item in valid}
+        task_counts = self.projects.task_counts(project_ids)
+
+        accepted: List[Tuple[int, Dict[str, Any]]] = []
+        for index, item in valid:
+            project_id = item["project_id"]
+            if project_id not in task_counts:
+                errors.append(BulkItemError(index, "Project not found"))
+                continue
+            if task_counts.get(project_id, 0) >= self.config.MAX_TASKS_PER_PROJECT:
+                errors.append(
+                    BulkItemError(
+                        index,
+                        f"Cannot create more than {self.config.MAX_TASKS_PER_PROJECT} tasks for this project",
+                    )
+                )
+                continue
+            task_counts[project_id] = task_counts.get(project_id, 0) + 1
+            accepted.append((index, item))
+
+        errors.sort(key=lambda error: error.index)
+        return accepted, errors
+
+    def _reserve_bulk_slots(
+        self, accepted: List[Tuple[int, Dict[str, Any]]]
+    ) -> Tuple[List[Tuple[int, Dict[str, Any]]], List[BulkItemError]]:
+        """
+        Reserve task_count slots for validated bulk items, one conditional
+        UPDATE per project. The counts read by _validate_bulk_items may
+        have been overtaken by concurrent writes; items of projects whose
+        reservation fails are returned as errors. Does not commit.
+        """
+        per_project = Counter(item["project_id"] for _, item in accepted)
+        full = {
+            project_id
+            for project_id, count in per_project.items()
+            if not self.projects.reserve_task_slots(
+                project_id, count, self.config.MAX_TASKS_PER_PROJECT
+            )
+        }
+        if not full:
+            return accepted, []
+        message = (
+            f"Cannot create more than {self.config.MAX_TASKS_PER_PROJECT} tasks for this project"
+        )
+        return (
+            [(index, item) for index, item in accepted if item["project_id"] not in full],
+            [
+                BulkItemError(index, message)
+                for index, item in accepted
+                if item["project_id"] in full
+            ],
+        )
 
-        self.db.commit()
-        return len(overdue_tasks)
+    def _page_size(self, limit: Optional[int]) -> int:
+        if limit is None:
+            return self.config.DEFAULT_PAGE_SIZE
+        if limit < 1:
+            raise ValueError("Page limit must be at least 1")
+        return min(limit, self.config.MAX_PAGE_SIZE)
@@ -11,7 +11,16 @@ if TYPE_CHECKING:
 
 
 class Task:
-    """Represents a task in the ToDoList."""
+    """
+    Represents a task in the ToDoList.
+
+    Slotted (no per-instance __dict__), so millions of tasks can be held
+    in memory for batch planning; see benchmarks/domain_objects.py.
+    """
+
+    __slots__ = (
+        "id", "title", "description", "status", "created_at", "deadline", "project_id"
+    )
 
     VALID_STATUSES = ["todo", "in_progress", "done"]
 
@@ -30,7 +39,13 @@ class Task:
         status: str = "todo",
         deadline: Optional[datetime] = None,
         project_id: Optional[str] = None,
+        id: Optional[str] = None,
+        created_at: Optional[datetime] = None,
     ) -> None:
+        """
+        id and created_at are generated when not given; pass them when
+        loading existing tasks to skip the uuid4() and now() calls.
+        """
         if len(title) > 50:
             raise ValueError("Task title cannot exceed 50 characters.")
         if len(description) > 200:
@@ -38,11 +53,11 @@ class Task:
         if status not in self.VALID_STATUSES:
             raise ValueError(f"Status must be one of {self.VALID_STATUSES}")
 
-        self.id = str(uuid.uuid4())
+        self.id = id if id else str(uuid.uuid4())
         self.title = title
         self.description = description
         self.status = status
-        self.created_at = datetime.now()
+        self.created_at = created_at if created_at else datetime.now()
         self.deadline = deadline
         self.project_id = project_id
 
@@ -3,6 +3,7 @@ from typing import Any
 from core.services.todo_manager import TodoManager
 from cli.menu import Menu
 from core.database import SessionLocal
+from core.events import event_hub
 # Optional: If you want to auto-create tables every time the app runs:
 # from core.create_tables import create_tables
 
@@ -12,12 +13,14 @@ def main() -> None:
     # Optional: create tables
     # create_tables()
 
-    # Create a database session
-    db = SessionLocal()
+    # Create a database session. It lives as long as the menu, so let
+    # commits expire loaded objects and re-read rows changed elsewhere.
+    db = SessionLocal(expire_on_commit=True)
 
     try:
-        # Initialize TodoManager with the database session
-        manager: TodoManager = TodoManager(db=db)
+        # Initialize TodoManager with the database session. Its writes
+        # reach API event streams through NOTIFY on PostgreSQL
+        manager: TodoManager = TodoManager(db=db, events=event_hub)
 
         # Create and display the main menu
         menu: Menu = Menu(manager)
@@ -0,0 +1,45 @@
+# tests/conftest.py
+import os
+import tempfile
+
+# core.database builds its engines when first imported, so point it at a
+# throwaway SQLite file before any test module imports the app
+_DB_DIR = tempfile.mkdtemp(prefix="todolist-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_DB_DIR, 'test.db')}"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ["CACHE_BACKEND"] = "none"
+
+from typing import Iterator
+
+import pytest
+from sqlalchemy.orm import Session
+
+import core.models  # noqa: F401  (register all tables on Base.metadata)
+from core.config import Config
+from core.database import Base, SessionLocal, engine
+from core.services.todo_manager import TodoManager
+
+
+@pytest.fixture
+def config() -> Config:
+    """A Config with small limits; tests may tweak attributes freely."""
+    config = Config()
+    config.MAX_PROJECTS = 5
+    config.MAX_TASKS_PER_PROJECT = 5
+    return config
+
+
+@pytest.fixture
+def db() -> Iterator[Session]:
+    Base.metadata.create_all(engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def manager(db: Session, config: Config) -> TodoManager:
+    return TodoManager(db=db, config=config)
@@ -0,0 +1,231 @@
+# tests/test_cache.py
+import time
+from typing import List
+
+import fakeredis
+import pytest
+
+from core.cache import EntityCache, InMemoryCache, RedisCache
+from core.cache.backends import TOMBSTONE
+from core.repositories.task_filter import TaskFilter
+from core.services.todo_manager import TodoManager
+
+
+class Clock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr("core.cache.backends.time.monotonic", clock)
+    return clock
+
+
+class RecordingCache(InMemoryCache):
+    """InMemoryCache that remembers every invalidated key."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.invalidated: List[str] = []
+
+    def delete(self, keys, ttl):
+        keys = list(keys)
+        self.invalidated.extend(keys)
+        super().delete(keys, ttl)
+
+
+# ==================== InMemoryCache ====================
+
+def test_memory_cache_expires_entries_after_ttl(clock: Clock) -> None:
+    cache = InMemoryCache()
+    cache.set("k", {"v": 1}, ttl=10)
+
+    clock.now += 9.9
+    assert cache.get("k") == {"v": 1}
+    clock.now += 0.1
+    assert cache.get("k") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_memory_cache_evicts_least_recently_used(clock: Clock) -> None:
+    cache = InMemoryCache(max_entries=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    cache.get("a")  # b is now the least recently used
+    cache.set("c", 3, ttl=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_memory_cache_counts_hits_and_misses(clock: Clock) -> None:
+    cache = InMemoryCache()
+    cache.set("k", 1, ttl=60)
+    cache.get("k")
+    cache.get("missing")
+    cache.delete(["k"], ttl=60)
+    cache.get("k")
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["invalidations"]) == (1, 2, 1)
+
+
+# ==================== RedisCache ====================
+
+@pytest.fixture
+def redis_cache() -> RedisCache:
+    return RedisCache(fakeredis.FakeRedis(), prefix="test:")
+
+
+def test_redis_cache_round_trip_with_ttl(redis_cache: RedisCache) -> None:
+    redis_cache.set("k", {"id": "1", "n": 2}, ttl=30)
+
+    assert redis_cache.get("k") == {"id": "1", "n": 2}
+    assert 0 < redis_cache.client.ttl("test:k") <= 30
+
+
+def test_redis_cache_invalidation_leaves_tombstone(redis_cache: RedisCache) -> None:
+    redis_cache.set("a", 1, ttl=30)
+    redis_cache.set("b", 2, ttl=30)
+    redis_cache.delete(["a", "b"], ttl=30)
+
+    assert redis_cache.get("a") is None
+    assert redis_cache.get("b") is None
+    assert redis_cache.client.exists("test:a")
+    assert redis_cache.stats()["invalidations"] == 2
+
+
+@pytest.mark.parametrize("make_cache", [
+    InMemoryCache,
+    lambda: RedisCache(fakeredis.FakeRedis()),
+])
+def test_value_loaded_before_invalidation_is_not_cached(make_cache) -> None:
+    cache = make_cache()
+    loaded_at = 100.0
+    cache._set("k", {TOMBSTONE: 101.0}, 60)
+
+    # A reader that started before the invalidation must not re-cache
+    cache.set("k", {"v": "old"}, ttl=60, loaded_at=loaded_at)
+    assert cache.get("k") is None
+
+    # One that started afterwards may
+    cache.set("k", {"v": "new"}, ttl=60, loaded_at=102.0)
+    assert cache.get("k") == {"v": "new"}
+
+
+def test_redis_invalidation_racing_a_write_wins() -> None:
+    server = fakeredis.FakeServer()
+    cache = RedisCache(fakeredis.FakeRedis(server=server))
+    writer = RedisCache(fakeredis.FakeRedis(server=server))
+    pipeline = cache.client.pipeline
+
+    def racing_pipeline(*args, **kwargs):
+        # Another worker invalidates the key right after the watched read
+        pipe = pipeline(*args, **kwargs)
+        read = pipe.get
+
+        def get(name):
+            value = read(name)
+            if not writer.invalidations:
+                writer.delete(["k"], ttl=60)
+            return value
+
+        pipe.get = get
+        return pipe
+
+    cache.client.pipeline = racing_pipeline
+    cache.set("k", {"v": "old"}, ttl=60, loaded_at=time.time())
+
+    assert cache.get("k") is None
+
+
+# ==================== TodoManager invalidation ====================
+
+@pytest.fixture
+def recorder() -> RecordingCache:
+    return RecordingCache()
+
+
+@pytest.fixture
+def cached_manager(db, config, recorder: RecordingCache) -> TodoManager:
+    config.MAX_TASKS_PER_PROJECT = 20
+    return TodoManager(db=db, config=config, cache=EntityCache(recorder, ttl=60))
+
+
+def _seed(manager: TodoManager):
+    project = manager.create_project("p", "")
+    other = manager.create_project("q", "")
+    tasks = [manager.create_task(project.id, f"t{i}", "") for i in range(3)]
+    other_task = manager.create_task(other.id, "o", "")
+    return project, [t.id for t in tasks], other_task.id
+
+
+def test_get_project_is_served_from_cache(cached_manager: TodoManager) -> None:
+    project = cached_manager.create_project("p", "")
+    project_id = project.id
+    cached_manager.db.expunge_all()
+
+    cached_manager.get_project(project_id)
+    cached_manager.db.expunge_all()
+    assert cached_manager.get_project(project_id).id == project_id
+    assert cached_manager.cache.stats()["hits"] == 1
+
+
+def test_edit_project_invalidates_only_that_project(cached_manager, recorder) -> None:
+    project, _, _ = _seed(cached_manager)
+    recorder.invalidated.clear()
+
+    cached_manager.edit_project(project.id, description="changed")
+    assert recorder.invalidated == [f"project:{project.id}"]
+
+
+def test_delete_project_invalidates_project_and_its_tasks(cached_manager, recorder) -> None:
+    project, task_ids, _ = _seed(cached_manager)
+    project_id = project.id
+    recorder.invalidated.clear()
+
+    cached_manager.delete_project(project_id)
+    assert sorted(recorder.invalidated) == sorted(
+        [f"project:{project_id}"] + [f"task:{task_id}" for task_id in task_ids]
+    )
+
+
+def test_edit_and_delete_task_invalidate_only_that_task(cached_manager, recorder) -> None:
+    _, task_ids, _ = _seed(cached_manager)
+    recorder.invalidated.clear()
+
+    cached_manager.edit_task(task_ids[0], status="done")
+    assert recorder.invalidated == [f"task:{task_ids[0]}"]
+
+    recorder.invalidated.clear()
+    cached_manager.delete_task(task_ids[1])
+    assert recorder.invalidated == [f"task:{task_ids[1]}"]
+
+
+def test_bulk_update_and_delete_invalidate_matched_tasks(cached_manager, recorder) -> None:
+    project, task_ids, _ = _seed(cached_manager)
+    project_id = project.id
+    recorder.invalidated.clear()
+
+    cached_manager.update_tasks(TaskFilter(ids=task_ids[:2]), status="done")
+    assert sorted(recorder.invalidated) == sorted(f"task:{t}" for t in task_ids[:2])
+
+    recorder.invalidated.clear()
+    cached_manager.delete_tasks(TaskFilter(project_id=project_id))
+    assert sorted(recorder.invalidated) == sorted(f"task:{t}" for t in task_ids)
+
+
+def test_invalidation_waits_for_transaction_commit(cached_manager, recorder) -> None:
+    _, task_ids, _ = _seed(cached_manager)
+    recorder.invalidated.clear()
+
+    with cached_manager.transaction():
+        cached_manager.edit_task(task_ids[0], title="renamed")
+        assert recorder.invalidated == []
+    assert recorder.invalidated == [f"task:{task_ids[0]}"]
@@ -0,0 +1,123 @@
+# tests/test_change_events.py
+"""Change events recorded by TodoManager and served by the event hub."""
+import asyncio
+from typing import Iterator, List
+
+import pytest
+
+from app.api.sse import event_stream
+from core.database import AsyncSessionLocal, async_engine
+from core.events import ChangeEvent, EventHub
+from core.services.async_todo_manager import AsyncTodoManager
+from core.services.todo_manager import TodoManager
+
+
+@pytest.fixture
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def hub(loop) -> EventHub:
+    hub = EventHub(buffer_size=3, queue_size=2)
+    hub.start(loop)
+    return hub
+
+
+def delivered(loop: asyncio.AbstractEventLoop, hub: EventHub) -> List[str]:
+    """Run the publishes queued so far; returns the buffered event types."""
+    loop.run_until_complete(asyncio.sleep(0))
+    return [event.type for event in hub._buffer]
+
+
+def test_writes_publish_events_after_commit(db, config, loop, hub) -> None:
+    manager = TodoManager(db=db, config=config, events=hub)
+    project = manager.create_project("p", "")
+    task = manager.create_task(project.id, "t", "")
+    manager.edit_task(task.id, status="done")
+
+    assert delivered(loop, hub) == ["project.created", "task.created", "task.updated"]
+    events = list(hub._buffer)
+    assert [event.project_id for event in events] == [project.id] * 3
+    assert events[0].seq < events[1].seq < events[2].seq
+
+    with manager.transaction():
+        manager.delete_task(task.id)
+        # Nothing is published before the unit commits
+        assert delivered(loop, hub)[-1] == "task.updated"
+        with pytest.raises(RuntimeError):
+            with manager.transaction():
+                manager.create_project("q", "")
+                raise RuntimeError("boom")
+    # The failed block's events were rolled back with it
+    assert delivered(loop, hub) == ["task.created", "task.updated", "task.deleted"]
+
+
+def test_async_nested_failure_drops_its_events(db, config) -> None:
+    hub = EventHub()
+
+    async def scenario() -> List[str]:
+        hub.start(asyncio.get_running_loop())
+        try:
+            async with AsyncSessionLocal() as session:
+                manager = AsyncTodoManager(session, config=config, events=hub)
+                async with manager.transaction():
+                    await manager.create_project("outer", "")
+                    with pytest.raises(RuntimeError):
+                        async with manager.transaction():
+                            await manager.create_project("inner", "")
+                            raise RuntimeError("boom")
+                await asyncio.sleep(0)
+                return [project.name for project in await manager.list_projects()]
+        finally:
+            # Pooled aiosqlite connections must not outlive this event loop
+            await async_engine.dispose()
+
+    assert asyncio.run(scenario()) == ["outer"]
+    assert [event.type for event in hub._buffer] == ["project.created"]
+
+
+def test_resume_after_last_event_id(hub) -> None:
+    for i in range(4):
+        hub.publish(ChangeEvent("task", "created", f"t{i}", seq=i + 1))
+
+    assert [e.id for e in hub.subscribe(last_event_id="2").backlog] == ["t2", "t3"]
+    assert hub.subscribe(last_event_id="4").backlog == []
+    # Seq 1 fell out of the buffer; unknown IDs cannot be resumed either
+    assert hub.subscribe(last_event_id="1").missed
+    assert hub.subscribe(last_event_id="nope").missed
+
+
+def test_slow_subscriber_is_dropped(loop, hub) -> None:
+    slow = hub.subscribe()
+    other_project = hub.subscribe(project_id="other")
+    for i in range(3):
+        hub.publish(ChangeEvent("task", "created", f"t{i}", "p", seq=i + 1))
+
+    # The queue held two events: the stream ends and the client resumes
+    assert slow.queue.get_nowait() is None
+    assert slow not in hub._subscriptions
+    assert other_project.queue.empty()
+
+
+def test_event_stream_format(loop, hub) -> None:
+    async def read() -> List[str]:
+        stream = event_stream(hub, None, None, keepalive=0.01)
+        chunks = [await stream.__anext__()]
+        hub.publish(ChangeEvent("project", "deleted", "p1", "p1", seq=7))
+        chunks.append(await stream.__anext__())
+        chunks.append(await stream.__anext__())
+        await stream.aclose()
+        return chunks
+
+    retry, event, keepalive = loop.run_until_complete(read())
+
+    assert retry == "retry: 3000\n\n"
+    assert event == (
+        "id: 7\nevent: project.deleted\n"
+        'data: {"entity":"project","action":"deleted","id":"p1","project_id":"p1"}\n\n'
+    )
+    assert keepalive == ": keep-alive\n\n"
+    assert not hub._subscriptions
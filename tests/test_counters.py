@@ -0,0 +1,170 @@
+# tests/test_counters.py
+"""projects.task_count and the projects counter across every write path."""
+from typing import Dict
+
+import pytest
+from sqlalchemy import func, select, text, update
+
+from core.models import EntityCounter, Project, Task
+from core.repositories.task_filter import TaskFilter
+from core.services.todo_manager import TodoManager
+
+
+def task_counts(manager: TodoManager) -> Dict[str, int]:
+    manager.db.expire_all()
+    return dict(manager.db.execute(select(Project.name, Project.task_count)).all())
+
+
+def project_counter(manager: TodoManager) -> int:
+    return manager.db.scalar(
+        select(EntityCounter.value).where(EntityCounter.name == EntityCounter.PROJECTS)
+    )
+
+
+def assert_counters_exact(manager: TodoManager) -> None:
+    manager.db.expire_all()
+    actual = dict(
+        manager.db.execute(
+            select(Project.name, func.count(Task.id))
+            .outerjoin(Task, Task.project_id == Project.id)
+            .group_by(Project.name)
+        ).all()
+    )
+    assert task_counts(manager) == actual
+    assert project_counter(manager) == manager.db.scalar(
+        select(func.count()).select_from(Project)
+    )
+
+
+# ==================== Projects ====================
+
+def test_create_project_counts_and_enforces_the_limit(manager, config) -> None:
+    for i in range(config.MAX_PROJECTS):
+        manager.create_project(f"p{i}", "")
+
+    with pytest.raises(ValueError, match="Cannot create more than 5 projects"):
+        manager.create_project("extra", "")
+    assert project_counter(manager) == config.MAX_PROJECTS
+    assert_counters_exact(manager)
+
+
+def test_duplicate_project_name_gives_its_slot_back(manager) -> None:
+    manager.create_project("p", "")
+
+    with pytest.raises(ValueError, match="already exists"):
+        manager.create_project("p", "")
+    assert project_counter(manager) == 1
+
+
+def test_upsert_counts_only_real_creates(manager) -> None:
+    manager.upsert_project("p", "a")
+    manager.upsert_project("p", "b")
+
+    assert project_counter(manager) == 1
+
+
+def test_delete_project_releases_its_slot(manager) -> None:
+    project = manager.create_project("p", "")
+    manager.create_task(project.id, "t", "")
+    manager.delete_project(project.id)
+
+    assert project_counter(manager) == 0
+    assert_counters_exact(manager)
+
+
+# ==================== Tasks ====================
+
+def test_create_task_counts_and_enforces_the_limit(manager, config) -> None:
+    project = manager.create_project("p", "")
+    for i in range(config.MAX_TASKS_PER_PROJECT):
+        manager.create_task(project.id, f"t{i}", "")
+
+    with pytest.raises(ValueError, match="Cannot create more than 5 tasks"):
+        manager.create_task(project.id, "extra", "")
+    assert task_counts(manager) == {"p": 5}
+
+
+def test_bulk_create_with_partial_counts_only_created_rows(manager) -> None:
+    project = manager.create_project("p", "")
+    items = [{"project_id": project.id, "title": f"t{i}"} for i in range(7)]
+
+    result = manager.create_tasks_bulk(items, allow_partial=True)
+
+    assert (len(result.created), len(result.errors)) == (5, 2)
+    assert task_counts(manager) == {"p": 5}
+
+
+def test_bulk_create_rejected_as_a_whole_leaves_counts_alone(manager) -> None:
+    project = manager.create_project("p", "")
+    items = [{"project_id": project.id, "title": "ok"}, {"project_id": project.id, "title": ""}]
+
+    result = manager.create_tasks_bulk(items)
+
+    assert result.created == [] and len(result.errors) == 1
+    assert task_counts(manager) == {"p": 0}
+
+
+def test_bulk_create_returns_slots_when_a_reservation_is_lost(manager, monkeypatch) -> None:
+    first = manager.create_project("first", "")
+    second = manager.create_project("second", "")
+    reserve = manager.projects.reserve_task_slots
+    # As if a concurrent writer filled "second" after validation
+    monkeypatch.setattr(
+        manager.projects,
+        "reserve_task_slots",
+        lambda project_id, count, limit: project_id != second.id
+        and reserve(project_id, count, limit),
+    )
+
+    result = manager.create_tasks_bulk(
+        [{"project_id": first.id, "title": "a"}, {"project_id": second.id, "title": "b"}]
+    )
+
+    assert result.created == [] and [e.index for e in result.errors] == [1]
+    assert task_counts(manager) == {"first": 0, "second": 0}
+
+
+def test_import_counts_duplicates_once(manager) -> None:
+    project = manager.create_project("p", "")
+    record = {"project_id": project.id, "title": "t", "id": "legacy-1"}
+
+    assert len(manager.import_tasks([record, dict(record)]).created) == 1
+    assert len(manager.import_tasks([dict(record)]).created) == 0
+    assert task_counts(manager) == {"p": 1}
+    assert_counters_exact(manager)
+
+
+def test_delete_paths_decrement_counts(manager) -> None:
+    p = manager.create_project("p", "")
+    q = manager.create_project("q", "")
+    p_tasks = [manager.create_task(p.id, f"t{i}", "").id for i in range(3)]
+    for i in range(2):
+        manager.create_task(q.id, f"u{i}", "")
+
+    manager.delete_task(p_tasks[0])
+    assert task_counts(manager) == {"p": 2, "q": 2}
+
+    manager.delete_tasks(TaskFilter(ids=p_tasks[1:]))
+    manager.delete_tasks(TaskFilter(project_id=q.id))
+    assert task_counts(manager) == {"p": 0, "q": 0}
+    assert_counters_exact(manager)
+
+
+# ==================== Reconciliation ====================
+
+def test_reconcile_counters_repairs_drift(manager) -> None:
+    project = manager.create_project("p", "")
+    manager.create_task(project.id, "t", "")
+    manager.db.execute(update(Project).values(task_count=99))
+    manager.db.execute(text("UPDATE entity_counters SET value = 7"))
+    manager.db.commit()
+
+    assert manager.reconcile_counters() == {
+        "task_counts_fixed": 1,
+        "project_count_drift": 6,
+    }
+    assert_counters_exact(manager)
+    assert manager.reconcile_counters() == {
+        "task_counts_fixed": 0,
+        "project_count_drift": 0,
+    }
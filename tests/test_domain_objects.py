@@ -0,0 +1,29 @@
+# tests/test_domain_objects.py
+"""The slotted in-memory core.Task / core.Project objects."""
+from datetime import datetime
+
+import pytest
+
+from core import Project, Task
+
+
+def test_tasks_are_slotted_and_keep_given_ids() -> None:
+    created_at = datetime(2026, 1, 1)
+    task = Task("t", id="task-1", created_at=created_at)
+
+    assert (task.id, task.created_at) == ("task-1", created_at)
+    assert Task("t").id != Task("t").id
+    with pytest.raises(AttributeError):
+        task.extra = 1
+
+
+def test_project_tasks_are_keyed_by_id() -> None:
+    project = Project("p", "")
+    first, second = Task("a"), Task("b")
+    project.add_tasks([first, second])
+
+    project.remove_task(first.id)
+    project.remove_task("missing")
+
+    assert project.get_task(second.id) is second
+    assert list(project.tasks) == [second.id]
@@ -0,0 +1,58 @@
+# tests/test_overdue_scheduler.py
+"""The in-process scheduler closing overdue tasks as deadlines pass."""
+import asyncio
+from datetime import datetime, timedelta
+
+from core.database import AsyncSessionLocal, async_engine
+from core.services.overdue_scheduler import OverdueScheduler
+
+
+def test_tick_closes_expired_tasks_and_refresh_tracks_the_next_deadline(
+    manager, db, config
+) -> None:
+    project_id = manager.create_project("p", "").id
+    now = datetime.utcnow()
+    expired = manager.create_task(project_id, "expired", "", deadline=now - timedelta(minutes=1))
+    manager.create_task(project_id, "done", "", status="done", deadline=now + timedelta(minutes=1))
+    manager.create_task(project_id, "soon", "", deadline=now + timedelta(seconds=30))
+    manager.create_task(project_id, "later", "", deadline=now + timedelta(hours=1))
+    config.OVERDUE_WINDOW = 1
+    scheduler = OverdueScheduler(async_engine, AsyncSessionLocal, config)
+
+    async def scenario():
+        try:
+            closed = await scheduler.tick()
+            await scheduler.refresh()
+            return closed
+        finally:
+            # Pooled aiosqlite connections must not outlive this event loop
+            await async_engine.dispose()
+
+    assert asyncio.run(scenario()) == 1
+    db.expire_all()
+    assert manager.get_task(expired.id).status == "done"
+    # Only the nearest open deadline is kept; the window is full, so an
+    # empty heap means a reload rather than a sleep
+    assert 0 < scheduler.seconds_until_next() <= 30
+    assert not scheduler.refresh_due()
+    scheduler._deadlines.clear()
+    assert scheduler.refresh_due()
+
+
+def test_close_overdue_tasks_batches_by_default(manager, config, monkeypatch) -> None:
+    config.OVERDUE_BATCH_SIZE = 2
+    project_id = manager.create_project("p", "").id
+    past = datetime.utcnow() - timedelta(minutes=1)
+    for title in "abcde":
+        manager.create_task(project_id, title, "", deadline=past)
+    limits = []
+    close_overdue = manager.tasks.close_overdue
+
+    def recording(now, limit=None):
+        limits.append(limit)
+        return close_overdue(now, limit=limit)
+
+    monkeypatch.setattr(manager.tasks, "close_overdue", recording)
+
+    assert manager.close_overdue_tasks() == 5
+    assert limits == [2, 2, 2]
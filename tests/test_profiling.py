@@ -0,0 +1,70 @@
+# tests/test_profiling.py
+"""Server-Timing headers, per-route metrics and the query limit warning."""
+import logging
+import sqlite3
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from core.config import settings
+from core.pool import TimedQueuePool
+
+
+@pytest.fixture
+def client(db, monkeypatch) -> TestClient:
+    monkeypatch.setattr(settings, "PROFILING_ENABLED", True)
+    monkeypatch.setattr(settings, "PROFILING_QUERY_LIMIT", 2)
+    with TestClient(create_app()) as client:
+        yield client
+
+
+def test_server_timing_reports_sql_statements(client) -> None:
+    response = client.post("/api/v1/projects/", json={"name": "p", "description": ""})
+
+    assert response.status_code == 201
+    timing = response.headers["server-timing"]
+    assert timing.startswith("app;dur=")
+    queries = int(timing.split('desc="')[1].split()[0])
+    assert queries > 0
+
+
+def test_metrics_are_labelled_by_route_template(client) -> None:
+    project_id = client.post("/api/v1/projects/", json={"name": "p", "description": ""}).json()["id"]
+    client.get(f"/api/v1/projects/{project_id}")
+    client.get("/api/v1/projects/missing")
+
+    body = client.get("/metrics").text
+
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/api/v1/projects/{project_id}"} 2'
+        in body
+    )
+    assert 'http_request_queries_bucket{method="POST",route="/api/v1/projects/",le="+Inf"} 1' in body
+
+
+def test_requests_over_the_query_limit_are_logged_and_counted(client, caplog) -> None:
+    with caplog.at_level(logging.WARNING, logger="app.api.profiling"):
+        client.post("/api/v1/projects/", json={"name": "p", "description": ""})
+
+    assert "SQL statements (limit 2)" in caplog.text
+    assert (
+        'http_requests_over_query_limit_total{method="POST",route="/api/v1/projects/"} 1'
+        in client.get("/metrics").text
+    )
+
+
+def test_pool_wait_time_leaves_out_connecting() -> None:
+    def slow_connect() -> sqlite3.Connection:
+        time.sleep(0.05)
+        return sqlite3.connect(":memory:")
+
+    pool = TimedQueuePool(slow_connect, pool_size=1, max_overflow=0)
+    pool.connect().close()
+    pool.connect().close()
+
+    wait_time = pool.wait_time.snapshot()
+    assert wait_time["count"] == 2
+    assert wait_time["sum"] < 0.05
+    pool.dispose()
@@ -0,0 +1,67 @@
+# tests/test_project_stats.py
+"""project_stats kept in step with task writes, and read back as of now."""
+from datetime import datetime, timedelta
+from typing import Dict, Tuple
+
+from core.repositories.task_filter import TaskFilter
+from core.services.todo_manager import TodoManager
+
+
+def snapshot(manager: TodoManager) -> Dict[str, Tuple]:
+    return {
+        stats.project_id: (
+            stats.todo,
+            stats.in_progress,
+            stats.done,
+            stats.earliest_deadline,
+            stats.overdue,
+            stats.next_deadline,
+        )
+        for stats in manager.list_project_stats()
+    }
+
+
+def test_task_writes_keep_stats_equal_to_a_rebuild(manager, config) -> None:
+    config.MAX_TASKS_PER_PROJECT = 10
+    now = datetime.utcnow()
+    soon, later = now + timedelta(hours=1), now + timedelta(days=1)
+    project_id = manager.create_project("p", "").id
+    other_id = manager.upsert_project("q", "")[0].id
+
+    first = manager.create_task(project_id, "a", "", deadline=soon)
+    manager.create_task(project_id, "b", "", status="in_progress", deadline=later)
+    manager.create_tasks_bulk(
+        [
+            {"project_id": other_id, "title": "c", "deadline": now - timedelta(days=1)},
+            {"project_id": other_id, "title": "d", "status": "done"},
+        ]
+    )
+    manager.import_tasks([{"project_id": project_id, "title": "e", "deadline": later}])
+    stats = manager.get_project_stats(project_id)
+    assert (stats.todo, stats.in_progress, stats.done) == (2, 1, 0)
+    assert stats.next_deadline == soon
+    other = manager.get_project_stats(other_id)
+    assert (other.overdue, other.next_deadline) == (1, None)
+
+    # Closing the earliest deadline moves it to the next one
+    manager.edit_task(first.id, status="done")
+    assert manager.get_project_stats(project_id).earliest_deadline == later
+    manager.update_tasks(TaskFilter(project_id=project_id), deadline=soon)
+    manager.delete_task(first.id)
+    manager.close_overdue_tasks(batch_size=1)
+    manager.delete_tasks(TaskFilter(project_id=other_id, status="done"))
+
+    kept = snapshot(manager)
+    assert kept[project_id][:4] == (1, 1, 0, soon)
+    assert kept[other_id][:4] == (0, 0, 0, None)
+    assert manager.rebuild_project_stats() == 2
+    assert snapshot(manager) == kept
+
+
+def test_stats_go_with_their_project(manager) -> None:
+    project_id = manager.create_project("p", "").id
+    manager.create_task(project_id, "a", "")
+
+    manager.delete_project(project_id)
+
+    assert manager.list_project_stats() == []
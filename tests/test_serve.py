@@ -0,0 +1,43 @@
+# tests/test_serve.py
+"""Worker count and per-worker DB pool sizing of the production server."""
+import pytest
+
+from app.serve import pool_limits, reserved_connections, worker_count
+
+
+def test_pool_limits_split_the_connection_budget(config) -> None:
+    config.DB_POOL_SIZE, config.DB_MAX_OVERFLOW = 5, 10
+
+    config.DB_MAX_CONNECTIONS = 0
+    assert pool_limits(config, 4) == (5, 10)
+    config.DB_MAX_CONNECTIONS = 40
+    assert pool_limits(config, 4) == (5, 5)
+    config.DB_MAX_CONNECTIONS = 9
+    assert pool_limits(config, 3) == (3, 0)
+    assert pool_limits(config, 9) == (1, 0)
+    with pytest.raises(ValueError):
+        pool_limits(config, 10)
+
+
+def test_pool_limits_leave_room_beside_background_connections(config) -> None:
+    config.ASYNC_DATABASE_URL = "postgresql+asyncpg://db/todo"
+    config.DB_POOL_SIZE, config.DB_MAX_OVERFLOW = 2, 10
+    config.OVERDUE_SCHEDULER_ENABLED = True
+    assert reserved_connections(config) == 2
+
+    # LISTEN and the scheduler lock take two of each worker's connections
+    config.DB_MAX_CONNECTIONS = 8
+    assert pool_limits(config, 2) == (3, 1)
+    with pytest.raises(ValueError):
+        pool_limits(config, 4)
+    config.OVERDUE_SCHEDULER_ENABLED = False
+    assert pool_limits(config, 4) == (2, 0)
+
+
+def test_worker_count_defaults_to_one_per_cpu(config, monkeypatch) -> None:
+    monkeypatch.setattr("os.cpu_count", lambda: 3)
+
+    config.WEB_CONCURRENCY = 0
+    assert worker_count(config) == 3
+    config.WEB_CONCURRENCY = 2
+    assert worker_count(config) == 2
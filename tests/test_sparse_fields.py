@@ -0,0 +1,74 @@
+# tests/test_sparse_fields.py
+"""fields= listings: only the requested columns are selected and returned."""
+from typing import List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.main import create_app
+from core.database import engine
+
+
+@pytest.fixture
+def client(db) -> TestClient:
+    with TestClient(create_app()) as client:
+        yield client
+
+
+@pytest.fixture
+def project_id(client) -> str:
+    project_id = client.post("/api/v1/projects/", json={"name": "p", "description": "x"}).json()["id"]
+    for i in range(3):
+        client.post(
+            "/api/v1/tasks/",
+            json={"project_id": project_id, "title": f"t{i}", "description": "long text"},
+        )
+    return project_id
+
+
+def test_task_listing_returns_only_requested_fields(manager, project_id) -> None:
+    statements: List[str] = []
+
+    def listener(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        page = manager.list_tasks_page(limit=2, fields=["title", "status"], sort="-title")
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert page.items == [
+        {"id": page.items[0]["id"], "title": "t2", "status": "todo"},
+        {"id": page.items[1]["id"], "title": "t1", "status": "todo"},
+    ]
+    assert "description" not in statements[-1]
+    # The sort key is read for the cursor even though it is not returned
+    rest = manager.list_tasks_page(limit=2, cursor=page.next_cursor, fields=["title"], sort="-title")
+    assert [item["title"] for item in rest.items] == ["t0"]
+
+
+def test_api_sparse_task_listing(client, project_id) -> None:
+    response = client.get("/api/v1/tasks/", params={"fields": "title, deadline", "limit": 2})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [set(item) for item in body["items"]] == [{"id", "title", "deadline"}] * 2
+    assert body["next_cursor"]
+    assert response.headers["etag"] != client.get("/api/v1/tasks/", params={"limit": 2}).headers["etag"]
+
+
+def test_api_sparse_project_listing_with_task_counts(client, project_id) -> None:
+    body = client.get("/api/v1/projects/", params={"fields": "name,task_counts"}).json()
+
+    assert body["items"] == [
+        {"id": project_id, "name": "p", "task_counts": {"todo": 3, "in_progress": 0, "done": 0}}
+    ]
+
+
+def test_unknown_field_is_rejected(client, project_id) -> None:
+    response = client.get("/api/v1/tasks/", params={"fields": "title,secret"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Unknown field: secret")
@@ -0,0 +1,93 @@
+# tests/test_sync.py
+"""Incremental sync of tasks and projects through the change sequence."""
+from typing import List, Optional, Tuple
+
+import pytest
+from sqlalchemy import select
+
+from core.models import PENDING_CHANGE, Project, Task, Tombstone
+from core.repositories.task_filter import TaskFilter
+from core.services.todo_manager import TodoManager
+
+
+def sync_all(manager: TodoManager, token: Optional[str], limit: int) -> Tuple[List, str]:
+    """Follow next_token until has_more is false; returns every item and the token."""
+    items: List = []
+    while True:
+        changes = manager.sync_changes(token, limit=limit)
+        items += [("project", p.id) for p in changes.projects]
+        items += [("task", t.id) for t in changes.tasks]
+        items += [(d["entity"] + ".deleted", d["id"]) for d in changes.deleted]
+        token = changes.next_token
+        if not changes.has_more:
+            return items, token
+
+
+def test_sync_returns_only_changes_since_the_token(manager, db) -> None:
+    project = manager.create_project("p", "")
+    other = manager.create_project("q", "")
+    first, second, third = (
+        manager.create_task(project.id, title, "").id for title in ("a", "b", "c")
+    )
+
+    items, token = sync_all(manager, None, limit=2)
+    assert sorted(items) == sorted(
+        [("project", project.id), ("project", other.id)]
+        + [("task", task_id) for task_id in (first, second, third)]
+    )
+    assert sync_all(manager, token, limit=2) == ([], token)
+
+    manager.edit_task(first, status="done")
+    manager.delete_task(second)
+    # Task count bookkeeping does not report the project as changed
+    manager.create_task(other.id, "d", "")
+    manager.delete_project(other.id)
+
+    items, token = sync_all(manager, token, limit=1)
+    assert sorted(items) == sorted(
+        [("task", first), ("task.deleted", second), ("project.deleted", other.id)]
+    )
+    # Every row was numbered at commit
+    for model in (Project, Task, Tombstone):
+        assert PENDING_CHANGE not in db.scalars(select(model.change_seq)).all()
+
+
+def test_unchanged_upsert_is_not_a_change(manager) -> None:
+    project_id = manager.upsert_project("p", "d")[0].id
+    token = manager.sync_changes().next_token
+
+    manager.upsert_project("p", "d")
+    assert manager.sync_changes(token).next_token == token
+    manager.upsert_project("p", "new")
+    assert [p.id for p in manager.sync_changes(token).projects] == [project_id]
+
+def test_first_sync_leaves_out_earlier_deletes(manager) -> None:
+    project_id = manager.create_project("p", "").id
+    kept = manager.create_task(project_id, "kept", "").id
+    gone = manager.create_task(project_id, "gone", "").id
+    manager.delete_tasks(TaskFilter(ids=[gone]))
+
+    changes = manager.sync_changes()
+
+    assert [task.id for task in changes.tasks] == [kept]
+    assert changes.deleted == []
+
+
+def test_writes_of_one_transaction_commit_together(manager) -> None:
+    project_id = manager.create_project("p", "").id
+    token = manager.sync_changes().next_token
+
+    with manager.transaction():
+        task_id = manager.create_task(project_id, "t", "").id
+        manager.edit_project(project_id, description="new")
+        # Not numbered yet, so not visible to a sync
+        assert manager.sync_changes(token).tasks == []
+
+    changes = manager.sync_changes(token)
+    assert [task.id for task in changes.tasks] == [task_id]
+    assert [project.id for project in changes.projects] == [project_id]
+
+
+def test_invalid_token_is_rejected(manager) -> None:
+    with pytest.raises(ValueError, match="Invalid sync token"):
+        manager.sync_changes("not-a-token")
@@ -0,0 +1,46 @@
+# tests/test_task_import.py
+import io
+import json
+
+from core.models.task import Task
+from core.services.task_import import UnreadableRecord, batched, read_task_records
+
+
+def _ndjson(*lines: str) -> io.StringIO:
+    return io.StringIO("\n".join(lines) + "\n")
+
+
+def test_malformed_ndjson_line_is_reported_not_raised() -> None:
+    fp = _ndjson('{"title": "a"}', "{bad json", "", '{"title": "b"}')
+
+    records = list(read_task_records(fp, "ndjson"))
+
+    assert len(records) == 3
+    assert isinstance(records[1], UnreadableRecord)
+    assert records[1].message.startswith("Invalid JSON")
+    assert records[2] == {"title": "b"}
+
+
+def test_import_loads_valid_records_around_a_malformed_line(manager, config) -> None:
+    config.MAX_TASKS_PER_PROJECT = 10
+    project_id = manager.create_project("p", "").id
+    fp = _ndjson(
+        json.dumps({"project_id": project_id, "title": "first"}),
+        "{bad json",
+        json.dumps({"project_id": project_id, "title": "third"}),
+        json.dumps({"title": "no project"}),
+    )
+
+    errors = []
+    read = 0
+    for batch in batched(read_task_records(fp, "ndjson"), 2):
+        result = manager.import_tasks(batch, start=read + 1)
+        read += len(batch)
+        errors.extend(result.errors)
+
+    titles = sorted(title for (title,) in manager.db.query(Task.title))
+    assert titles == ["first", "third"]
+    assert [(e.index, e.message.split(":")[0]) for e in errors] == [
+        (2, "Invalid JSON"),
+        (4, "project_id is required"),
+    ]
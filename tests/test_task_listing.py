@@ -0,0 +1,102 @@
+# tests/test_task_listing.py
+"""Filtering, keyword search and sorting of the paginated task listing."""
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+import pytest
+
+from core.repositories.task_filter import TaskFilter
+from core.services.todo_manager import TodoManager
+
+NOW = datetime(2026, 1, 1, 12, 0)
+
+
+@pytest.fixture
+def project_id(manager: TodoManager, config) -> str:
+    config.MAX_TASKS_PER_PROJECT = 100
+    return manager.create_project("p", "").id
+
+
+def titles(
+    manager: TodoManager,
+    task_filter: Optional[TaskFilter] = None,
+    sort: Optional[str] = None,
+    limit: int = 2,
+) -> List[str]:
+    """Titles of every matching task, read page by page."""
+    result: List[str] = []
+    cursor = None
+    while True:
+        page = manager.list_tasks_page(
+            limit=limit, cursor=cursor, task_filter=task_filter, sort=sort
+        )
+        result += [task.title for task in page.items]
+        cursor = page.next_cursor
+        if cursor is None:
+            return result
+
+
+def test_filters_combine(manager, project_id) -> None:
+    manager.create_task(project_id, "soon", "", deadline=NOW + timedelta(days=1))
+    manager.create_task(project_id, "later", "", deadline=NOW + timedelta(days=9))
+    manager.create_task(project_id, "done", "", status="done", deadline=NOW)
+
+    task_filter = TaskFilter(status="todo", deadline_before=NOW + timedelta(days=5))
+
+    assert titles(manager, task_filter) == ["soon"]
+
+
+def test_created_bounds_are_half_open(manager, project_id) -> None:
+    tasks = [manager.create_task(project_id, f"t{i}", "") for i in range(3)]
+    middle = tasks[1].created_at
+
+    assert titles(manager, TaskFilter(created_after=middle), sort="title") == ["t1", "t2"]
+    assert titles(manager, TaskFilter(created_before=middle)) == ["t0"]
+
+
+def test_keyword_search_needs_every_word(manager, project_id) -> None:
+    manager.create_task(project_id, "Quarterly report", "")
+    manager.create_task(project_id, "Report", "for the quarterly review")
+    manager.create_task(project_id, "Report draft", "")
+    manager.create_task(project_id, "100%_done", "")
+
+    assert titles(manager, TaskFilter(q="quarterly REPORT"), sort="title") == [
+        "Quarterly report",
+        "Report",
+    ]
+    # LIKE wildcards in q are matched literally
+    assert titles(manager, TaskFilter(q="%_")) == ["100%_done"]
+    assert TaskFilter(q="   ").is_empty()
+
+
+@pytest.mark.parametrize(
+    "sort, expected",
+    [
+        ("deadline", ["d1", "d2", "d3"]),
+        ("-deadline", ["d3", "d2", "d1"]),
+        ("title", ["d1", "d2", "d3", "none1", "none2"]),
+        ("-created_at", ["none2", "none1", "d3", "d2", "d1"]),
+    ],
+)
+def test_sorted_pages_cover_every_task_once(manager, project_id, sort, expected) -> None:
+    for i in (1, 2, 3):
+        manager.create_task(project_id, f"d{i}", "", deadline=NOW + timedelta(days=i))
+    manager.create_task(project_id, "none1", "")
+    manager.create_task(project_id, "none2", "")
+
+    result = titles(manager, sort=sort)
+
+    # Tasks without a deadline come last, in id order
+    assert result[: len(expected)] == expected
+    assert sorted(result) == ["d1", "d2", "d3", "none1", "none2"]
+
+
+def test_invalid_sort_and_foreign_cursor_are_rejected(manager, project_id) -> None:
+    for i in range(3):
+        manager.create_task(project_id, f"t{i}", "")
+    cursor = manager.list_tasks_page(limit=1, sort="title").next_cursor
+
+    with pytest.raises(ValueError, match="Invalid sort"):
+        manager.list_tasks_page(sort="status")
+    with pytest.raises(ValueError, match="different sort order"):
+        manager.list_tasks_page(cursor=cursor, sort="-deadline")
@@ -0,0 +1,99 @@
+# tests/test_unit_of_work.py
+from typing import List
+
+import pytest
+from sqlalchemy import event, func, select
+
+from core.database import engine
+from core.models import Project, Task
+from core.repositories.unit_of_work import after_commit, before_commit
+
+
+@pytest.fixture
+def statements() -> List[str]:
+    """First keyword of every statement (and COMMIT) sent to the engine."""
+    seen: List[str] = []
+
+    def on_execute(conn, cursor, statement, *args):
+        seen.append(statement.split(None, 1)[0].upper())
+
+    def on_commit(conn):
+        seen.append("COMMIT")
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    event.listen(engine, "commit", on_commit)
+    yield seen
+    event.remove(engine, "before_cursor_execute", on_execute)
+    event.remove(engine, "commit", on_commit)
+
+
+def project_names(manager) -> List[str]:
+    return sorted(manager.db.scalars(select(Project.name)))
+
+
+def test_create_does_not_reload_the_row_after_commit(manager, statements) -> None:
+    project = manager.create_project("p", "")
+    task = manager.create_task(project.id, "t", "")
+    statements.clear()
+
+    assert (project.name, task.title, task.status) == ("p", "t", "todo")
+    assert task.created_at is not None
+    assert statements == []
+
+
+def test_transaction_commits_once(manager, statements) -> None:
+    with manager.transaction():
+        project = manager.create_project("p", "")
+        manager.create_task(project.id, "a", "")
+        manager.create_task(project.id, "b", "")
+
+    assert statements.count("COMMIT") == 1
+    assert manager.db.scalar(select(func.count()).select_from(Task)) == 2
+
+
+def test_error_escaping_the_block_rolls_everything_back(manager) -> None:
+    with pytest.raises(RuntimeError):
+        with manager.transaction():
+            manager.create_project("p", "")
+            raise RuntimeError("boom")
+
+    assert project_names(manager) == []
+    manager.create_project("q", "")
+    assert project_names(manager) == ["q"]
+
+
+def test_caught_error_undoes_only_the_failing_call(manager) -> None:
+    with manager.transaction():
+        manager.create_project("B", "")
+        with pytest.raises(ValueError, match="already exists"):
+            manager.create_project("B", "")
+        manager.create_project("C", "")
+
+    assert project_names(manager) == ["B", "C"]
+    # The slot reserved by the failed create was given back with it
+    assert manager.reconcile_counters()["project_count_drift"] == 0
+
+
+def test_nested_transaction_failure_keeps_the_outer_work(manager) -> None:
+    with manager.transaction():
+        manager.create_project("outer", "")
+        with pytest.raises(RuntimeError):
+            with manager.transaction():
+                manager.create_project("inner", "")
+                raise RuntimeError("boom")
+
+    assert project_names(manager) == ["outer"]
+
+
+def test_commit_callbacks_of_a_failed_block_are_dropped(manager) -> None:
+    ran: List[str] = []
+    with manager.transaction():
+        before_commit(manager.db, lambda: ran.append("before outer"))
+        with pytest.raises(RuntimeError):
+            with manager.transaction():
+                after_commit(manager.db, lambda: ran.append("after inner"))
+                raise RuntimeError("boom")
+        after_commit(manager.db, lambda: ran.append("after outer"))
+        assert ran == []
+
+    assert ran == ["before outer", "after outer"]